@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     # AI Services
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    GEMINI_MAX_CONCURRENCY: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "10"))  # in-flight requests per process
 
     # Cloudinary (File Storage)
     CLOUDINARY_CLOUD_NAME: str = os.getenv("CLOUDINARY_CLOUD_NAME", "")
@@ -36,6 +37,7 @@ class Settings(BaseSettings):
     PINECONE_API_KEY: str = os.getenv("PINECONE_API_KEY", "")
     PINECONE_ENVIRONMENT: str = os.getenv("PINECONE_ENVIRONMENT", "")
     PINECONE_INDEX_NAME: str = os.getenv("PINECONE_INDEX_NAME", "ai-job-agent")
+    VECTOR_CACHE_INT8: bool = os.getenv("VECTOR_CACHE_INT8", "true").lower() == "true"  # quantize cached job vectors
     
     # CORS
     BACKEND_CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8501"
@@ -54,6 +56,7 @@ class Settings(BaseSettings):
     # Job search settings
     MAX_JOBS_PER_SEARCH: int = 100
     APPLICATION_RATE_LIMIT: int = 10  # applications per hour
+    WEBDRIVER_POOL_SIZE: int = int(os.getenv("WEBDRIVER_POOL_SIZE", "0"))  # browsers warmed at startup, 0 disables
     
     # Logging settings
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -4,10 +4,14 @@ Comprehensive logging and monitoring system for the AI Job Agent.
 This module provides structured logging, activity tracking, error monitoring,
 and log storage/retrieval capabilities.
 """
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import sys
+import threading
 import traceback
 from datetime import datetime, timezone
 from enum import Enum
@@ -75,41 +79,9 @@ class StructuredLogger:
             log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
             self.logger.setLevel(log_level)
             
-            # Create console handler
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(logging.INFO)
-            
-            # Create file handler for all logs
-            log_dir = Path("logs")
-            log_dir.mkdir(exist_ok=True)
-            
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_dir / "ai_job_agent.log",
-                maxBytes=10 * 1024 * 1024,  # 10MB
-                backupCount=5
-            )
-            file_handler.setLevel(logging.DEBUG)
-            
-            # Create error file handler
-            error_handler = logging.handlers.RotatingFileHandler(
-                log_dir / "errors.log",
-                maxBytes=10 * 1024 * 1024,  # 10MB
-                backupCount=5
-            )
-            error_handler.setLevel(logging.ERROR)
-            
-            # Create JSON formatter
-            json_formatter = JsonFormatter()
-            
-            # Set formatters
-            console_handler.setFormatter(json_formatter)
-            file_handler.setFormatter(json_formatter)
-            error_handler.setFormatter(json_formatter)
-            
-            # Add handlers
-            self.logger.addHandler(console_handler)
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(error_handler)
+            # Console and file writes happen on the shared queue listener's
+            # thread so logging never blocks the caller on I/O
+            self.logger.addHandler(_get_queue_handler())
             
             # Add database handler if enabled
             if settings.LOG_TO_DATABASE:
@@ -326,6 +298,103 @@ class StructuredLogger:
         )
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that hands records to the listener thread unformatted.
+    
+    Records never leave the process, so unlike the stock QueueHandler the
+    exception info is kept and formatting is left to the target handlers.
+    Once the listener is stopped, records are written to those handlers
+    directly in the logging thread.
+    """
+    
+    direct_handlers: Optional[List[logging.Handler]] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        handlers = self.direct_handlers
+        if handlers is None:
+            super().emit(record)
+            return
+        
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_lock = threading.Lock()
+
+
+def _build_io_handlers() -> List[logging.Handler]:
+    """Create the console and rotating file handlers shared by all loggers."""
+    # Create console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    
+    # Create file handler for all logs
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "ai_job_agent.log",
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5
+    )
+    file_handler.setLevel(logging.DEBUG)
+    
+    # Create error file handler
+    error_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "errors.log",
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5
+    )
+    error_handler.setLevel(logging.ERROR)
+    
+    # Set JSON formatter
+    json_formatter = JsonFormatter()
+    for handler in (console_handler, file_handler, error_handler):
+        handler.setFormatter(json_formatter)
+    
+    return [console_handler, file_handler, error_handler]
+
+
+def _get_queue_handler() -> logging.handlers.QueueHandler:
+    """Return the shared queue handler, starting its listener thread on first use."""
+    global _queue_handler, _queue_listener
+    
+    with _queue_lock:
+        if _queue_handler is None:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _queue_handler = _InProcessQueueHandler(log_queue)
+            _queue_listener = logging.handlers.QueueListener(
+                log_queue, *_build_io_handlers(), respect_handler_level=True
+            )
+            _queue_listener.start()
+            atexit.register(stop_queue_logging)
+        
+        return _queue_handler
+
+
+def stop_queue_logging() -> None:
+    """Flush pending log records and stop the background listener thread."""
+    global _queue_listener
+    
+    with _queue_lock:
+        if _queue_listener is not None:
+            # Switch to direct writes first so records logged while the
+            # listener drains, or after it is gone, are not lost
+            _queue_handler.direct_handlers = list(_queue_listener.handlers)
+            _queue_listener.stop()
+            _queue_listener = None
+
+
 class JsonFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
@@ -1,17 +1,20 @@
 """
 FastAPI main application entry point for AI Job Agent
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.logging import stop_queue_logging
 from app.core.middleware import SecurityHeadersMiddleware, RateLimitMiddleware
 from app.api.v1.api import api_router
 from app.db.database import init_database, close_database
 from app.services.redis_service import redis_service
 from app.services.ai_service import ai_service
 from app.services.cloudinary_service import cloudinary_service
+from app.services.job_application_service import job_application_service
 
 
 @asynccontextmanager
@@ -32,6 +35,16 @@ async def lifespan(app: FastAPI):
         # Initialize Cloudinary service
         await cloudinary_service.initialize()
 
+        # Warm browsers for job applications without delaying startup
+        if settings.WEBDRIVER_POOL_SIZE > 0:
+            app.state.webdriver_warmup = asyncio.create_task(
+                job_application_service.warm_pool(settings.WEBDRIVER_POOL_SIZE)
+            )
+            # warm_pool logs its own failures
+            app.state.webdriver_warmup.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+
         print("Application startup completed")
     except Exception as e:
         print(f"Startup failed: {e}")
@@ -43,9 +56,17 @@ async def lifespan(app: FastAPI):
     try:
         await close_database()
         await redis_service.disconnect()
+        warmup = getattr(app.state, "webdriver_warmup", None)
+        if warmup and not warmup.done():
+            warmup.cancel()
+            # Wait for launches already in flight so their browsers get quit below
+            await asyncio.gather(warmup, return_exceptions=True)
+        await job_application_service.cleanup_driver_pool()
         print("Application shutdown completed")
     except Exception as e:
         print(f"Shutdown error: {e}")
+    finally:
+        stop_queue_logging()
 
 
 app = FastAPI(
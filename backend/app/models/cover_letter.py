@@ -55,6 +55,30 @@ class CoverLetterContent(BaseModel):
     tone_used: CoverLetterTone
 
 
+class CoverLetterDraft(BaseModel):
+    """Cover letter sections as returned by the generation model"""
+    header: str = ""
+    opening_paragraph: str = ""
+    body_paragraphs: List[str] = Field(default_factory=list)
+    closing_paragraph: str = ""
+    signature: str = ""
+    full_content: str = ""
+
+
+class CoverLetterValidationDraft(BaseModel):
+    """Cover letter assessment as returned by the validation model"""
+    is_valid: bool = True
+    tone_score: float = Field(default=0.8, ge=0.0, le=1.0)
+    grammar_score: float = Field(default=0.8, ge=0.0, le=1.0)
+    personalization_score: float = Field(default=0.7, ge=0.0, le=1.0)
+    relevance_score: float = Field(default=0.7, ge=0.0, le=1.0)
+    overall_score: float = Field(default=0.75, ge=0.0, le=1.0)
+    issues: List[str] = Field(default_factory=list)
+    suggestions: List[str] = Field(default_factory=list)
+    word_count: Optional[int] = None
+    estimated_reading_time: Optional[int] = None
+
+
 class CoverLetterValidation(BaseModel):
     """Cover letter validation results"""
     is_valid: bool
@@ -67,6 +91,20 @@ class CoverLetterValidation(BaseModel):
     suggestions: List[str] = Field(default_factory=list, description="Improvement suggestions")
     word_count: int
     estimated_reading_time: int = Field(description="Estimated reading time in seconds")
+    partial: bool = Field(default=False, description="Whether this is an unfinished streamed validation")
+
+
+class CoverLetterValidationProgress(BaseModel):
+    """Scores streamed so far by an unfinished validation; fields not yet received are None"""
+    partial: bool = True
+    is_valid: Optional[bool] = None
+    tone_score: Optional[float] = None
+    grammar_score: Optional[float] = None
+    personalization_score: Optional[float] = None
+    relevance_score: Optional[float] = None
+    overall_score: Optional[float] = None
+    word_count: Optional[int] = None
+    estimated_reading_time: Optional[int] = None
 
 
 class CoverLetterGenerationRequest(BaseModel):
@@ -82,6 +120,7 @@ class CoverLetterGenerationRequest(BaseModel):
     personalization_data: Optional[CoverLetterPersonalization] = None
     max_word_count: int = Field(default=300, ge=150, le=500)
     include_salary_expectations: bool = False
+    skip_ai_validation: bool = Field(default=False, description="Use local rule-based validation instead of a second LLM call")
     
     @validator('job_title', 'company_name')
     def validate_required_fields(cls, v):
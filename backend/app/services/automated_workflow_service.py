@@ -8,14 +8,19 @@ This service implements the complete automated job application workflow includin
 - Automated workflow monitoring and error handling
 """
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
+import os
+import random
+from datetime import datetime, time, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from contextlib import asynccontextmanager
 
+import numpy as np
+
 from app.services.job_service import JobService
 from app.services.job_matching_service import JobMatchingService
 from app.services.application_orchestrator import ApplicationOrchestrator, OrchestrationStatus
@@ -84,6 +89,54 @@ class UserWorkflowState:
     next_scheduled_run: Optional[datetime] = None
 
 
+def _to_timestamp(value: Optional[datetime]) -> int:
+    """Epoch seconds for a datetime, or -1 for None"""
+    return int(value.timestamp()) if value else -1
+
+
+class UserStateColumns:
+    """
+    Column-oriented (structure-of-arrays) copy of the UserWorkflowState fields
+    scanned by the periodic sweeps, so each sweep is a vectorized mask over
+    NumPy arrays instead of an attribute lookup per user
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.index: Dict[str, int] = {}
+        self.user_ids: List[str] = []
+        self.daily = np.zeros(capacity, dtype=np.int32)
+        self.weekly = np.zeros(capacity, dtype=np.int32)
+        self.last_application_ts = np.full(capacity, -1, dtype=np.int64)
+        self.last_completed_ts = np.full(capacity, -1, dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return len(self.user_ids)
+    
+    def add(self, user_id: str) -> int:
+        """Register a user and return its row index"""
+        if user_id in self.index:
+            return self.index[user_id]
+        
+        idx = len(self.user_ids)
+        if idx == len(self.daily):
+            self._grow()
+        
+        self.index[user_id] = idx
+        self.user_ids.append(user_id)
+        return idx
+    
+    def _grow(self) -> None:
+        capacity = len(self.daily) * 2
+        self.daily = np.concatenate([self.daily, np.zeros_like(self.daily)])
+        self.weekly = np.concatenate([self.weekly, np.zeros_like(self.weekly)])
+        self.last_application_ts = np.concatenate([
+            self.last_application_ts, np.full(capacity // 2, -1, dtype=np.int64)
+        ])
+        self.last_completed_ts = np.concatenate([
+            self.last_completed_ts, np.full(capacity // 2, -1, dtype=np.int64)
+        ])
+
+
 class AutomatedWorkflowService:
     """Service for managing automated job application workflows"""
     
@@ -109,27 +162,61 @@ class AutomatedWorkflowService:
         self.user_states: Dict[str, UserWorkflowState] = {}
         self.active_executions: Dict[str, WorkflowExecution] = {}
         
+        # Running aggregates over user_states, kept in step with every mutation
+        # so statistics don't require a full scan
+        self._active_users = 0
+        self._total_daily_applications = 0
+        self._total_weekly_applications = 0
+        self._rate_limits: Dict[str, datetime] = {}
+        self._rate_limit_heap: List[Tuple[datetime, str]] = []
+        self._columns = UserStateColumns()
+        self._cleanup_backoff = 1.0
+        
         # Configuration
         self.max_concurrent_workflows = 5
         self.workflow_timeout = 3600  # 1 hour
         self.rate_limit_backoff_minutes = 60
         self.max_consecutive_failures = 3
         self.cleanup_interval = 300  # 5 minutes
+        self.max_cleanup_backoff = 300  # 5 minutes
+        self.schedule_jitter = 0.1  # +/-10% of the delay between workflow runs
+        self.worker_count = (os.cpu_count() or 1) * 4
         
-        # Background task management
-        self._background_tasks: set = set()
+        # Background task management: only long-lived service tasks (cleanup and
+        # pool workers) exist, so they are held strongly here for the service's
+        # lifetime rather than tracked in a self-pruning set
+        self._background_tasks: List[asyncio.Task] = []
         self._shutdown_event = asyncio.Event()
+        
+        # Bounded worker pool: workflows are queued here and drained by a fixed
+        # number of long-lived workers instead of one task per workflow.
+        # Items are either a user_id (scheduled run now due) or a WorkflowExecution.
+        self._work_queue: asyncio.Queue = asyncio.Queue()
+        self._scheduled_runs: Dict[str, asyncio.TimerHandle] = {}
     
     async def start_service(self) -> None:
         """Start the automated workflow service"""
         logger.info("Starting automated workflow service")
         
-        # Start background tasks
-        cleanup_task = asyncio.create_task(self._cleanup_task())
-        self._background_tasks.add(cleanup_task)
-        cleanup_task.add_done_callback(self._background_tasks.discard)
+        self._start_workers()
+        
+        logger.info(f"Automated workflow service started with {self.worker_count} workers")
+    
+    def _start_workers(self) -> None:
+        """Start the cleanup task and worker pool unless they are already running"""
+        if self._background_tasks:
+            return
+        
+        self._start_background_task(self._cleanup_task())
         
-        logger.info("Automated workflow service started")
+        for _ in range(self.worker_count):
+            self._start_background_task(self._workflow_worker())
+    
+    def _enqueue(self, item: Any) -> None:
+        """Queue a workflow for the worker pool, starting the pool on first use"""
+        if not self._shutdown_event.is_set():
+            self._start_workers()
+        self._work_queue.put_nowait(item)
     
     async def stop_service(self) -> None:
         """Stop the automated workflow service"""
@@ -138,6 +225,11 @@ class AutomatedWorkflowService:
         # Signal shutdown
         self._shutdown_event.set()
         
+        # Cancel pending scheduled runs
+        for handle in self._scheduled_runs.values():
+            handle.cancel()
+        self._scheduled_runs.clear()
+        
         # Cancel all background tasks
         for task in self._background_tasks:
             task.cancel()
@@ -145,6 +237,7 @@ class AutomatedWorkflowService:
         # Wait for tasks to complete
         if self._background_tasks:
             await asyncio.gather(*self._background_tasks, return_exceptions=True)
+            self._background_tasks.clear()
         
         # Stop all active workflows
         for execution in list(self.active_executions.values()):
@@ -152,6 +245,19 @@ class AutomatedWorkflowService:
         
         logger.info("Automated workflow service stopped")
     
+    def _start_background_task(self, coro) -> asyncio.Task:
+        """Start a long-lived service task and report it if it dies with an error"""
+        task = asyncio.create_task(coro)
+        task.add_done_callback(self._log_task_exception)
+        self._background_tasks.append(task)
+        return task
+    
+    @staticmethod
+    def _log_task_exception(task: asyncio.Task) -> None:
+        """Done-callback that only reads the task's exception for logging"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task {task.get_name()} failed: {str(task.exception())}")
+    
     async def enable_automation_for_user(
         self,
         user_id: str,
@@ -175,26 +281,18 @@ class AutomatedWorkflowService:
                 raise ValueError(f"Invalid automation settings: {validation['errors']}")
             
             # Initialize or update user state
-            if user_id not in self.user_states:
-                self.user_states[user_id] = UserWorkflowState(user_id=user_id)
-            
-            user_state = self.user_states[user_id]
-            user_state.is_active = True
+            user_state = self.user_states.get(user_id) or self._add_user_state(user_id)
+            self._set_user_active(user_state, True)
             user_state.consecutive_failures = 0
             
             # Schedule next run if requested
             if schedule_next_run:
-                next_run = datetime.now() + timedelta(
-                    minutes=preferences.automation_settings.application_delay_minutes
-                )
-                user_state.next_scheduled_run = next_run
-                
-                # Start scheduled workflow task
-                task = asyncio.create_task(
-                    self._scheduled_workflow_task(user_id)
+                self._schedule_run_at(
+                    user_id,
+                    datetime.now() + timedelta(
+                        minutes=preferences.automation_settings.application_delay_minutes
+                    )
                 )
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
             
             # Log automation enabled
             await self.monitoring_service.log_activity(
@@ -228,17 +326,22 @@ class AutomatedWorkflowService:
             
             # Update user state
             if user_id in self.user_states:
-                self.user_states[user_id].is_active = False
+                self._set_user_active(self.user_states[user_id], False)
                 self.user_states[user_id].next_scheduled_run = None
             
+            handle = self._scheduled_runs.pop(user_id, None)
+            if handle:
+                handle.cancel()
+            
             # Stop any active workflow
             await self.stop_workflow(user_id)
             
             # Log automation disabled
+            disabled_at = datetime.now()
             await self.monitoring_service.log_activity(
                 user_id=user_id,
                 activity_type="automation_disabled",
-                details={"disabled_at": datetime.now().isoformat()}
+                details={"disabled_at": disabled_at.isoformat()}
             )
             
             logger.info(f"Automation disabled for user {user_id}")
@@ -246,7 +349,7 @@ class AutomatedWorkflowService:
             return {
                 "status": "disabled",
                 "user_id": user_id,
-                "disabled_at": datetime.now()
+                "disabled_at": disabled_at
             }
             
         except Exception as e:
@@ -274,9 +377,11 @@ class AutomatedWorkflowService:
                 if user_state.current_execution.status not in [WorkflowStatus.ERROR, WorkflowStatus.STOPPED]:
                     raise ValueError("Workflow already running for user")
             
+            now = datetime.now()
+            
             # Check rate limiting
             if not force and user_state:
-                if user_state.rate_limit_until and datetime.now() < user_state.rate_limit_until:
+                if user_state.rate_limit_until and now < user_state.rate_limit_until:
                     raise ValueError(f"Rate limited until {user_state.rate_limit_until}")
             
             # Check concurrent workflow limit
@@ -284,29 +389,26 @@ class AutomatedWorkflowService:
                 raise ValueError("Maximum concurrent workflows reached")
             
             # Create workflow execution
-            execution_id = f"workflow_{user_id}_{datetime.now().timestamp()}"
+            execution_id = f"workflow_{user_id}_{now.timestamp()}"
             execution = WorkflowExecution(
                 id=execution_id,
                 user_id=user_id,
                 trigger=trigger,
                 status=WorkflowStatus.IDLE,
-                started_at=datetime.now()
+                started_at=now
             )
             
             # Update state
             if not user_state:
-                user_state = UserWorkflowState(user_id=user_id)
-                self.user_states[user_id] = user_state
+                user_state = self._add_user_state(user_id)
             
             user_state.current_execution = execution
             self.active_executions[execution_id] = execution
             
-            # Start workflow task
-            task = asyncio.create_task(self._execute_workflow(execution))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+            # Hand the workflow to the worker pool
+            self._enqueue(execution)
             
-            logger.info(f"Workflow {execution_id} started for user {user_id}")
+            logger.info(f"Workflow {execution_id} queued for user {user_id}")
             
             return {
                 "execution_id": execution_id,
@@ -334,7 +436,7 @@ class AutomatedWorkflowService:
             execution.completed_at = datetime.now()
             
             # Move to last execution
-            user_state.last_execution = execution
+            self._set_last_execution(user_state, execution)
             user_state.current_execution = None
             
             # Remove from active executions
@@ -470,7 +572,7 @@ class AutomatedWorkflowService:
             
             # Update user state
             user_state = self.user_states[execution.user_id]
-            user_state.last_execution = execution
+            self._set_last_execution(user_state, execution)
             user_state.current_execution = None
             user_state.consecutive_failures = 0
             
@@ -494,14 +596,15 @@ class AutomatedWorkflowService:
             # Update user state
             user_state = self.user_states.get(execution.user_id)
             if user_state:
-                user_state.last_execution = execution
+                self._set_last_execution(user_state, execution)
                 user_state.current_execution = None
                 user_state.consecutive_failures += 1
                 
                 # Apply rate limiting for consecutive failures
                 if user_state.consecutive_failures >= self.max_consecutive_failures:
-                    user_state.rate_limit_until = datetime.now() + timedelta(
-                        minutes=self.rate_limit_backoff_minutes
+                    self._apply_rate_limit(
+                        user_state,
+                        datetime.now() + timedelta(minutes=self.rate_limit_backoff_minutes)
                     )
                     logger.warning(f"Rate limiting user {execution.user_id} due to consecutive failures")
             
@@ -567,8 +670,8 @@ class AutomatedWorkflowService:
     ) -> List[JobPost]:
         """Match and filter jobs based on user preferences and resume"""
         try:
-            matched_jobs = []
             user_state = self.user_states[execution.user_id]
+            settings = user_preferences.automation_settings
             
             for job in jobs:
                 # Calculate match score
@@ -577,19 +680,25 @@ class AutomatedWorkflowService:
                 )
                 
                 job.match_score = match_result.match_score
-                
-                # Check automation rules
-                automation_decision = self.automation_service.should_apply_to_job(
-                    match_result.match_score,
-                    user_preferences.automation_settings,
-                    user_state.daily_applications,
-                    user_state.weekly_applications
+            
+            # Check automation rules: the per-user gate is constant for the batch,
+            # so only the match score threshold needs evaluating per job
+            gate = self.automation_service.prepare_gate(
+                settings,
+                user_state.daily_applications,
+                user_state.weekly_applications
+            )
+            
+            if gate is not None:
+                logger.debug(f"All {len(jobs)} jobs filtered out: {gate}")
+                matched_jobs = []
+            else:
+                mask = self.automation_service.filter_jobs(
+                    np.fromiter((job.match_score or 0.0 for job in jobs), dtype=np.float64, count=len(jobs)),
+                    settings.min_match_score_threshold
                 )
-                
-                if automation_decision["should_apply"]:
-                    matched_jobs.append(job)
-                else:
-                    logger.debug(f"Job {job.id} filtered out: {automation_decision['reason']}")
+                matched_jobs = [job for job, keep in zip(jobs, mask) if keep]
+                logger.debug(f"{len(jobs) - len(matched_jobs)} jobs filtered out below match threshold")
             
             # Sort by match score
             matched_jobs.sort(key=lambda j: j.match_score or 0, reverse=True)
@@ -667,9 +776,7 @@ class AutomatedWorkflowService:
                     # Update counters based on result
                     if result.status == OrchestrationStatus.COMPLETED:
                         execution.applications_submitted += 1
-                        user_state.daily_applications += 1
-                        user_state.weekly_applications += 1
-                        user_state.last_application_time = datetime.now()
+                        self._record_application(user_state, datetime.now())
                         
                         logger.info(f"Successfully applied to job {job.id}")
                         
@@ -724,37 +831,61 @@ class AutomatedWorkflowService:
     ) -> None:
         """Schedule the next automated workflow run"""
         try:
-            user_state = self.user_states[user_id]
-            
             # Calculate next run time based on automation settings
             delay_minutes = user_preferences.automation_settings.application_delay_minutes
-            next_run = datetime.now() + timedelta(minutes=delay_minutes * 2)  # Double delay between workflow runs
+            # Double delay between workflow runs, jittered so users don't wake in lockstep
+            jitter = 1 + random.uniform(-self.schedule_jitter, self.schedule_jitter)
+            next_run = datetime.now() + timedelta(minutes=delay_minutes * 2 * jitter)
             
-            user_state.next_scheduled_run = next_run
-            
-            # Start scheduled task
-            task = asyncio.create_task(self._scheduled_workflow_task(user_id))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+            self._schedule_run_at(user_id, next_run)
             
             logger.info(f"Next workflow run scheduled for user {user_id} at {next_run}")
             
         except Exception as e:
             logger.error(f"Failed to schedule next run for user {user_id}: {str(e)}")
     
+    def _schedule_run_at(self, user_id: str, run_at: datetime) -> None:
+        """Queue a scheduled workflow for the user once run_at is reached"""
+        self.user_states[user_id].next_scheduled_run = run_at
+        
+        previous = self._scheduled_runs.pop(user_id, None)
+        if previous:
+            previous.cancel()
+        
+        delay_seconds = max(0.0, (run_at - datetime.now()).total_seconds())
+        self._scheduled_runs[user_id] = asyncio.get_running_loop().call_later(
+            delay_seconds, self._enqueue_scheduled_run, user_id
+        )
+    
+    def _enqueue_scheduled_run(self, user_id: str) -> None:
+        """Timer callback: hand a due scheduled run to the worker pool"""
+        self._scheduled_runs.pop(user_id, None)
+        if not self._shutdown_event.is_set():
+            self._enqueue(user_id)
+    
+    async def _workflow_worker(self) -> None:
+        """Long-lived worker draining the workflow queue"""
+        while True:
+            item = await self._work_queue.get()
+            try:
+                if isinstance(item, WorkflowExecution):
+                    await self._execute_workflow(item)
+                else:
+                    await self._scheduled_workflow_task(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Workflow worker error: {str(e)}")
+            finally:
+                self._work_queue.task_done()
+    
     async def _scheduled_workflow_task(self, user_id: str) -> None:
-        """Background task for scheduled workflow execution"""
+        """Start a scheduled workflow whose run time has been reached"""
         try:
             user_state = self.user_states.get(user_id)
             if not user_state or not user_state.next_scheduled_run:
                 return
             
-            # Wait until scheduled time
-            now = datetime.now()
-            if user_state.next_scheduled_run > now:
-                wait_seconds = (user_state.next_scheduled_run - now).total_seconds()
-                await asyncio.sleep(wait_seconds)
-            
             # Check if automation is still active
             if not user_state.is_active:
                 return
@@ -766,19 +897,68 @@ class AutomatedWorkflowService:
             # Start workflow
             await self.start_workflow(user_id, AutomationTrigger.SCHEDULED)
             
-        except asyncio.CancelledError:
-            logger.info(f"Scheduled workflow task cancelled for user {user_id}")
         except Exception as e:
             logger.error(f"Scheduled workflow task failed for user {user_id}: {str(e)}")
     
+    def _add_user_state(self, user_id: str) -> UserWorkflowState:
+        """Create and register the workflow state for a new user"""
+        user_state = UserWorkflowState(user_id=user_id)
+        self.user_states[user_id] = user_state
+        self._columns.add(user_id)
+        return user_state
+    
+    def _set_last_execution(
+        self,
+        user_state: UserWorkflowState,
+        execution: Optional[WorkflowExecution]
+    ) -> None:
+        """Record a user's last execution and mirror its completion time"""
+        user_state.last_execution = execution
+        self._columns.last_completed_ts[self._columns.index[user_state.user_id]] = (
+            _to_timestamp(execution.completed_at) if execution else -1
+        )
+    
+    def _set_user_active(self, user_state: UserWorkflowState, active: bool) -> None:
+        """Toggle a user's automation flag and keep the active-user count in step"""
+        if user_state.is_active != active:
+            self._active_users += 1 if active else -1
+        user_state.is_active = active
+    
+    def _record_application(self, user_state: UserWorkflowState, applied_at: datetime) -> None:
+        """Count a submitted application against the user's and the service's totals"""
+        user_state.daily_applications += 1
+        user_state.weekly_applications += 1
+        user_state.last_application_time = applied_at
+        self._total_daily_applications += 1
+        self._total_weekly_applications += 1
+        
+        idx = self._columns.index[user_state.user_id]
+        self._columns.daily[idx] += 1
+        self._columns.weekly[idx] += 1
+        self._columns.last_application_ts[idx] = _to_timestamp(applied_at)
+    
+    def _apply_rate_limit(self, user_state: UserWorkflowState, until: datetime) -> None:
+        """Rate limit a user until the given time"""
+        user_state.rate_limit_until = until
+        self._rate_limits[user_state.user_id] = until
+        heapq.heappush(self._rate_limit_heap, (until, user_state.user_id))
+    
+    def _count_rate_limited_users(self, now: datetime) -> int:
+        """Drop expired rate limits (earliest first) and count the users still limited"""
+        heap = self._rate_limit_heap
+        while heap and heap[0][0] <= now:
+            until, user_id = heapq.heappop(heap)
+            if self._rate_limits.get(user_id) == until:
+                del self._rate_limits[user_id]
+        return len(self._rate_limits)
+    
     async def _cleanup_task(self) -> None:
         """Background task for cleaning up old workflow data"""
         try:
             while not self._shutdown_event.is_set():
                 try:
-                    await self._cleanup_old_executions()
-                    await self._reset_daily_counters()
-                    await self._reset_weekly_counters()
+                    await self._sweep_user_states()
+                    self._cleanup_backoff = 1.0
                     
                     # Wait for next cleanup cycle
                     await asyncio.sleep(self.cleanup_interval)
@@ -787,89 +967,86 @@ class AutomatedWorkflowService:
                     break
                 except Exception as e:
                     logger.error(f"Cleanup task error: {str(e)}")
-                    await asyncio.sleep(60)  # Wait before retrying
+                    # Capped exponential backoff with jitter before retrying
+                    await asyncio.sleep(
+                        min(self.max_cleanup_backoff, self._cleanup_backoff) * (0.5 + random.random())
+                    )
+                    self._cleanup_backoff *= 2
                     
         except asyncio.CancelledError:
             logger.info("Cleanup task cancelled")
     
-    async def _cleanup_old_executions(self) -> None:
-        """Clean up old workflow executions"""
-        try:
-            cutoff_time = datetime.now() - timedelta(hours=24)
-            
-            # Clean up completed executions older than 24 hours
-            for user_id, user_state in self.user_states.items():
-                if (user_state.last_execution and 
-                    user_state.last_execution.completed_at and
-                    user_state.last_execution.completed_at < cutoff_time):
-                    
-                    logger.debug(f"Cleaning up old execution for user {user_id}")
-                    user_state.last_execution = None
-            
-        except Exception as e:
-            logger.error(f"Failed to cleanup old executions: {str(e)}")
-    
-    async def _reset_daily_counters(self) -> None:
-        """Reset daily application counters at midnight"""
-        try:
-            now = datetime.now()
-            
-            for user_id, user_state in self.user_states.items():
-                if (user_state.last_application_time and
-                    user_state.last_application_time.date() < now.date()):
-                    
-                    logger.debug(f"Resetting daily counter for user {user_id}")
-                    user_state.daily_applications = 0
-            
-        except Exception as e:
-            logger.error(f"Failed to reset daily counters: {str(e)}")
-    
-    async def _reset_weekly_counters(self) -> None:
-        """Reset weekly application counters on Monday"""
-        try:
-            now = datetime.now()
-            
-            # Check if it's Monday (weekday 0)
-            if now.weekday() != 0:
-                return
-            
-            for user_id, user_state in self.user_states.items():
-                if (user_state.last_application_time and
-                    (now - user_state.last_application_time).days >= 7):
-                    
-                    logger.debug(f"Resetting weekly counter for user {user_id}")
-                    user_state.weekly_applications = 0
+    async def _sweep_user_states(self) -> None:
+        """
+        Single pass over the user state columns that cleans up old executions
+        and resets daily (after midnight) and weekly (on Monday) counters
+        
+        Errors propagate so _cleanup_task can log them and back off.
+        """
+        now = datetime.now()
+        cutoff_ts = _to_timestamp(now - timedelta(hours=24))
+        today_start_ts = _to_timestamp(datetime.combine(now.date(), time.min))
+        week_cutoff_ts = _to_timestamp(now - timedelta(days=7))
+        
+        # Snapshot the row count so users added mid-sweep are left for the next one
+        columns = self._columns
+        n = len(columns)
+        daily = columns.daily[:n]
+        weekly = columns.weekly[:n]
+        last_ts = columns.last_application_ts[:n]
+        completed_ts = columns.last_completed_ts[:n]
+        applied = last_ts >= 0
+        
+        # Clean up completed executions older than 24 hours
+        stale = (completed_ts >= 0) & (completed_ts < cutoff_ts)
+        reset_daily = (daily > 0) & applied & (last_ts < today_start_ts)
+        # Weekly counters are only reset on Monday (weekday 0)
+        if now.weekday() == 0:
+            reset_weekly = (weekly > 0) & applied & (last_ts <= week_cutoff_ts)
+        else:
+            reset_weekly = np.zeros(n, dtype=bool)
+        
+        for i, idx in enumerate(np.flatnonzero(stale | reset_daily | reset_weekly)):
+            # Let other coroutines run on large sweeps. Columns may change
+            # (or be reallocated) while suspended, so each update below
+            # re-reads them and re-checks its condition.
+            if i and i % 1024 == 0:
+                await asyncio.sleep(0)
+            
+            user_id = columns.user_ids[idx]
+            user_state = self.user_states[user_id]
             
-        except Exception as e:
-            logger.error(f"Failed to reset weekly counters: {str(e)}")
+            if stale[idx] and 0 <= columns.last_completed_ts[idx] < cutoff_ts:
+                logger.debug(f"Cleaning up old execution for user {user_id}")
+                self._set_last_execution(user_state, None)
+            
+            if reset_daily[idx] and columns.last_application_ts[idx] < today_start_ts:
+                logger.debug(f"Resetting daily counter for user {user_id}")
+                self._total_daily_applications -= int(columns.daily[idx])
+                columns.daily[idx] = 0
+                user_state.daily_applications = 0
+            
+            if reset_weekly[idx] and columns.last_application_ts[idx] <= week_cutoff_ts:
+                logger.debug(f"Resetting weekly counter for user {user_id}")
+                self._total_weekly_applications -= int(columns.weekly[idx])
+                columns.weekly[idx] = 0
+                user_state.weekly_applications = 0
     
     async def get_automation_statistics(self) -> Dict[str, Any]:
         """Get overall automation statistics"""
         try:
-            active_users = sum(1 for state in self.user_states.values() if state.is_active)
-            running_workflows = len(self.active_executions)
-            
-            total_applications_today = sum(
-                state.daily_applications for state in self.user_states.values()
-            )
-            
-            total_applications_week = sum(
-                state.weekly_applications for state in self.user_states.values()
-            )
-            
-            rate_limited_users = sum(
-                1 for state in self.user_states.values() 
-                if state.rate_limit_until and state.rate_limit_until > datetime.now()
-            )
+            now = datetime.now()
             
             return {
-                "active_users": active_users,
-                "running_workflows": running_workflows,
-                "total_applications_today": total_applications_today,
-                "total_applications_week": total_applications_week,
-                "rate_limited_users": rate_limited_users,
-                "background_tasks": len(self._background_tasks),
-                "service_uptime": datetime.now().isoformat()
+                "active_users": self._active_users,
+                "running_workflows": len(self.active_executions),
+                "total_applications_today": self._total_daily_applications,
+                "total_applications_week": self._total_weekly_applications,
+                "rate_limited_users": self._count_rate_limited_users(now),
+                "background_tasks": sum(1 for task in self._background_tasks if not task.done()),
+                "queued_workflows": self._work_queue.qsize(),
+                "scheduled_runs": len(self._scheduled_runs),
+                "service_uptime": now.isoformat()
             }
             
         except Exception as e:
@@ -1,11 +1,195 @@
 """
 Service for managing automation settings and rules
 """
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
+
+import numpy as np
+
 from app.models.preferences import AutomationSettings, UserPreferencesData
 
 
+@dataclass(frozen=True)
+class ScheduleConstants:
+    """Quantities derived from automation settings that do not depend on time"""
+    application_delta: timedelta
+    daily_limit_delta: timedelta
+    weekly_limit_delta: timedelta
+    applications_per_hour: float
+    estimated_daily_applications: int
+
+
+@lru_cache(maxsize=1024)
+def get_schedule_constants(delay_minutes: int, max_per_day: int, max_per_week: int) -> ScheduleConstants:
+    """Compute (once per distinct settings shape) the derived scheduling quantities"""
+    return ScheduleConstants(
+        application_delta=timedelta(minutes=delay_minutes),
+        daily_limit_delta=timedelta(minutes=delay_minutes * max_per_day),
+        weekly_limit_delta=timedelta(minutes=delay_minutes * max_per_week),
+        applications_per_hour=60 / delay_minutes if delay_minutes > 0 else 0,
+        estimated_daily_applications=min(
+            max_per_day,
+            int(24 * 60 / delay_minutes)
+        ) if delay_minutes > 0 else 0
+    )
+
+
+@lru_cache(maxsize=128)
+def compile_schedule(
+    delay_minutes: int,
+    max_per_day: int,
+    max_per_week: int
+) -> Callable[[datetime], Dict[str, Any]]:
+    """
+    Build a schedule function specialised for one settings shape.
+    
+    Everything except the start time is bound once, so calling the returned
+    function only performs the three datetime additions.
+    """
+    constants = get_schedule_constants(delay_minutes, max_per_day, max_per_week)
+    application_delta = constants.application_delta
+    daily_limit_delta = constants.daily_limit_delta
+    weekly_limit_delta = constants.weekly_limit_delta
+    applications_per_hour = constants.applications_per_hour
+    estimated_daily_applications = constants.estimated_daily_applications
+    
+    def schedule(start_time: datetime) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "next_application_time": start_time + application_delta,
+            "daily_limit_reached_time": start_time + daily_limit_delta,
+            "weekly_limit_reached_time": start_time + weekly_limit_delta,
+            "applications_per_hour": applications_per_hour,
+            "estimated_daily_applications": estimated_daily_applications
+        }
+    
+    return schedule
+
+
+# Settings validation, summaries and recommendations are pure functions of a
+# handful of scalar settings, so they are memoized on that fingerprint and the
+# public methods only copy the cached results into fresh containers.
+
+@lru_cache(maxsize=2048)
+def _validate_rules(
+    enabled: bool,
+    max_per_day: int,
+    require_approval: bool,
+    threshold: float,
+    delay_minutes: int
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Return (warnings, errors, recommendations) for the given settings"""
+    warnings = []
+    errors = []
+    recommendations = []
+    
+    # Check for potential issues
+    if max_per_day > 20:
+        warnings.append("High daily application limit may appear spammy to employers")
+    
+    if threshold < 0.5:
+        warnings.append("Low match score threshold may result in poor job matches")
+    
+    if delay_minutes < 15:
+        warnings.append("Short application delay may trigger rate limiting")
+    
+    if not require_approval and max_per_day > 10:
+        recommendations.append(
+            "Consider enabling manual approval for high-volume automated applications"
+        )
+    
+    # Check for configuration conflicts
+    if enabled and max_per_day == 0:
+        errors.append("Automation is enabled but daily limit is set to 0")
+    
+    return tuple(warnings), tuple(errors), tuple(recommendations)
+
+
+class PreferencesKey(NamedTuple):
+    """Hashable fingerprint of everything the summary and recommendations depend on"""
+    enabled: bool
+    max_per_day: int
+    max_per_week: int
+    require_approval: bool
+    threshold: float
+    delay_minutes: int
+    job_titles: int
+    locations: int
+    preferred_companies: int
+    excluded_companies: int
+    salary_range_set: bool
+    remote_work_preference: bool
+
+
+def _preferences_key(preferences: UserPreferencesData) -> PreferencesKey:
+    settings = preferences.automation_settings
+    return PreferencesKey(
+        enabled=settings.enabled,
+        max_per_day=settings.max_applications_per_day,
+        max_per_week=settings.max_applications_per_week,
+        require_approval=settings.require_manual_approval,
+        threshold=settings.min_match_score_threshold,
+        delay_minutes=settings.application_delay_minutes,
+        job_titles=len(preferences.job_titles),
+        locations=len(preferences.locations),
+        preferred_companies=len(preferences.preferred_companies),
+        excluded_companies=len(preferences.excluded_companies),
+        salary_range_set=preferences.salary_range is not None,
+        remote_work_preference=preferences.remote_work_preference
+    )
+
+
+@lru_cache(maxsize=2048)
+def _automation_summary(key: PreferencesKey) -> Dict[str, Any]:
+    return {
+        "automation_enabled": key.enabled,
+        "daily_limit": key.max_per_day,
+        "weekly_limit": key.max_per_week,
+        "manual_approval_required": key.require_approval,
+        "match_score_threshold": key.threshold,
+        "delay_between_applications": f"{key.delay_minutes} minutes",
+        "estimated_applications_per_hour": get_schedule_constants(
+            key.delay_minutes, key.max_per_day, key.max_per_week
+        ).applications_per_hour,
+        "job_criteria": {
+            "job_titles": key.job_titles,
+            "locations": key.locations,
+            "preferred_companies": key.preferred_companies,
+            "excluded_companies": key.excluded_companies,
+            "salary_range_set": key.salary_range_set
+        }
+    }
+
+
+# (predicate, recommendation) pairs, evaluated in order
+_RECOMMENDATION_RULES = (
+    # Overly aggressive settings
+    (lambda k: k.max_per_day > 15,
+     "Consider reducing daily application limit to avoid appearing spammy"),
+    # Overly restrictive settings
+    (lambda k: k.threshold > 0.9,
+     "Very high match score threshold may result in missing good opportunities"),
+    # Insufficient job criteria
+    (lambda k: k.job_titles < 3,
+     "Add more job titles to increase the pool of potential matches"),
+    (lambda k: not k.locations and not k.remote_work_preference,
+     "Specify preferred locations or enable remote work preference"),
+    # Automation without approval
+    (lambda k: k.enabled and not k.require_approval and k.max_per_day > 5,
+     "Consider enabling manual approval for quality control with high-volume automation"),
+    # Delay settings
+    (lambda k: k.delay_minutes < 30,
+     "Increase application delay to reduce risk of rate limiting"),
+)
+
+
+@lru_cache(maxsize=2048)
+def _automation_recommendations(key: PreferencesKey) -> Tuple[str, ...]:
+    return tuple(message for predicate, message in _RECOMMENDATION_RULES if predicate(key))
+
+
 class AutomationService:
     """Service for handling automation logic and rules"""
     
@@ -24,42 +208,20 @@ class AutomationService:
     @staticmethod
     def validate_automation_rules(settings: AutomationSettings) -> Dict[str, Any]:
         """Validate automation settings and return validation results"""
-        validation_results = {
-            "is_valid": True,
-            "warnings": [],
-            "errors": [],
-            "recommendations": []
-        }
-        
-        # Check for potential issues
-        if settings.max_applications_per_day > 20:
-            validation_results["warnings"].append(
-                "High daily application limit may appear spammy to employers"
-            )
-        
-        if settings.min_match_score_threshold < 0.5:
-            validation_results["warnings"].append(
-                "Low match score threshold may result in poor job matches"
-            )
-        
-        if settings.application_delay_minutes < 15:
-            validation_results["warnings"].append(
-                "Short application delay may trigger rate limiting"
-            )
-        
-        if not settings.require_manual_approval and settings.max_applications_per_day > 10:
-            validation_results["recommendations"].append(
-                "Consider enabling manual approval for high-volume automated applications"
-            )
-        
-        # Check for configuration conflicts
-        if settings.enabled and settings.max_applications_per_day == 0:
-            validation_results["errors"].append(
-                "Automation is enabled but daily limit is set to 0"
-            )
-            validation_results["is_valid"] = False
+        warnings, errors, recommendations = _validate_rules(
+            settings.enabled,
+            settings.max_applications_per_day,
+            settings.require_manual_approval,
+            settings.min_match_score_threshold,
+            settings.application_delay_minutes
+        )
         
-        return validation_results
+        return {
+            "is_valid": not errors,
+            "warnings": list(warnings),
+            "errors": list(errors),
+            "recommendations": list(recommendations)
+        }
     
     @staticmethod
     def calculate_application_schedule(settings: AutomationSettings, start_time: datetime) -> Dict[str, Any]:
@@ -67,29 +229,34 @@ class AutomationService:
         if not settings.enabled:
             return {"enabled": False, "next_application_time": None}
         
-        # Calculate next application time based on delay
-        next_application_time = start_time + timedelta(minutes=settings.application_delay_minutes)
+        return compile_schedule(
+            settings.application_delay_minutes,
+            settings.max_applications_per_day,
+            settings.max_applications_per_week
+        )(start_time)
+    
+    @staticmethod
+    def prepare_gate(
+        settings: AutomationSettings,
+        daily_applications_count: int,
+        weekly_applications_count: int
+    ) -> Optional[str]:
+        """Return the reason every job must be rejected for this user, or None if jobs may pass"""
+        if not settings.enabled:
+            return "Automation is disabled"
         
-        # Calculate daily and weekly limits
-        daily_limit_reached_time = start_time + timedelta(
-            minutes=settings.application_delay_minutes * settings.max_applications_per_day
-        )
+        if daily_applications_count >= settings.max_applications_per_day:
+            return "Daily application limit reached"
         
-        weekly_limit_reached_time = start_time + timedelta(
-            minutes=settings.application_delay_minutes * settings.max_applications_per_week
-        )
+        if weekly_applications_count >= settings.max_applications_per_week:
+            return "Weekly application limit reached"
         
-        return {
-            "enabled": True,
-            "next_application_time": next_application_time,
-            "daily_limit_reached_time": daily_limit_reached_time,
-            "weekly_limit_reached_time": weekly_limit_reached_time,
-            "applications_per_hour": 60 / settings.application_delay_minutes,
-            "estimated_daily_applications": min(
-                settings.max_applications_per_day,
-                int(24 * 60 / settings.application_delay_minutes)
-            )
-        }
+        return None
+    
+    @staticmethod
+    def filter_jobs(scores: np.ndarray, threshold: float) -> np.ndarray:
+        """Return a boolean mask of the job match scores meeting the threshold"""
+        return np.asarray(scores, dtype=np.float64) >= threshold
     
     @staticmethod
     def should_apply_to_job(
@@ -99,99 +266,27 @@ class AutomationService:
         weekly_applications_count: int
     ) -> Dict[str, Any]:
         """Determine if automation should apply to a specific job"""
-        decision = {
-            "should_apply": False,
-            "reason": "",
-            "requires_approval": settings.require_manual_approval
-        }
-        
-        # Check if automation is enabled
-        if not settings.enabled:
-            decision["reason"] = "Automation is disabled"
-            return decision
-        
-        # Check daily limit
-        if daily_applications_count >= settings.max_applications_per_day:
-            decision["reason"] = "Daily application limit reached"
-            return decision
-        
-        # Check weekly limit
-        if weekly_applications_count >= settings.max_applications_per_week:
-            decision["reason"] = "Weekly application limit reached"
-            return decision
+        reason = AutomationService.prepare_gate(
+            settings, daily_applications_count, weekly_applications_count
+        )
         
         # Check match score threshold
-        if job_match_score < settings.min_match_score_threshold:
-            decision["reason"] = f"Job match score ({job_match_score:.2f}) below threshold ({settings.min_match_score_threshold:.2f})"
-            return decision
-        
-        # All checks passed
-        decision["should_apply"] = True
-        decision["reason"] = "All automation criteria met"
+        if reason is None and job_match_score < settings.min_match_score_threshold:
+            reason = f"Job match score ({job_match_score:.2f}) below threshold ({settings.min_match_score_threshold:.2f})"
         
-        return decision
+        return {
+            "should_apply": reason is None,
+            "reason": reason or "All automation criteria met",
+            "requires_approval": settings.require_manual_approval
+        }
     
     @staticmethod
     def get_automation_summary(preferences: UserPreferencesData) -> Dict[str, Any]:
         """Get a summary of automation configuration"""
-        settings = preferences.automation_settings
-        
-        return {
-            "automation_enabled": settings.enabled,
-            "daily_limit": settings.max_applications_per_day,
-            "weekly_limit": settings.max_applications_per_week,
-            "manual_approval_required": settings.require_manual_approval,
-            "match_score_threshold": settings.min_match_score_threshold,
-            "delay_between_applications": f"{settings.application_delay_minutes} minutes",
-            "estimated_applications_per_hour": 60 / settings.application_delay_minutes if settings.application_delay_minutes > 0 else 0,
-            "job_criteria": {
-                "job_titles": len(preferences.job_titles),
-                "locations": len(preferences.locations),
-                "preferred_companies": len(preferences.preferred_companies),
-                "excluded_companies": len(preferences.excluded_companies),
-                "salary_range_set": preferences.salary_range is not None
-            }
-        }
+        summary = _automation_summary(_preferences_key(preferences))
+        return {**summary, "job_criteria": dict(summary["job_criteria"])}
     
     @staticmethod
     def generate_automation_recommendations(preferences: UserPreferencesData) -> List[str]:
         """Generate recommendations for improving automation settings"""
-        recommendations = []
-        settings = preferences.automation_settings
-        
-        # Check for overly aggressive settings
-        if settings.max_applications_per_day > 15:
-            recommendations.append(
-                "Consider reducing daily application limit to avoid appearing spammy"
-            )
-        
-        # Check for overly restrictive settings
-        if settings.min_match_score_threshold > 0.9:
-            recommendations.append(
-                "Very high match score threshold may result in missing good opportunities"
-            )
-        
-        # Check for insufficient job criteria
-        if len(preferences.job_titles) < 3:
-            recommendations.append(
-                "Add more job titles to increase the pool of potential matches"
-            )
-        
-        if not preferences.locations and not preferences.remote_work_preference:
-            recommendations.append(
-                "Specify preferred locations or enable remote work preference"
-            )
-        
-        # Check for automation without approval
-        if settings.enabled and not settings.require_manual_approval and settings.max_applications_per_day > 5:
-            recommendations.append(
-                "Consider enabling manual approval for quality control with high-volume automation"
-            )
-        
-        # Check delay settings
-        if settings.application_delay_minutes < 30:
-            recommendations.append(
-                "Increase application delay to reduce risk of rate limiting"
-            )
-        
-        return recommendations
\ No newline at end of file
+        return list(_automation_recommendations(_preferences_key(preferences)))
@@ -1,15 +1,29 @@
 """
 Cloudinary service for file upload and management
 """
+import asyncio
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+import cloudinary.api_client.call_api
+import cloudinary.utils
 from typing import Optional, Dict, Any
-import tempfile
-import os
 from fastapi import UploadFile
 
 from app.core.config import settings
+from app.core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Size of each part sent by upload_large; peak memory is bounded by this
+UPLOAD_CHUNK_SIZE = 6_000_000
+
+# Keep-alive connection pool shared by the upload and admin APIs. The SDK's
+# default pools keep a single connection per host, so concurrent calls from
+# worker threads would otherwise open (and discard) a fresh TLS connection.
+HTTP_POOL_OPTIONS = {"num_pools": 10, "maxsize": 50}
 
 
 class CloudinaryService:
@@ -22,7 +36,7 @@ class CloudinaryService:
         """Initialize Cloudinary configuration"""
         try:
             if not settings.CLOUDINARY_CLOUD_NAME or not settings.CLOUDINARY_API_KEY or not settings.CLOUDINARY_API_SECRET:
-                print("⚠️ Cloudinary credentials not configured - file upload will be disabled")
+                logger.warning("Cloudinary credentials not configured - file upload will be disabled")
                 return
             
             cloudinary.config(
@@ -32,11 +46,18 @@ class CloudinaryService:
                 secure=True
             )
             
+            # Share one pooled connector between uploader and admin API calls
+            http_connector = cloudinary.utils.get_http_connector(
+                cloudinary.config(), {**cloudinary.CERT_KWARGS, **HTTP_POOL_OPTIONS}
+            )
+            cloudinary.uploader._http = http_connector
+            cloudinary.api_client.call_api._http = http_connector
+            
             self.initialized = True
-            print("✅ Cloudinary service initialized successfully")
+            logger.info("Cloudinary service initialized successfully")
             
         except Exception as e:
-            print(f"❌ Failed to initialize Cloudinary service: {e}")
+            logger.error(f"Failed to initialize Cloudinary service: {e}")
             self.initialized = False
     
     async def upload_resume(self, file: UploadFile, user_id: str) -> Optional[str]:
@@ -54,38 +75,28 @@ class CloudinaryService:
             raise Exception("Cloudinary service not initialized")
         
         try:
-            # Create a temporary file to store the upload
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{file.filename}") as temp_file:
-                # Read file content
-                await file.seek(0)
-                content = await file.read()
-                temp_file.write(content)
-                temp_file.flush()
-                
-                # Upload to Cloudinary
-                result = cloudinary.uploader.upload(
-                    temp_file.name,
-                    folder=f"resumes/{user_id}",
-                    resource_type="raw",  # For non-image files like PDFs
-                    public_id=f"{user_id}_{file.filename}",
-                    overwrite=True,
-                    use_filename=True,
-                    unique_filename=False
-                )
-                
-                # Clean up temporary file
-                os.unlink(temp_file.name)
-                
-                return result.get('secure_url')
+            # UploadFile is already backed by a SpooledTemporaryFile, so stream it
+            # straight to Cloudinary in chunks instead of copying it to disk and
+            # sending it in one request. The SDK closes the stream when done;
+            # the upload is the last consumer of the file contents.
+            await file.seek(0)
+            result = await asyncio.to_thread(
+                cloudinary.uploader.upload_large,
+                file.file,
+                chunk_size=UPLOAD_CHUNK_SIZE,
+                filename=file.filename,
+                folder=f"resumes/{user_id}",
+                resource_type="raw",  # For non-image files like PDFs
+                public_id=f"{user_id}_{file.filename}",
+                overwrite=True,
+                use_filename=True,
+                unique_filename=False
+            )
+            
+            return result.get('secure_url')
                 
         except Exception as e:
-            print(f"❌ Failed to upload file to Cloudinary: {e}")
-            # Clean up temp file if it exists
-            try:
-                if 'temp_file' in locals():
-                    os.unlink(temp_file.name)
-            except:
-                pass
+            logger.error(f"Failed to upload file to Cloudinary: {e}")
             raise Exception(f"Failed to upload file: {str(e)}")
     
     async def delete_resume(self, file_url: str) -> bool:
@@ -111,13 +122,15 @@ class CloudinaryService:
                 # Remove file extension
                 public_id = public_id.rsplit('.', 1)[0]
                 
-                result = cloudinary.uploader.destroy(public_id, resource_type="raw")
+                result = await asyncio.to_thread(
+                    cloudinary.uploader.destroy, public_id, resource_type="raw"
+                )
                 return result.get('result') == 'ok'
             
             return False
             
         except Exception as e:
-            print(f"❌ Failed to delete file from Cloudinary: {e}")
+            logger.error(f"Failed to delete file from Cloudinary: {e}")
             return False
     
     async def get_file_info(self, file_url: str) -> Optional[Dict[str, Any]]:
@@ -142,13 +155,15 @@ class CloudinaryService:
                 # Remove file extension
                 public_id = public_id.rsplit('.', 1)[0]
                 
-                result = cloudinary.api.resource(public_id, resource_type="raw")
+                result = await asyncio.to_thread(
+                    cloudinary.api.resource, public_id, resource_type="raw"
+                )
                 return result
             
             return None
             
         except Exception as e:
-            print(f"❌ Failed to get file info from Cloudinary: {e}")
+            logger.error(f"Failed to get file info from Cloudinary: {e}")
             return None
 
 
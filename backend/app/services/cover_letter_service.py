@@ -1,33 +1,180 @@
 """
 Cover letter generation service with AI-powered personalization
 """
+import asyncio
+import hashlib
 import json
+import time
 import uuid
 import re
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from functools import cache, lru_cache
+from string import Template
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Any, Tuple, Union
+from datetime import datetime, timezone
+
+from pydantic import ValidationError
 
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.schema import HumanMessage, SystemMessage
 
 from app.core.config import settings
+from app.core.logging import get_logger
 from app.models.cover_letter import (
     CoverLetterTemplate, CoverLetterPersonalization, CoverLetterContent,
     CoverLetterValidation, CoverLetterGenerationRequest, CoverLetterResult,
-    CoverLetterAnalysis, CoverLetterTone
+    CoverLetterAnalysis, CoverLetterTone, CoverLetterDraft, CoverLetterValidationDraft,
+    CoverLetterValidationProgress
 )
 from app.models.resume import ParsedResumeContent
 from app.models.job import JobPostData
 
+logger = get_logger(__name__)
+
+# Upper bound on concurrent Gemini round-trips for a single batch call
+DEFAULT_BATCH_CONCURRENCY = 5
+
+# Generated letters are reused for identical prompts within this window
+GENERATION_CACHE_SIZE = 256
+GENERATION_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_TEMPLATE_FIELD_RE = re.compile(r"\{(\w+)\}")
+
+_WORD_RE = re.compile(r"\S+")
+
+# Keywords tracked by the non-AI analysis, matched as whole words
+COMMON_KEYWORDS = ("experience", "skills", "team", "company", "role", "position")
+_KEYWORD_RE = re.compile(r"\b(" + "|".join(COMMON_KEYWORDS) + r")\b")
+
+# Scalar validation fields whose value has fully streamed (a delimiter follows it)
+_VALIDATION_SCORE_RE = re.compile(
+    r'"(is_valid|tone_score|grammar_score|personalization_score|relevance_score|overall_score|'
+    r'word_count|estimated_reading_time)"\s*:\s*(true|false|-?\d+(?:\.\d+)?)\s*[,}\n]'
+)
+
+# System prompts are kept invariant (no per-request interpolation) so every
+# call shares an identical prompt prefix that Gemini can serve from its cache.
+# Per-request parameters such as tone and word limit belong in the user prompt.
+GENERATION_SYSTEM_PROMPT = """You are an expert career coach writing cover letters.
+Write a letter tailored to the given job, company and candidate: lead with the most relevant qualifications, cite concrete achievements, show genuine interest in the role, and avoid generic phrases. Keep grammar and formatting flawless.
+Respect the tone and word limit given in the request.
+Reply with a JSON object with keys: header, opening_paragraph, body_paragraphs (list of 2-3 strings), closing_paragraph, signature, full_content (the complete formatted letter)."""
+
+VALIDATION_SYSTEM_PROMPT = """
+You are a professional writing expert. Analyze the provided cover letter and return a detailed assessment as JSON:
+
+{
+    "is_valid": true/false,
+    "tone_score": 0.0-1.0,
+    "grammar_score": 0.0-1.0,
+    "personalization_score": 0.0-1.0,
+    "relevance_score": 0.0-1.0,
+    "overall_score": 0.0-1.0,
+    "issues": ["list of specific issues found"],
+    "suggestions": ["list of improvement suggestions"],
+    "word_count": actual_word_count,
+    "estimated_reading_time": reading_time_in_seconds
+}
+
+Evaluate:
+- Professional tone and language
+- Grammar, spelling, and punctuation
+- Level of personalization (company/role specific content)
+- Relevance to the job requirements
+- Overall quality and effectiveness
+"""
+
+ANALYSIS_SYSTEM_PROMPT = """
+You are a career expert analyzing cover letter effectiveness. Return detailed analysis as JSON:
+
+{
+    "keyword_density": {"keyword1": 0.05, "keyword2": 0.03},
+    "readability_score": 0.0-1.0,
+    "sentiment_score": -1.0-1.0,
+    "professional_language_score": 0.0-1.0,
+    "company_alignment_score": 0.0-1.0,
+    "job_relevance_score": 0.0-1.0,
+    "uniqueness_score": 0.0-1.0,
+    "call_to_action_strength": 0.0-1.0,
+    "strengths": ["list of strengths"],
+    "weaknesses": ["list of weaknesses"],
+    "recommendations": ["specific recommendations"],
+    "competitive_advantages_highlighted": ["advantages mentioned"],
+    "missing_elements": ["elements that could be added"]
+}
+"""
+
+
+def _compile_template(template_content: str) -> Tuple[Template, ...]:
+    """Split {field}-style template content into reusable per-paragraph string.Templates"""
+    escaped = template_content.replace("$", "$$")
+    return tuple(
+        Template(_TEMPLATE_FIELD_RE.sub(r"${\1}", segment))
+        for segment in escaped.split("\n\n")
+    )
+
+
+def _years_of_experience(experience: List[Dict[str, Any]]) -> str:
+    """Years since the earliest parseable start date in the resume, or a neutral phrase"""
+    start_years = [
+        int(str(role.get("start_date", ""))[:4])
+        for role in experience
+        if str(role.get("start_date", ""))[:4].isdigit()
+    ]
+    if not start_years:
+        return "several"
+    return str(max(1, datetime.now().year - min(start_years)))
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without materialising them"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _as_text(value: Any) -> str:
+    """Normalise an optional resume field to a hashable string"""
+    return str(value) if value else ""
+
+
+@lru_cache(maxsize=128)
+def _format_resume_summary(
+    name: str,
+    title: str,
+    summary: str,
+    skills: Tuple[str, ...],
+    experience: Tuple[Tuple[str, str], ...],
+    degree: str,
+    field: str
+) -> str:
+    """Render the resume summary; cached since one resume is reused across many jobs"""
+    recent_experience = "; ".join(
+        f"{job_title} at {company}" for job_title, company in experience if job_title and company
+    )
+    summary_parts = (
+        ("Name", name),
+        ("Current Title", title),
+        ("Professional Summary", summary),
+        ("Key Skills", ", ".join(skills)),
+        ("Recent Experience", recent_experience),
+        ("Education", f"{degree} in {field}" if degree and field else "")
+    )
+    return "\n".join(f"{label}: {value}" for label, value in summary_parts if value)
+
 
 class CoverLetterTemplateManager:
     """Manages cover letter templates"""
     
     def __init__(self):
-        self.templates = self._initialize_default_templates()
+        self.templates = self._build_default_templates()
+        self._tone_index = self._build_tone_index()
+        self._all_templates = tuple(self.templates.values())
+        self._compiled: Dict[str, Tuple[Template, ...]] = dict(self._build_default_segments())
     
-    def _initialize_default_templates(self) -> Dict[str, CoverLetterTemplate]:
-        """Initialize default cover letter templates"""
+    @staticmethod
+    @cache
+    def _build_default_templates() -> Mapping[str, CoverLetterTemplate]:
+        """Build the built-in cover letter templates once per process"""
         templates = {}
         
         # Professional template
@@ -95,19 +242,45 @@ Regards,
         )
         templates[confident_template.id] = confident_template
         
-        return templates
+        return MappingProxyType(templates)
+    
+    @staticmethod
+    @cache
+    def _build_tone_index() -> Mapping[CoverLetterTone, Tuple[CoverLetterTemplate, ...]]:
+        """Index the built-in templates by tone"""
+        templates = CoverLetterTemplateManager._build_default_templates().values()
+        return MappingProxyType({
+            tone: tuple(template for template in templates if template.tone == tone)
+            for tone in CoverLetterTone
+        })
+    
+    @staticmethod
+    @cache
+    def _build_default_segments() -> Mapping[str, Tuple[Template, ...]]:
+        """Compile the built-in templates into paragraph segments"""
+        return MappingProxyType({
+            template_id: _compile_template(template.template_content)
+            for template_id, template in CoverLetterTemplateManager._build_default_templates().items()
+        })
     
     def get_template(self, template_id: str) -> Optional[CoverLetterTemplate]:
         """Get template by ID"""
         return self.templates.get(template_id)
     
-    def get_templates_by_tone(self, tone: CoverLetterTone) -> List[CoverLetterTemplate]:
+    def get_templates_by_tone(self, tone: CoverLetterTone) -> Tuple[CoverLetterTemplate, ...]:
         """Get templates by tone"""
-        return [template for template in self.templates.values() if template.tone == tone]
+        return self._tone_index.get(tone, ())
     
-    def get_all_templates(self) -> List[CoverLetterTemplate]:
+    def get_all_templates(self) -> Tuple[CoverLetterTemplate, ...]:
         """Get all available templates"""
-        return list(self.templates.values())
+        return self._all_templates
+    
+    def get_template_segments(self, template: CoverLetterTemplate) -> Tuple[Template, ...]:
+        """Get the precompiled paragraph templates for a cover letter template"""
+        segments = self._compiled.get(template.id)
+        if segments is None:
+            segments = self._compiled[template.id] = _compile_template(template.template_content)
+        return segments
 
 
 class CoverLetterService:
@@ -117,12 +290,31 @@ class CoverLetterService:
         self.template_manager = CoverLetterTemplateManager()
         if settings.GEMINI_API_KEY:
             self.llm = ChatGoogleGenerativeAI(
-                model="gemini-pro",
+                model="gemini-2.5-flash",
                 google_api_key=settings.GEMINI_API_KEY,
-                temperature=0.3  # Slightly higher for more creative writing
+                temperature=0.3,  # Slightly higher for more creative writing
+                response_mime_type="application/json"  # Every prompt here expects a JSON reply
             )
         else:
             self.llm = None
+        
+        # prompt fingerprint -> (stored_at, content, validation), least recently used first
+        self._generation_cache: "OrderedDict[str, Tuple[float, CoverLetterContent, CoverLetterValidation]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Shared cap on in-flight Gemini calls so bursts queue here instead of tripping 429 retries
+        self._llm_semaphore = asyncio.Semaphore(max(1, settings.GEMINI_MAX_CONCURRENCY))
+    
+    @asynccontextmanager
+    async def _llm_slot(self):
+        """Hold one of the limited Gemini concurrency slots"""
+        if self._llm_semaphore.locked():
+            logger.info(
+                f"Gemini concurrency limit ({settings.GEMINI_MAX_CONCURRENCY}) reached; "
+                f"cover letter request is waiting for a free slot"
+            )
+        async with self._llm_semaphore:
+            yield
     
     async def generate_cover_letter(
         self,
@@ -147,15 +339,29 @@ class CoverLetterService:
         # Extract personalization data
         personalization = self._extract_personalization_data(request, resume_data)
         
-        # Generate cover letter content using AI
-        content = await self._generate_ai_content(request, resume_data, personalization)
+        cache_key = self._generation_cache_key(request, resume_data, personalization)
+        cached = self._get_cached_generation(cache_key)
         
-        # Validate the generated content
-        validation = await self._validate_cover_letter(content, request)
+        if cached:
+            content, validation = cached
+        else:
+            # Generate cover letter content using AI
+            content, from_model = await self._generate_ai_content(request, resume_data, personalization)
+            
+            # Validate the generated content; rule-based checks need no event-loop round-trip
+            if request.skip_ai_validation:
+                validation = self._basic_validation(content, request)
+            else:
+                validation = await self._validate_cover_letter(content, request)
+            
+            # A template fallback is not cached so the next request retries the model
+            if from_model:
+                self._store_cached_generation(cache_key, content, validation)
         
         # Create result
+        now = datetime.now(timezone.utc)
         result = CoverLetterResult(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             user_id=user_id,
             content=content,
             personalization=personalization,
@@ -164,12 +370,119 @@ class CoverLetterService:
             generation_metadata={
                 "tone_requested": request.tone.value,
                 "max_word_count": request.max_word_count,
-                "generation_timestamp": datetime.now().isoformat()
-            }
+                "generation_timestamp": now.isoformat(),
+                "cache_hit": cached is not None
+            },
+            created_at=now
         )
         
         return result
     
+    def _generation_cache_key(
+        self,
+        request: CoverLetterGenerationRequest,
+        resume_data: ParsedResumeContent,
+        personalization: CoverLetterPersonalization
+    ) -> str:
+        """Fingerprint every input that shapes the generation prompt"""
+        fingerprint = "|".join((
+            request.tone.value,
+            str(request.max_word_count),
+            str(request.skip_ai_validation),
+            request.template_id or "",
+            personalization.hiring_manager_name or "",
+            self._create_job_context(request, personalization),
+            self._create_resume_summary(resume_data)
+        ))
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+    
+    def _get_cached_generation(
+        self,
+        cache_key: str
+    ) -> Optional[Tuple[CoverLetterContent, CoverLetterValidation]]:
+        """Return copies of a fresh cached generation, evicting it if expired"""
+        entry = self._generation_cache.get(cache_key)
+        if entry is None:
+            self.cache_misses += 1
+            return None
+        
+        stored_at, content, validation = entry
+        if time.monotonic() - stored_at > GENERATION_CACHE_TTL_SECONDS:
+            del self._generation_cache[cache_key]
+            self.cache_misses += 1
+            return None
+        
+        self._generation_cache.move_to_end(cache_key)
+        self.cache_hits += 1
+        return content.model_copy(deep=True), validation.model_copy(deep=True)
+    
+    def _store_cached_generation(
+        self,
+        cache_key: str,
+        content: CoverLetterContent,
+        validation: CoverLetterValidation
+    ) -> None:
+        """Remember a generation, dropping the least recently used entry when full"""
+        self._generation_cache[cache_key] = (
+            time.monotonic(),
+            content.model_copy(deep=True),
+            validation.model_copy(deep=True)
+        )
+        self._generation_cache.move_to_end(cache_key)
+        while len(self._generation_cache) > GENERATION_CACHE_SIZE:
+            self._generation_cache.popitem(last=False)
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get generation cache hit/miss counters"""
+        return {
+            "entries": len(self._generation_cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses
+        }
+    
+    async def generate_cover_letters_batch(
+        self,
+        requests: List[CoverLetterGenerationRequest],
+        resume_data: ParsedResumeContent,
+        user_id: str,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[Optional[CoverLetterResult]]:
+        """
+        Generate several cover letters concurrently for the same resume
+        
+        Args:
+            requests: Cover letter generation requests
+            resume_data: User's parsed resume data
+            user_id: User identifier
+            max_concurrency: Maximum number of generations in flight at once
+            
+        Returns:
+            Results in request order, with None for generations that failed
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def generate(request: CoverLetterGenerationRequest) -> CoverLetterResult:
+            async with semaphore:
+                return await self.generate_cover_letter(request, resume_data, user_id)
+        
+        outcomes = await asyncio.gather(
+            *(generate(request) for request in requests),
+            return_exceptions=True
+        )
+        
+        results: List[Optional[CoverLetterResult]] = []
+        for request, outcome in zip(requests, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"Batch cover letter generation failed for {request.job_title} "
+                    f"at {request.company_name}: {outcome}"
+                )
+                results.append(None)
+            else:
+                results.append(outcome)
+        
+        return results
+    
     def _extract_personalization_data(
         self,
         request: CoverLetterGenerationRequest,
@@ -193,136 +506,73 @@ class CoverLetterService:
         request: CoverLetterGenerationRequest,
         resume_data: ParsedResumeContent,
         personalization: CoverLetterPersonalization
-    ) -> CoverLetterContent:
-        """Generate cover letter content using AI"""
-        
-        system_prompt = f"""
-        You are an expert career coach and professional writer specializing in cover letters.
-        Generate a compelling, personalized cover letter that:
-        
-        1. Uses a {request.tone.value} tone throughout
-        2. Is tailored specifically to the job and company
-        3. Highlights the most relevant qualifications from the resume
-        4. Stays within {request.max_word_count} words
-        5. Follows professional formatting standards
-        6. Includes specific examples and achievements
-        7. Shows genuine interest in the company and role
-        
-        Return the response as a JSON object with this structure:
-        {{
-            "header": "Professional header with date and contact info",
-            "opening_paragraph": "Engaging opening that mentions the specific role and company",
-            "body_paragraphs": ["First body paragraph", "Second body paragraph", "Third body paragraph if needed"],
-            "closing_paragraph": "Strong closing with call to action",
-            "signature": "Professional signature line",
-            "full_content": "Complete formatted cover letter text"
-        }}
-        
-        Make sure the content is:
-        - Specific to this job and company
-        - Free of generic phrases
-        - Professional yet engaging
-        - Error-free in grammar and spelling
-        - Appropriately formatted
+    ) -> Tuple[CoverLetterContent, bool]:
+        """
+        Generate cover letter content using AI
+        
+        Returns the content and whether it came from the model rather than
+        the template fallback used for malformed replies.
         """
         
         # Prepare context information
         resume_summary = self._create_resume_summary(resume_data)
         job_context = self._create_job_context(request, personalization)
         
-        user_prompt = f"""
-        Generate a cover letter for this job application:
-        
-        JOB DETAILS:
-        {job_context}
-        
-        CANDIDATE BACKGROUND:
-        {resume_summary}
-        
-        REQUIREMENTS:
-        - Tone: {request.tone.value}
-        - Max words: {request.max_word_count}
-        - Company: {personalization.company_name}
-        - Role: {personalization.job_title}
-        - Hiring Manager: {personalization.hiring_manager_name or "Hiring Manager"}
-        
-        Focus on the most relevant qualifications and create a compelling narrative that connects the candidate's experience to the job requirements.
-        """
+        user_prompt = (
+            f"JOB DETAILS:\n{job_context}\n\n"
+            f"CANDIDATE BACKGROUND:\n{resume_summary}\n\n"
+            f"Tone: {request.tone.value}\n"
+            f"Max words: {request.max_word_count}\n"
+            f"Address to: {personalization.hiring_manager_name or 'Hiring Manager'}"
+        )
         
         try:
             messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
+                ("system", GENERATION_SYSTEM_PROMPT),
+                ("human", user_prompt)
             ]
             
-            response = await self.llm.ainvoke(messages)
-            
-            # Parse JSON response
-            content_data = json.loads(response.content)
+            async with self._llm_slot():
+                response = await self.llm.ainvoke(messages)
             
-            # Calculate word count
-            full_text = content_data.get("full_content", "")
-            word_count = len(full_text.split())
+            # Parse the JSON reply against the expected section schema
+            draft = CoverLetterDraft.model_validate_json(response.content)
             
-            return CoverLetterContent(
-                header=content_data.get("header", ""),
-                opening_paragraph=content_data.get("opening_paragraph", ""),
-                body_paragraphs=content_data.get("body_paragraphs", []),
-                closing_paragraph=content_data.get("closing_paragraph", ""),
-                signature=content_data.get("signature", ""),
-                full_content=full_text,
-                word_count=word_count,
+            content = CoverLetterContent(
+                header=draft.header,
+                opening_paragraph=draft.opening_paragraph,
+                body_paragraphs=draft.body_paragraphs,
+                closing_paragraph=draft.closing_paragraph,
+                signature=draft.signature,
+                full_content=draft.full_content,
+                word_count=_count_words(draft.full_content),
                 tone_used=request.tone
             )
+            return content, True
             
-        except json.JSONDecodeError:
-            # Fallback to template-based generation
-            return await self._generate_template_content(request, resume_data, personalization)
+        except ValidationError:
+            # Malformed or off-schema reply: fall back to template-based generation
+            return await self._generate_template_content(request, resume_data, personalization), False
         except Exception as e:
             raise Exception(f"Failed to generate cover letter content: {str(e)}")
     
     def _create_resume_summary(self, resume_data: ParsedResumeContent) -> str:
         """Create a concise summary of resume data for AI context"""
-        summary_parts = []
-        
-        # Personal info
-        if resume_data.personal_info:
-            name = resume_data.personal_info.get("name", "")
-            title = resume_data.personal_info.get("title", "")
-            if name:
-                summary_parts.append(f"Name: {name}")
-            if title:
-                summary_parts.append(f"Current Title: {title}")
-        
-        # Summary
-        if resume_data.summary:
-            summary_parts.append(f"Professional Summary: {resume_data.summary}")
-        
-        # Skills
-        if resume_data.skills:
-            skills_text = ", ".join(resume_data.skills[:10])  # Top 10 skills
-            summary_parts.append(f"Key Skills: {skills_text}")
-        
-        # Experience
-        if resume_data.experience:
-            exp_summary = []
-            for exp in resume_data.experience[:3]:  # Top 3 experiences
-                title = exp.get("title", "")
-                company = exp.get("company", "")
-                if title and company:
-                    exp_summary.append(f"{title} at {company}")
-            if exp_summary:
-                summary_parts.append(f"Recent Experience: {'; '.join(exp_summary)}")
-        
-        # Education
-        if resume_data.education:
-            edu = resume_data.education[0]  # Most recent education
-            degree = edu.get("degree", "")
-            field = edu.get("field", "")
-            if degree and field:
-                summary_parts.append(f"Education: {degree} in {field}")
-        
-        return "\n".join(summary_parts)
+        personal_info = resume_data.personal_info or {}
+        education = resume_data.education[0] if resume_data.education else {}  # Most recent education
+        
+        return _format_resume_summary(
+            _as_text(personal_info.get("name")),
+            _as_text(personal_info.get("title")),
+            _as_text(resume_data.summary),
+            tuple(resume_data.skills[:10]),  # Top 10 skills
+            tuple(
+                (_as_text(exp.get("title")), _as_text(exp.get("company")))
+                for exp in resume_data.experience[:3]  # Top 3 experiences
+            ),
+            _as_text(education.get("degree")),
+            _as_text(education.get("field"))
+        )
     
     def _create_job_context(
         self,
@@ -330,26 +580,16 @@ class CoverLetterService:
         personalization: CoverLetterPersonalization
     ) -> str:
         """Create job context for AI generation"""
-        context_parts = [
-            f"Job Title: {personalization.job_title}",
-            f"Company: {personalization.company_name}"
-        ]
-        
-        if request.job_description:
-            context_parts.append(f"Job Description: {request.job_description}")
-        
-        if request.job_requirements:
-            requirements_text = "; ".join(request.job_requirements)
-            context_parts.append(f"Key Requirements: {requirements_text}")
-        
-        if request.company_info:
-            context_parts.append(f"Company Info: {request.company_info}")
-        
-        if personalization.company_culture_keywords:
-            culture_text = ", ".join(personalization.company_culture_keywords)
-            context_parts.append(f"Company Culture: {culture_text}")
+        context_parts = (
+            ("Job Title", personalization.job_title),
+            ("Company", personalization.company_name),
+            ("Job Description", request.job_description),
+            ("Key Requirements", "; ".join(request.job_requirements)),
+            ("Company Info", request.company_info),
+            ("Company Culture", ", ".join(personalization.company_culture_keywords))
+        )
         
-        return "\n".join(context_parts)
+        return "\n".join(f"{label}: {value}" for label, value in context_parts if value)
     
     async def _generate_template_content(
         self,
@@ -372,24 +612,42 @@ class CoverLetterService:
         # Extract data for template variables
         candidate_name = resume_data.personal_info.get("name", "[Your Name]")
         hiring_manager = personalization.hiring_manager_name or "Hiring Manager"
+        skills = resume_data.skills
+        latest_role = resume_data.experience[0] if resume_data.experience else {}
         
-        # Create template variables
+        # Create template variables; every field the built-in templates use has a value
         template_vars = {
             "hiring_manager_name": hiring_manager,
             "job_title": personalization.job_title,
             "company_name": personalization.company_name,
             "candidate_name": candidate_name,
-            "relevant_experience": ", ".join(resume_data.skills[:3]) if resume_data.skills else "relevant experience",
+            "relevant_experience": ", ".join(skills[:3]) if skills else "relevant experience",
+            "key_skills": ", ".join(skills[:3]) if skills else "skills and experience",
+            "relevant_passion": personalization.industry or (skills[0] if skills else "my work"),
+            "company_mission": (
+                f"champion {' and '.join(personalization.company_values[:2])}"
+                if personalization.company_values else "deliver great work for its customers"
+            ),
+            "company_goals": "your team's goals",
+            "professional_title": (
+                latest_role.get("title") or resume_data.personal_info.get("title") or "professional"
+            ),
+            "years_experience": _years_of_experience(resume_data.experience),
+            "industry": personalization.industry or "my field",
+            "key_achievements": "delivering measurable results",
             "body_paragraph_1": "First paragraph content",
             "body_paragraph_2": "Second paragraph content",
             "body_paragraph_3": "Third paragraph content"
         }
         
-        # Fill template
-        full_content = template.template_content.format(**template_vars)
-        
-        # Split into components
-        paragraphs = full_content.split("\n\n")
+        # Fill each paragraph; a paragraph referencing a field without a value
+        # (custom templates) is dropped rather than sent with a raw placeholder
+        paragraphs = []
+        for segment in self.template_manager.get_template_segments(template):
+            try:
+                paragraphs.append(segment.substitute(template_vars))
+            except KeyError as e:
+                logger.warning(f"Dropping cover letter paragraph with unfilled field {e} in template {template.id}")
         
         return CoverLetterContent(
             header=f"Date: {datetime.now().strftime('%B %d, %Y')}",
@@ -397,8 +655,8 @@ class CoverLetterService:
             body_paragraphs=paragraphs[1:-2] if len(paragraphs) > 2 else [],
             closing_paragraph=paragraphs[-2] if len(paragraphs) > 1 else "",
             signature=paragraphs[-1] if paragraphs else "",
-            full_content=full_content,
-            word_count=len(full_content.split()),
+            full_content="\n\n".join(paragraphs),
+            word_count=sum(_count_words(paragraph) for paragraph in paragraphs),
             tone_used=request.tone
         )
     
@@ -412,30 +670,75 @@ class CoverLetterService:
         if not self.llm:
             return self._basic_validation(content, request)
         
-        system_prompt = """
-        You are a professional writing expert. Analyze the provided cover letter and return a detailed assessment as JSON:
-        
-        {
-            "is_valid": true/false,
-            "tone_score": 0.0-1.0,
-            "grammar_score": 0.0-1.0,
-            "personalization_score": 0.0-1.0,
-            "relevance_score": 0.0-1.0,
-            "overall_score": 0.0-1.0,
-            "issues": ["list of specific issues found"],
-            "suggestions": ["list of improvement suggestions"],
-            "word_count": actual_word_count,
-            "estimated_reading_time": reading_time_in_seconds
-        }
-        
-        Evaluate:
-        - Professional tone and language
-        - Grammar, spelling, and punctuation
-        - Level of personalization (company/role specific content)
-        - Relevance to the job requirements
-        - Overall quality and effectiveness
+        try:
+            async with self._llm_slot():
+                response = await self.llm.ainvoke(self._build_validation_messages(content, request))
+            draft = CoverLetterValidationDraft.model_validate_json(response.content)
+            return self._validation_from_draft(draft, content)
+            
+        except Exception:
+            return self._basic_validation(content, request)
+    
+    async def validate_stream(
+        self,
+        content: CoverLetterContent,
+        request: CoverLetterGenerationRequest
+    ) -> AsyncIterator[Union[CoverLetterValidationProgress, CoverLetterValidation]]:
         """
+        Stream progressively more complete validations while the model is still replying
         
+        A CoverLetterValidationProgress is yielded each time another score field
+        finishes streaming, so callers can show is_valid/overall_score before the
+        long issues and suggestions lists arrive. Fields the model has not sent
+        yet are None. The last item is always the full CoverLetterValidation.
+        
+        The reply is read by a separate task that alone holds the Gemini slot,
+        so a caller that stops iterating early never keeps the slot taken.
+        """
+        if not self.llm:
+            yield self._basic_validation(content, request)
+            return
+        
+        chunks: asyncio.Queue = asyncio.Queue()
+        
+        async def read_reply() -> None:
+            try:
+                async with self._llm_slot():
+                    async for chunk in self.llm.astream(self._build_validation_messages(content, request)):
+                        chunks.put_nowait(chunk.content)
+            finally:
+                chunks.put_nowait(None)
+        
+        reader = asyncio.create_task(read_reply())
+        reply = ""
+        scores: Dict[str, Any] = {}
+        try:
+            while (text := await chunks.get()) is not None:
+                reply += text
+                streamed = {
+                    match.group(1): json.loads(match.group(2))
+                    for match in _VALIDATION_SCORE_RE.finditer(reply)
+                }
+                if len(streamed) > len(scores):
+                    scores = streamed
+                    yield CoverLetterValidationProgress(**scores)
+            
+            # Surface any error the stream ended with
+            await reader
+            draft = CoverLetterValidationDraft.model_validate_json(reply)
+            yield self._validation_from_draft(draft, content)
+            
+        except Exception:
+            yield self._basic_validation(content, request)
+        finally:
+            reader.cancel()
+    
+    def _build_validation_messages(
+        self,
+        content: CoverLetterContent,
+        request: CoverLetterGenerationRequest
+    ) -> List[Tuple[str, str]]:
+        """Build the validation prompt for a generated cover letter"""
         user_prompt = f"""
         Analyze this cover letter:
         
@@ -450,30 +753,33 @@ class CoverLetterService:
         Provide detailed feedback on quality, professionalism, and effectiveness.
         """
         
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            
-            response = await self.llm.ainvoke(messages)
-            validation_data = json.loads(response.content)
-            
-            return CoverLetterValidation(
-                is_valid=validation_data.get("is_valid", True),
-                tone_score=validation_data.get("tone_score", 0.8),
-                grammar_score=validation_data.get("grammar_score", 0.8),
-                personalization_score=validation_data.get("personalization_score", 0.7),
-                relevance_score=validation_data.get("relevance_score", 0.7),
-                overall_score=validation_data.get("overall_score", 0.75),
-                issues=validation_data.get("issues", []),
-                suggestions=validation_data.get("suggestions", []),
-                word_count=validation_data.get("word_count", content.word_count),
-                estimated_reading_time=validation_data.get("estimated_reading_time", content.word_count // 3)
+        return [
+            ("system", VALIDATION_SYSTEM_PROMPT),
+            ("human", user_prompt)
+        ]
+    
+    def _validation_from_draft(
+        self,
+        draft: CoverLetterValidationDraft,
+        content: CoverLetterContent
+    ) -> CoverLetterValidation:
+        """Complete a model assessment with locally known defaults"""
+        return CoverLetterValidation(
+            is_valid=draft.is_valid,
+            tone_score=draft.tone_score,
+            grammar_score=draft.grammar_score,
+            personalization_score=draft.personalization_score,
+            relevance_score=draft.relevance_score,
+            overall_score=draft.overall_score,
+            issues=draft.issues,
+            suggestions=draft.suggestions,
+            word_count=draft.word_count if draft.word_count is not None else content.word_count,
+            estimated_reading_time=(
+                draft.estimated_reading_time
+                if draft.estimated_reading_time is not None
+                else content.word_count // 3
             )
-            
-        except (json.JSONDecodeError, Exception):
-            return self._basic_validation(content, request)
+        )
     
     def _basic_validation(
         self,
@@ -501,8 +807,9 @@ class CoverLetterService:
             issues.append("Missing closing paragraph")
         
         # Check for personalization
-        company_mentioned = request.company_name.lower() in content.full_content.lower()
-        job_mentioned = request.job_title.lower() in content.full_content.lower()
+        folded_content = content.full_content.casefold()
+        company_mentioned = request.company_name.casefold() in folded_content
+        job_mentioned = request.job_title.casefold() in folded_content
         
         personalization_score = 0.5
         if company_mentioned:
@@ -536,26 +843,6 @@ class CoverLetterService:
         if not self.llm:
             return self._basic_analysis(content)
         
-        system_prompt = """
-        You are a career expert analyzing cover letter effectiveness. Return detailed analysis as JSON:
-        
-        {
-            "keyword_density": {"keyword1": 0.05, "keyword2": 0.03},
-            "readability_score": 0.0-1.0,
-            "sentiment_score": -1.0-1.0,
-            "professional_language_score": 0.0-1.0,
-            "company_alignment_score": 0.0-1.0,
-            "job_relevance_score": 0.0-1.0,
-            "uniqueness_score": 0.0-1.0,
-            "call_to_action_strength": 0.0-1.0,
-            "strengths": ["list of strengths"],
-            "weaknesses": ["list of weaknesses"],
-            "recommendations": ["specific recommendations"],
-            "competitive_advantages_highlighted": ["advantages mentioned"],
-            "missing_elements": ["elements that could be added"]
-        }
-        """
-        
         user_prompt = f"""
         Analyze this cover letter for effectiveness:
         
@@ -566,30 +853,29 @@ class CoverLetterService:
         
         try:
             messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
+                ("system", ANALYSIS_SYSTEM_PROMPT),
+                ("human", user_prompt)
             ]
             
-            response = await self.llm.ainvoke(messages)
-            analysis_data = json.loads(response.content)
-            
-            return CoverLetterAnalysis(**analysis_data)
+            async with self._llm_slot():
+                response = await self.llm.ainvoke(messages)
+            return CoverLetterAnalysis.model_validate_json(response.content)
             
-        except (json.JSONDecodeError, Exception):
+        except Exception:
             return self._basic_analysis(content)
     
     def _basic_analysis(self, content: CoverLetterContent) -> CoverLetterAnalysis:
         """Basic analysis without AI"""
         
         text = content.full_content.lower()
-        words = text.split()
+        word_count = _count_words(text)
         
-        # Basic keyword density
-        common_keywords = ["experience", "skills", "team", "company", "role", "position"]
-        keyword_density = {}
-        for keyword in common_keywords:
-            count = text.count(keyword)
-            keyword_density[keyword] = count / len(words) if words else 0
+        # Basic keyword density from a single pass over the text
+        keyword_counts = Counter(_KEYWORD_RE.findall(text))
+        keyword_density = {
+            keyword: keyword_counts[keyword] / word_count if word_count else 0
+            for keyword in COMMON_KEYWORDS
+        }
         
         return CoverLetterAnalysis(
             keyword_density=keyword_density,
@@ -608,5 +894,7 @@ class CoverLetterService:
         )
 
 
-# Global instance
-cover_letter_service = CoverLetterService()
\ No newline at end of file
+@cache
+def get_cover_letter_service() -> CoverLetterService:
+    """Get the shared cover letter service, creating it on first use"""
+    return CoverLetterService()
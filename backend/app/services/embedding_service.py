@@ -1,20 +1,103 @@
 """
 Embedding service for processing and managing document embeddings
 """
+import asyncio
+import bisect
+import hashlib
+import io
 import logging
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from app.services.vector_service import vector_service
 from app.models.resume import ResumeData, ParsedResume
 from jobspy.model import JobPost
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent vector store upserts during batch processing
+STORE_CONCURRENCY = 8
+
+# Constant lead-in for each document type, kept ahead of any per-document text
+_RESUME_PREFIX = "Document type: resume.\n"
+_JOB_PREFIX = "Document type: job posting.\n"
+
+_EXPERIENCE_LINE = "- {} at {} ({}){}\n"
+_EDUCATION_LINE = "- {} from {} ({})\n"
+
+# Bound format methods for the fixed lines of a job posting's embedding text
+_JOB_HEADER = "Job Title: {}\nCompany: {}\n".format
+_LOCATION_LINE = "Location: {}\n".format
+_JOB_TYPE_LINE = "Job Type: {}\n".format
+_SALARY_MIN = "Salary: {}".format
+_SALARY_MAX = " - {}".format
+_SALARY_CURRENCY = " {}".format
+_DESCRIPTION_LINE = "Description: {}\n".format
+
+# Score thresholds and the labels for each band, looked up with bisect_right
+_SCORE_BINS = (0.7, 0.8, 0.9)
+_SCORE_LABELS = ("", "Good match", "Very good match", "Excellent overall match")
+_QUALITY_BINS = (0.6, 0.7, 0.8, 0.9)
+_QUALITY_LABELS = ("poor", "fair", "good", "very_good", "excellent")
+
+_blake2b = hashlib.blake2b
+
+
+def _experience_line(exp: Dict[str, Any]) -> str:
+    """Format one work experience entry as a resume text line"""
+    description = exp.get('description')
+    return _EXPERIENCE_LINE.format(
+        exp.get('title', ''),
+        exp.get('company', ''),
+        exp.get('duration', ''),
+        f": {description}" if description else ""
+    )
+
+
+@lru_cache(maxsize=100_000)
+def _job_id_from_url(job_url: str) -> str:
+    """Derive a job id from its URL that is stable across interpreter runs"""
+    return _blake2b(job_url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class JobMetadata:
+    """Vector metadata stored alongside a job posting embedding"""
+    company: Any
+    title: Any
+    location: Any
+    job_type: Any
+    salary_min: Any
+    salary_max: Any
+    currency: Any
+    site: Any
+    scraped_at: str
+    job_url: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "company": self.company,
+            "title": self.title,
+            "location": self.location,
+            "job_type": self.job_type,
+            "salary_min": self.salary_min,
+            "salary_max": self.salary_max,
+            "currency": self.currency,
+            "site": self.site,
+            "scraped_at": self.scraped_at,
+            "job_url": self.job_url
+        }
+
 
 class EmbeddingService:
     """Service for managing embeddings for resumes and job postings"""
     
+    __slots__ = ("vector_service",)
+    
     def __init__(self):
         self.vector_service = vector_service
     
@@ -25,19 +108,10 @@ class EmbeddingService:
     ) -> str:
         """Process and store resume embedding with extracted content"""
         try:
-            # Combine resume content for embedding
-            resume_text = self._prepare_resume_text(parsed_resume)
-            
-            # Prepare metadata
-            metadata = {
-                "skills": parsed_resume.skills,
-                "experience_years": parsed_resume.experience_years,
-                "education_level": parsed_resume.education_level,
-                "job_titles": parsed_resume.job_titles,
-                "industries": parsed_resume.industries,
-                "created_at": resume_data.created_at.isoformat() if resume_data.created_at else None,
-                "filename": resume_data.original_filename
-            }
+            # Build text and metadata off the event loop
+            resume_text, metadata = await asyncio.to_thread(
+                self._build_resume_payload, resume_data, parsed_resume
+            )
             
             # Store embedding
             vector_id = await self.vector_service.store_resume_embedding(
@@ -47,160 +121,280 @@ class EmbeddingService:
                 metadata=metadata
             )
             
-            logger.info(f"Processed resume embedding for resume {resume_data.id}")
+            logger.info("Processed resume embedding for resume %s", resume_data.id)
             return vector_id
             
-        except Exception as e:
-            logger.error(f"Error processing resume embedding: {e}")
+        except Exception:
+            logger.exception("Error processing resume embedding")
             raise
     
+    async def process_resume_embeddings_batch(
+        self,
+        resumes: List[Tuple[ResumeData, ParsedResume]]
+    ) -> List[str]:
+        """Process and store embeddings for several resumes with one model call"""
+        try:
+            payloads = await asyncio.to_thread(
+                lambda: [self._build_resume_payload(data, parsed) for data, parsed in resumes]
+            )
+            embeddings = await self.vector_service.generate_embeddings_batch(
+                [text for text, _ in payloads]
+            )
+            semaphore = asyncio.Semaphore(STORE_CONCURRENCY)
+            
+            async def store(resume_data: ResumeData, metadata: Dict[str, Any], embedding: List[float]) -> str:
+                async with semaphore:
+                    return await self.vector_service.store_resume_embedding_with_vector(
+                        resume_id=resume_data.id,
+                        user_id=resume_data.user_id,
+                        embedding=embedding,
+                        metadata=metadata
+                    )
+            
+            vector_ids = await asyncio.gather(*(
+                store(resume_data, metadata, embedding)
+                for (resume_data, _), (_, metadata), embedding in zip(resumes, payloads, embeddings)
+            ))
+            
+            logger.info("Processed %d resume embeddings in batch", len(vector_ids))
+            return list(vector_ids)
+            
+        except Exception:
+            logger.exception("Error processing resume embeddings batch")
+            raise
+    
+    def _build_resume_payload(
+        self,
+        resume_data: ResumeData,
+        parsed_resume: ParsedResume
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the embedding text and vector metadata for a resume"""
+        return (
+            self._prepare_resume_text(parsed_resume),
+            self._build_resume_metadata(resume_data, parsed_resume)
+        )
+    
+    def _build_resume_metadata(self, resume_data: ResumeData, parsed_resume: ParsedResume) -> Dict[str, Any]:
+        """Build the vector metadata stored alongside a resume embedding"""
+        return {
+            "skills": parsed_resume.skills,
+            "experience_years": parsed_resume.experience_years,
+            "education_level": parsed_resume.education_level,
+            "job_titles": parsed_resume.job_titles,
+            "industries": parsed_resume.industries,
+            "created_at": resume_data.created_at.isoformat() if resume_data.created_at else None,
+            "filename": resume_data.original_filename
+        }
+    
     def _prepare_resume_text(self, parsed_resume: ParsedResume) -> str:
         """Prepare resume text for embedding generation"""
-        text_parts = []
+        buf = io.StringIO()
+        w = buf.write
+        w(_RESUME_PREFIX)
         
         # Add personal information
         if parsed_resume.personal_info:
             if parsed_resume.personal_info.get("name"):
-                text_parts.append(f"Name: {parsed_resume.personal_info['name']}")
+                w("Name: " + str(parsed_resume.personal_info['name']) + "\n")
             if parsed_resume.personal_info.get("email"):
-                text_parts.append(f"Email: {parsed_resume.personal_info['email']}")
+                w("Email: " + str(parsed_resume.personal_info['email']) + "\n")
         
         # Add summary/objective
         if parsed_resume.summary:
-            text_parts.append(f"Summary: {parsed_resume.summary}")
+            w("Summary: " + parsed_resume.summary + "\n")
         
         # Add skills
         if parsed_resume.skills:
-            skills_text = ", ".join(parsed_resume.skills)
-            text_parts.append(f"Skills: {skills_text}")
+            w("Skills: " + ", ".join(parsed_resume.skills) + "\n")
         
         # Add work experience
         if parsed_resume.work_experience:
-            text_parts.append("Work Experience:")
-            for exp in parsed_resume.work_experience:
-                exp_text = f"- {exp.get('title', '')} at {exp.get('company', '')} ({exp.get('duration', '')})"
-                if exp.get('description'):
-                    exp_text += f": {exp['description']}"
-                text_parts.append(exp_text)
+            w("Work Experience:\n")
+            w("".join(map(_experience_line, parsed_resume.work_experience)))
         
         # Add education
         if parsed_resume.education:
-            text_parts.append("Education:")
-            for edu in parsed_resume.education:
-                edu_text = f"- {edu.get('degree', '')} from {edu.get('institution', '')} ({edu.get('year', '')})"
-                text_parts.append(edu_text)
+            w("Education:\n")
+            w("".join(
+                _EDUCATION_LINE.format(edu.get('degree', ''), edu.get('institution', ''), edu.get('year', ''))
+                for edu in parsed_resume.education
+            ))
         
         # Add certifications
         if parsed_resume.certifications:
-            cert_text = ", ".join(parsed_resume.certifications)
-            text_parts.append(f"Certifications: {cert_text}")
+            w("Certifications: " + ", ".join(parsed_resume.certifications) + "\n")
         
-        return "\n".join(text_parts)
+        # Drop the trailing newline so the output matches a "\n".join of the lines
+        return buf.getvalue()[:-1]
     
     async def process_job_embedding(self, job_post: JobPost) -> str:
         """Process and store job posting embedding"""
         try:
-            # Prepare job text for embedding
-            job_text = self._prepare_job_text(job_post)
-            
-            # Prepare metadata
-            metadata = {
-                "company": job_post.company,
-                "title": job_post.title,
-                "location": job_post.location,
-                "job_type": getattr(job_post, 'job_type', None),
-                "salary_min": getattr(job_post, 'min_amount', None),
-                "salary_max": getattr(job_post, 'max_amount', None),
-                "currency": getattr(job_post, 'currency', None),
-                "site": job_post.site.value if hasattr(job_post.site, 'value') else str(job_post.site),
-                "scraped_at": datetime.now().isoformat(),
-                "job_url": job_post.job_url
-            }
+            # Build id, text and metadata off the event loop
+            job_id, job_text, metadata = await asyncio.to_thread(
+                self._build_job_payload, job_post
+            )
             
             # Store embedding
             vector_id = await self.vector_service.store_job_embedding(
-                job_id=job_post.id if hasattr(job_post, 'id') else str(hash(job_post.job_url)),
+                job_id=job_id,
                 job_content=job_text,
-                metadata=metadata
+                metadata=metadata.as_dict()
             )
             
-            logger.info(f"Processed job embedding for job {job_post.title} at {job_post.company}")
+            logger.info("Processed job embedding for job %s at %s", job_post.title, job_post.company)
             return vector_id
             
-        except Exception as e:
-            logger.error(f"Error processing job embedding: {e}")
+        except Exception:
+            logger.exception("Error processing job embedding")
             raise
     
+    async def process_job_embeddings_batch(self, job_posts: List[JobPost]) -> List[str]:
+        """Process and store embeddings for several job postings with one model call"""
+        try:
+            # One timestamp for the whole batch; the jobs arrive together
+            scraped_at = datetime.now().isoformat()
+            payloads = await asyncio.to_thread(
+                lambda: [self._build_job_payload(job_post, scraped_at) for job_post in job_posts]
+            )
+            embeddings = await self.vector_service.generate_embeddings_batch(
+                [text for _, text, _ in payloads]
+            )
+            semaphore = asyncio.Semaphore(STORE_CONCURRENCY)
+            
+            async def store(job_id: str, metadata: JobMetadata, embedding: List[float]) -> str:
+                async with semaphore:
+                    return await self.vector_service.store_job_embedding_with_vector(
+                        job_id=job_id,
+                        embedding=embedding,
+                        metadata=metadata.as_dict()
+                    )
+            
+            vector_ids = await asyncio.gather(*(
+                store(job_id, metadata, embedding)
+                for (job_id, _, metadata), embedding in zip(payloads, embeddings)
+            ))
+            
+            logger.info("Processed %d job embeddings in batch", len(vector_ids))
+            return list(vector_ids)
+            
+        except Exception:
+            logger.exception("Error processing job embeddings batch")
+            raise
+    
+    def _build_job_payload(
+        self,
+        job_post: JobPost,
+        scraped_at: Optional[str] = None
+    ) -> Tuple[str, str, JobMetadata]:
+        """Build the vector id, embedding text and vector metadata for a job posting"""
+        return (
+            self._job_id(job_post),
+            self._prepare_job_text(job_post),
+            self._build_job_metadata(job_post, scraped_at)
+        )
+    
+    def _job_id(self, job_post: JobPost) -> str:
+        """Return the identifier used for a job posting's vector"""
+        return getattr(job_post, 'id', None) or _job_id_from_url(job_post.job_url)
+    
+    def _build_job_metadata(self, job_post: JobPost, scraped_at: Optional[str] = None) -> JobMetadata:
+        """Build the vector metadata stored alongside a job posting embedding"""
+        return JobMetadata(
+            company=job_post.company,
+            title=job_post.title,
+            location=job_post.location,
+            job_type=getattr(job_post, 'job_type', None),
+            salary_min=getattr(job_post, 'min_amount', None),
+            salary_max=getattr(job_post, 'max_amount', None),
+            currency=getattr(job_post, 'currency', None),
+            site=job_post.site.value if hasattr(job_post.site, 'value') else str(job_post.site),
+            scraped_at=scraped_at or datetime.now().isoformat(),
+            job_url=job_post.job_url
+        )
+    
     def _prepare_job_text(self, job_post: JobPost) -> str:
         """Prepare job posting text for embedding generation"""
-        text_parts = []
+        buf = io.StringIO()
+        w = buf.write
+        w(_JOB_PREFIX)
         
         # Add job title and company
-        text_parts.append(f"Job Title: {job_post.title}")
-        text_parts.append(f"Company: {job_post.company}")
+        w(_JOB_HEADER(job_post.title, job_post.company))
         
         # Add location
         if job_post.location:
-            text_parts.append(f"Location: {job_post.location}")
+            w(_LOCATION_LINE(job_post.location))
         
         # Add job type
-        if hasattr(job_post, 'job_type') and job_post.job_type:
-            text_parts.append(f"Job Type: {job_post.job_type}")
+        job_type = getattr(job_post, 'job_type', None)
+        if job_type:
+            w(_JOB_TYPE_LINE(job_type))
         
         # Add salary information
-        if hasattr(job_post, 'min_amount') and job_post.min_amount:
-            salary_text = f"Salary: {job_post.min_amount}"
-            if hasattr(job_post, 'max_amount') and job_post.max_amount:
-                salary_text += f" - {job_post.max_amount}"
-            if hasattr(job_post, 'currency') and job_post.currency:
-                salary_text += f" {job_post.currency}"
-            text_parts.append(salary_text)
+        min_amount = getattr(job_post, 'min_amount', None)
+        if min_amount:
+            w(_SALARY_MIN(min_amount))
+            max_amount = getattr(job_post, 'max_amount', None)
+            if max_amount:
+                w(_SALARY_MAX(max_amount))
+            currency = getattr(job_post, 'currency', None)
+            if currency:
+                w(_SALARY_CURRENCY(currency))
+            w("\n")
         
         # Add job description
         if job_post.description:
-            text_parts.append(f"Description: {job_post.description}")
+            w(_DESCRIPTION_LINE(job_post.description))
         
-        return "\n".join(text_parts)
+        # Drop the trailing newline so the output matches a "\n".join of the lines
+        return buf.getvalue()[:-1]
     
     async def find_matching_jobs(
         self, 
         resume_id: str, 
         limit: int = 20,
-        min_score: float = 0.7
+        min_score: float = 0.7,
+        job_ids: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Find jobs that match a resume based on vector similarity"""
+        """Find jobs that match a resume based on vector similarity
+        
+        When job_ids is given, only those jobs are ranked, locally, instead of
+        querying the whole index.
+        """
         try:
-            similar_jobs = await self.vector_service.find_similar_jobs(
-                resume_id=resume_id,
-                top_k=limit,
-                score_threshold=min_score
-            )
+            if job_ids is not None:
+                similar_jobs = await self.vector_service.rank_jobs_for_resume(
+                    resume_id=resume_id,
+                    job_ids=job_ids,
+                    top_k=limit,
+                    score_threshold=min_score
+                )
+            else:
+                similar_jobs = await self.vector_service.find_similar_jobs(
+                    resume_id=resume_id,
+                    top_k=limit,
+                    score_threshold=min_score
+                )
             
-            # Enhance results with additional processing
-            enhanced_jobs = []
+            # Enhance results in place; the result dicts are freshly built per call
+            generate_reasons = self._generate_match_reasons
             for job in similar_jobs:
-                enhanced_job = {
-                    **job,
-                    "match_reasons": self._generate_match_reasons(job["metadata"], job["score"])
-                }
-                enhanced_jobs.append(enhanced_job)
+                job["match_reasons"] = generate_reasons(job["metadata"], job["score"])
             
-            return enhanced_jobs
+            return similar_jobs
             
-        except Exception as e:
-            logger.error(f"Error finding matching jobs: {e}")
+        except Exception:
+            logger.exception("Error finding matching jobs")
             raise
     
     def _generate_match_reasons(self, job_metadata: Dict[str, Any], score: float) -> List[str]:
         """Generate human-readable reasons for job match"""
         reasons = []
         
-        if score >= 0.9:
-            reasons.append("Excellent overall match")
-        elif score >= 0.8:
-            reasons.append("Very good match")
-        elif score >= 0.7:
-            reasons.append("Good match")
+        label = _SCORE_LABELS[bisect.bisect_right(_SCORE_BINS, score)]
+        if label:
+            reasons.append(label)
         
         # Add specific reasons based on metadata
         if job_metadata.get("title"):
@@ -224,16 +418,7 @@ class EmbeddingService:
             )
             
             # Categorize match quality
-            if score >= 0.9:
-                match_quality = "excellent"
-            elif score >= 0.8:
-                match_quality = "very_good"
-            elif score >= 0.7:
-                match_quality = "good"
-            elif score >= 0.6:
-                match_quality = "fair"
-            else:
-                match_quality = "poor"
+            match_quality = _QUALITY_LABELS[bisect.bisect_right(_QUALITY_BINS, score)]
             
             return {
                 "score": score,
@@ -241,10 +426,41 @@ class EmbeddingService:
                 "recommendation": score >= 0.7
             }
             
-        except Exception as e:
-            logger.error(f"Error calculating job-resume match: {e}")
+        except Exception:
+            logger.exception("Error calculating job-resume match")
+            raise
+    
+    async def calculate_job_resume_matches(
+        self,
+        resume_id: str,
+        job_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Calculate match scores between a resume and a page of jobs at once"""
+        try:
+            scores_by_job = await self.vector_service.calculate_similarity_scores(
+                resume_id=resume_id,
+                job_ids=job_ids
+            )
+            matched_ids = [job_id for job_id in job_ids if job_id in scores_by_job]
+            scores = np.array([scores_by_job[job_id] for job_id in matched_ids], dtype=np.float64)
+            
+            # Categorize match quality for every score in one pass
+            bands = np.searchsorted(_QUALITY_BINS, scores, side="right")
+            
+            return [
+                {
+                    "job_id": job_id,
+                    "score": score,
+                    "match_quality": _QUALITY_LABELS[band],
+                    "recommendation": score >= 0.7
+                }
+                for job_id, score, band in zip(matched_ids, scores.tolist(), bands.tolist())
+            ]
+            
+        except Exception:
+            logger.exception("Error calculating job-resume matches")
             raise
 
 
 # Global embedding service instance
-embedding_service = EmbeddingService()
\ No newline at end of file
+embedding_service = EmbeddingService()
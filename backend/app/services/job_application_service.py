@@ -5,14 +5,18 @@ This service handles the automated submission of job applications across differe
 It includes web automation, form filling, document attachment, and application tracking.
 """
 import asyncio
+import copy
 import logging
+import re
+import shutil
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from pathlib import Path
 import tempfile
 import json
+from contextlib import asynccontextmanager
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -34,6 +38,151 @@ from app.models.preferences import UserPreferencesData
 
 logger = logging.getLogger(__name__)
 
+# Number of browsers used to work through a batch of applications in parallel
+DEFAULT_DRIVER_POOL_SIZE = 3
+# Applications in flight per job site, and the pause each slot takes between them
+SITE_CONCURRENCY = 1
+SITE_APPLICATION_INTERVAL = 30  # seconds
+# How often explicit waits re-check their condition (Selenium's default is 0.5s)
+WAIT_POLL_INTERVAL = 0.1  # seconds
+
+# Chrome switches for browser subsystems that form automation never uses
+CHROME_PERFORMANCE_ARGUMENTS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false"
+)
+
+# Elements that show an upload is still in progress, or that a submission went through
+UPLOAD_PROGRESS_SELECTOR = "progress, [role='progressbar'], .upload-progress, [class*='uploading']"
+SUBMISSION_SUCCESS_SELECTOR = ".confirmation, .success, [class*='confirmation'], [class*='success']"
+
+# Common login indicators in visible page text
+LOGIN_INDICATORS = (
+    "login", "sign in", "log in", "signin",
+    "authentication", "account", "password"
+)
+# Compound selectors let the browser try every alternative in a single query
+USERNAME_FIELD_SELECTOR = (
+    "input[name='username'], input[name='email'], "
+    "input[type='email'], input[id*='username'], input[id*='email']"
+)
+LOGIN_BUTTON_SELECTOR = (
+    "button[type='submit'], input[type='submit'], "
+    "button[id*='login'], button[id*='signin']"
+)
+SUBMIT_BUTTON_SELECTOR = (
+    "button[type='submit'], input[type='submit'], "
+    "button[id*='submit'], button[class*='submit']"
+)
+
+# URL fragments that settle the login check without inspecting the page
+LOGIN_URL_TOKENS = ("/login", "/signin", "/auth", "sso", "authenticate")
+JOB_URL_TOKENS = ("/job", "/jobs", "/viewjob", "/view", "/posting")
+
+# When to look for a login wall: LinkedIn gates job pages, while the other
+# sites show postings to guests and only ask for login once apply is clicked
+LOGIN_CHECK_POLICY: Dict[JobSite, str] = {
+    JobSite.LINKEDIN: "always",
+    JobSite.INDEED: "after_apply_click",
+    JobSite.ZIP_RECRUITER: "after_apply_click"
+}
+
+# Indicators are plain words, so joining them gives a valid JavaScript regex too
+_LOGIN_INDICATOR_PATTERN = "|".join(LOGIN_INDICATORS)
+
+# Status keywords in priority order: the first status with a keyword on the page wins
+APPLICATION_STATUS_INDICATORS = (
+    ("submitted", ("submitted", "received", "under review")),
+    ("viewed", ("viewed", "opened", "reviewed")),
+    ("rejected", ("rejected", "declined", "not selected")),
+    ("interview", ("interview", "phone screen", "next round")),
+    ("offer", ("offer", "congratulations", "selected"))
+)
+_STATUS_BY_KEYWORD = {
+    keyword: status
+    for status, keywords in APPLICATION_STATUS_INDICATORS
+    for keyword in keywords
+}
+# Longest keywords first; searching again one character past each match
+# start still finds overlapping keywords ("interviewed" holds "viewed")
+_STATUS_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, sorted(_STATUS_BY_KEYWORD, key=len, reverse=True)))
+)
+_TOP_STATUS = APPLICATION_STATUS_INDICATORS[0][0]
+
+
+def _find_statuses(page_text: str) -> Set[str]:
+    """Statuses whose keywords occur in the lowercased page, stopping once the top-priority one is seen"""
+    found: Set[str] = set()
+    match = _STATUS_KEYWORD_RE.search(page_text)
+    while match is not None:
+        found.add(_STATUS_BY_KEYWORD[match.group()])
+        if _TOP_STATUS in found:
+            break
+        match = _STATUS_KEYWORD_RE.search(page_text, match.start() + 1)
+    return found
+
+# "Confirmation: X", "Application ID: X", "Reference #X" and similar, in one pass.
+# The captured value must contain a digit so words such as "ID" are not taken.
+# Written in the regex syntax shared by Python and JavaScript; it runs in the browser.
+_CONFIRMATION_PATTERN = (
+    r"\b(?:confirmation|application|reference|id)(?:\s+(?:id|number|no\.?|#))?[:\s#]+([A-Z0-9-]*\d[A-Z0-9-]*)"
+)
+
+# Search the visible page text so only the match crosses the WebDriver bridge
+_CONFIRMATION_JS = """
+const match = (document.body ? document.body.innerText : "").match(new RegExp(arguments[0], "i"));
+return match ? match[1] : null;
+"""
+
+# A password field or login form, or any indicator in the visible page text
+_LOGIN_REQUIRED_JS = """
+if (document.querySelector("input[type='password'], form[action*='login'], form[action*='signin']")) {
+    return true;
+}
+const text = (document.body ? document.body.innerText : "").toLowerCase();
+return new RegExp(arguments[0]).test(text);
+"""
+
+# First button or link whose text, aria-label or value mentions "apply"
+_APPLY_TEXT_SEARCH_JS = """
+const mentionsApply = text => Boolean(text) && text.toLowerCase().includes("apply");
+for (const element of document.querySelectorAll("button, a, input[type='button'], input[type='submit']")) {
+    if (mentionsApply(element.innerText) || mentionsApply(element.getAttribute("aria-label")) || mentionsApply(element.value)) {
+        return element;
+    }
+}
+return null;
+"""
+
+# Fills every text field in one round-trip; each fill uses the first selector that matches
+_FILL_FIELDS_JS = """
+const filled = [];
+for (const fill of arguments[0]) {
+    let field = null;
+    for (const selector of fill.selectors) {
+        field = document.querySelector(selector);
+        if (field) break;
+    }
+    if (!field) continue;
+    field.focus();
+    // React tracks the value it last set, so go through the native setter
+    // or the framework never sees the change
+    const setValue = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(field), "value").set;
+    setValue.call(field, fill.value);
+    field.dispatchEvent(new Event("input", {bubbles: true}));
+    field.dispatchEvent(new Event("change", {bubbles: true}));
+    filled.push(fill.name);
+}
+return filled;
+"""
+
 
 class ApplicationStatus(str, Enum):
     """Application submission status"""
@@ -60,6 +209,33 @@ class ApplicationError(str, Enum):
     UNKNOWN_ERROR = "unknown_error"
 
 
+# Errors that another attempt cannot fix
+_NON_RETRYABLE = frozenset({
+    ApplicationError.FORM_NOT_FOUND,
+    ApplicationError.INVALID_CREDENTIALS,
+    ApplicationError.CAPTCHA_REQUIRED,
+    ApplicationError.LOGIN_REQUIRED
+})
+
+
+@dataclass(slots=True)
+class AttemptRecord:
+    """One submission attempt, kept in ApplicationResult.metadata["attempts"]"""
+    attempt: int
+    timestamp: datetime
+    status: str
+    error: Optional[str] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Serializable form, with the timestamp converted only when needed"""
+        return {
+            "attempt": self.attempt,
+            "timestamp": self.timestamp.isoformat(),
+            "status": self.status,
+            "error": self.error
+        }
+
+
 @dataclass
 class ApplicationResult:
     """Result of a job application submission"""
@@ -78,6 +254,61 @@ class ApplicationResult:
             self.metadata = {}
 
 
+@dataclass(slots=True, frozen=True)
+class SiteSelectors:
+    """Selectors for one job site, resolved once from its site config"""
+    login_url: Optional[str] = None
+    apply_selectors: Tuple[str, ...] = ()
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    resume_upload: Optional[str] = None
+    cover_letter: Optional[str] = None
+    submit_button: Optional[str] = None
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SiteSelectors":
+        form_selectors = config.get("form_selectors", {})
+        return cls(
+            login_url=config.get("login_url"),
+            apply_selectors=tuple(filter(None, (
+                config.get("easy_apply_selector"),
+                config.get("apply_button_selector")
+            ))),
+            first_name=form_selectors.get("first_name"),
+            last_name=form_selectors.get("last_name"),
+            email=form_selectors.get("email"),
+            phone=form_selectors.get("phone"),
+            resume_upload=form_selectors.get("resume_upload"),
+            cover_letter=form_selectors.get("cover_letter"),
+            submit_button=form_selectors.get("submit_button")
+        )
+    
+    def page_ready_selector(self) -> str:
+        """CSS selector present once a job page is usable: an apply button or a login form"""
+        if not self.apply_selectors:
+            return "body"
+        return ", ".join(self.apply_selectors + ("input[type='password']",))
+    
+    def form_ready_selector(self) -> str:
+        """CSS selector visible once the application form has opened"""
+        fields = tuple(filter(None, (
+            self.first_name, self.last_name, self.email,
+            self.phone, self.resume_upload, self.cover_letter
+        )))
+        return ", ".join(fields) if fields else "form input, form textarea"
+
+
+# Used for sites without a config: generic apply button selectors, no form selectors
+GENERIC_SITE_SELECTORS = SiteSelectors(
+    apply_selectors=(
+        "button[data-apply]", "a[data-apply]",
+        ".apply-button", ".apply-btn", "#apply-button"
+    )
+)
+
+
 @dataclass
 class ApplicationCredentials:
     """Credentials for job site login"""
@@ -102,6 +333,20 @@ class JobApplicationService:
         self.retry_attempts = 3
         self.retry_delay = 5  # seconds
         
+        # Upper bounds for explicit waits that replace fixed sleeps (seconds)
+        self.page_ready_timeout = 15
+        self.form_ready_timeout = 10
+        self.submission_timeout = 15
+        self.upload_timeout = 10
+        
+        # Pool of idle drivers shared by batch and standalone submissions
+        self._driver_pool: Optional[asyncio.Queue] = None
+        self._pool_drivers: List[webdriver.Chrome] = []
+        
+        # Resume files written once per service and reused across applications
+        self._resume_dir: Optional[str] = None
+        self._resume_path_cache: Dict[str, str] = {}
+        
         # Site-specific configurations
         self.site_configs = {
             JobSite.LINKEDIN: {
@@ -144,28 +389,57 @@ class JobApplicationService:
                 }
             }
         }
+        # Per-site selector bundles; sites without a config use GENERIC_SITE_SELECTORS
+        self._compiled_configs: Dict[JobSite, SiteSelectors] = {
+            site: SiteSelectors.from_config(config)
+            for site, config in self.site_configs.items()
+        }
+    
+    def _create_driver(self) -> Tuple[webdriver.Chrome, WebDriverWait]:
+        """Launch a Chrome WebDriver with appropriate options"""
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")  # Run in background
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        
+        # Only wait for the DOM to be interactive, not every subresource
+        chrome_options.page_load_strategy = "eager"
+        
+        for argument in CHROME_PERFORMANCE_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        
+        # Avoid automation banners that trigger bot detection and retries
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        
+        # Disable images, CSS and other heavy content for faster loading
+        prefs = {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.popups": 2,
+            "profile.managed_default_content_settings.geolocation": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+        
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        return driver, self._driver_wait(driver)
+    
+    def _driver_wait(self, driver: webdriver.Chrome) -> WebDriverWait:
+        """Default explicit wait for a driver"""
+        return WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_INTERVAL)
     
     async def initialize_driver(self) -> None:
         """Initialize Chrome WebDriver with appropriate options"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")  # Run in background
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-            
-            # Disable images and CSS for faster loading
-            prefs = {
-                "profile.managed_default_content_settings.images": 2,
-                "profile.default_content_setting_values.notifications": 2
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(self.page_load_timeout)
-            self.wait = WebDriverWait(self.driver, 10)
+            self.driver, self.wait = await self._run(self._create_driver)
+            self._ensure_resume_dir()
             
             logger.info("WebDriver initialized successfully")
             
@@ -173,17 +447,185 @@ class JobApplicationService:
             logger.error(f"Failed to initialize WebDriver: {str(e)}")
             raise
     
+    async def warm_pool(self, size: int = DEFAULT_DRIVER_POOL_SIZE) -> None:
+        """
+        Launch the shared pool of WebDrivers ahead of the submissions that will use them
+        
+        Browsers start in parallel and join the pool as soon as each is ready,
+        so acquire_driver can hand one out before the whole pool is up.
+        """
+        self._driver_pool = asyncio.Queue()
+        self._pool_drivers = []
+        self._ensure_resume_dir()
+        
+        try:
+            await self._launch_pool(self._driver_pool, self._pool_drivers, size)
+        except BaseException:
+            await self.cleanup_driver_pool()
+            raise
+        
+        logger.info(f"WebDriver pool initialized with {len(self._pool_drivers)} drivers")
+    
+    async def _launch_pool(
+        self,
+        pool: asyncio.Queue,
+        drivers: List[webdriver.Chrome],
+        size: int
+    ) -> None:
+        """Launch size browsers into pool, recording each in drivers as soon as it starts"""
+        def create_pooled_driver() -> webdriver.Chrome:
+            # Register from the launch thread so cleanup can always reach it
+            driver, _ = self._create_driver()
+            drivers.append(driver)
+            return driver
+        
+        async def launch() -> None:
+            driver = await self._run(create_pooled_driver)
+            pool.put_nowait(driver)
+        
+        launches = [asyncio.ensure_future(launch()) for _ in range(max(1, size))]
+        try:
+            outcomes = await asyncio.shield(asyncio.gather(*launches, return_exceptions=True))
+        except asyncio.CancelledError:
+            # Browsers already starting cannot be interrupted; let them finish so they can be quit
+            await asyncio.gather(*launches, return_exceptions=True)
+            raise
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if errors:
+            logger.error(f"Failed to initialize WebDriver pool: {str(errors[0])}")
+            raise errors[0]
+    
+    async def acquire_driver(self) -> Optional[webdriver.Chrome]:
+        """Take an idle driver from the shared pool, waiting for one if all are busy"""
+        return await self._driver_pool.get()
+    
+    def release_driver(self, driver: Optional[webdriver.Chrome]) -> None:
+        """Return a driver to the shared pool"""
+        self._driver_pool.put_nowait(driver)
+    
+    @asynccontextmanager
+    async def _pooled_worker(
+        self,
+        pool: asyncio.Queue,
+        drivers: List[webdriver.Chrome]
+    ) -> AsyncIterator["JobApplicationService"]:
+        """
+        Borrow a driver from pool, bound to a worker copy of this service
+        
+        The slot always goes back to the pool. If the worker's browser died and
+        could not be relaunched the slot goes back empty, and the next borrower
+        launches a fresh browser into it.
+        """
+        driver = await pool.get()
+        worker = self._bind_driver(driver)
+        try:
+            yield worker
+        finally:
+            try:
+                if worker.driver is not driver:
+                    if driver in drivers:
+                        drivers.remove(driver)
+                    if worker.driver:
+                        drivers.append(worker.driver)
+                # Keep the browser process, but not this application's session
+                if worker.driver:
+                    await worker._reset_browser_state()
+            finally:
+                pool.put_nowait(worker.driver)
+    
+    async def cleanup_driver_pool(self) -> None:
+        """Quit every driver in the shared pool"""
+        await self._quit_drivers(self._pool_drivers)
+        self._pool_drivers = []
+        self._driver_pool = None
+        self._cleanup_resume_files()
+    
+    async def _quit_drivers(self, drivers: List[webdriver.Chrome]) -> None:
+        """Quit pooled WebDrivers, logging rather than raising failures"""
+        for driver in list(drivers):
+            try:
+                await self._run(driver.quit)
+            except Exception as e:
+                logger.error(f"Error cleaning up pooled WebDriver: {str(e)}")
+    
+    def _ensure_resume_dir(self) -> str:
+        """Create the directory that holds resume files for upload"""
+        if not self._resume_dir:
+            self._resume_dir = tempfile.mkdtemp(prefix="job_application_resumes_")
+        return self._resume_dir
+    
+    def _cleanup_resume_files(self) -> None:
+        """Remove resume files written for uploads"""
+        if self._resume_dir:
+            shutil.rmtree(self._resume_dir, ignore_errors=True)
+        self._resume_dir = None
+        self._resume_path_cache.clear()
+    
+    def _resume_file_path(self, resume: ResumeData) -> str:
+        """Path of the resume on disk, written on first use"""
+        path = self._resume_path_cache.get(resume.id)
+        if path is None:
+            path = str(Path(self._ensure_resume_dir()) / f"{resume.id}.pdf")
+            Path(path).write_bytes(resume.file_content)
+            self._resume_path_cache[resume.id] = path
+        return path
+    
+    def _bind_driver(self, driver: Optional[webdriver.Chrome]) -> "JobApplicationService":
+        """Return a shallow copy of the service that drives the given browser
+        
+        The helpers all act on self.driver, so each concurrent batch task runs
+        on its own bound copy while sharing configuration with this service.
+        """
+        worker = copy.copy(self)
+        worker.driver = driver
+        worker.wait = self._driver_wait(driver) if driver else None
+        # A worker only ever drives its own browser, never another pooled one
+        worker._driver_pool = None
+        worker._pool_drivers = []
+        return worker
+    
     async def cleanup_driver(self) -> None:
         """Clean up WebDriver resources"""
         if self.driver:
             try:
-                self.driver.quit()
+                await self._run(self.driver.quit)
                 logger.info("WebDriver cleaned up successfully")
             except Exception as e:
                 logger.error(f"Error cleaning up WebDriver: {str(e)}")
             finally:
                 self.driver = None
                 self.wait = None
+        
+        self._cleanup_resume_files()
+    
+    async def _recover_driver(self) -> None:
+        """Restart Chrome only if the current browser session has died"""
+        if self.driver:
+            try:
+                await self._run(getattr, self.driver, "title")
+                return
+            except WebDriverException:
+                logger.warning("WebDriver session lost, restarting browser")
+                try:
+                    await self._run(self.driver.quit)
+                except Exception:
+                    pass
+                # Forget the dead session so a failed restart is retried on the next attempt
+                self.driver = None
+        
+        await self.initialize_driver()
+    
+    async def _reset_browser_state(self) -> None:
+        """Clear cookies, cache and storage so the next application starts clean"""
+        try:
+            await self._run(self.driver.delete_all_cookies)
+            await self._run(self.driver.execute_cdp_cmd, "Network.clearBrowserCache", {})
+            await self._run(
+                self.driver.execute_cdp_cmd,
+                "Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"}
+            )
+        except WebDriverException as e:
+            logger.warning(f"Error resetting browser state: {str(e)}")
     
     async def submit_application(
         self,
@@ -212,6 +654,13 @@ class JobApplicationService:
             metadata={"attempts": []}
         )
         
+        # Use a warm pooled browser when this service has no driver of its own
+        if not self.driver and self._driver_pool is not None:
+            async with self._pooled_worker(self._driver_pool, self._pool_drivers) as worker:
+                return await worker.submit_application(
+                    job, resume, cover_letter, user_preferences, credentials
+                )
+        
         for attempt in range(self.retry_attempts):
             try:
                 result.retry_count = attempt + 1
@@ -226,12 +675,9 @@ class JobApplicationService:
                 )
                 
                 # Log attempt details
-                result.metadata["attempts"].append({
-                    "attempt": attempt + 1,
-                    "timestamp": datetime.now().isoformat(),
-                    "status": attempt_result.status,
-                    "error": attempt_result.error_message
-                })
+                result.metadata["attempts"].append(AttemptRecord(
+                    attempt + 1, datetime.now(), attempt_result.status, attempt_result.error_message
+                ))
                 
                 # If successful, return result
                 if attempt_result.status == ApplicationStatus.SUBMITTED:
@@ -249,9 +695,10 @@ class JobApplicationService:
                     await asyncio.sleep(wait_time)
                     continue
                 
-                # If requires manual review, don't retry
-                if attempt_result.status == ApplicationStatus.REQUIRES_MANUAL_REVIEW:
-                    result.status = ApplicationStatus.REQUIRES_MANUAL_REVIEW
+                # If requires manual review or failed permanently, don't retry
+                if (attempt_result.status == ApplicationStatus.REQUIRES_MANUAL_REVIEW
+                        or attempt_result.error_type in _NON_RETRYABLE):
+                    result.status = attempt_result.status
                     result.error_message = attempt_result.error_message
                     result.error_type = attempt_result.error_type
                     return result
@@ -262,12 +709,19 @@ class JobApplicationService:
                 
             except Exception as e:
                 logger.error(f"Unexpected error in application attempt {attempt + 1}: {str(e)}")
-                result.metadata["attempts"].append({
-                    "attempt": attempt + 1,
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "error",
-                    "error": str(e)
-                })
+                result.metadata["attempts"].append(AttemptRecord(
+                    attempt + 1, datetime.now(), "error", str(e)
+                ))
+                
+                # Without a driver the launch itself failed; the next attempt starts one
+                if isinstance(e, WebDriverException) and self.driver:
+                    try:
+                        await self._recover_driver()
+                    except Exception as restart_error:
+                        logger.error(f"Failed to restart WebDriver after attempt {attempt + 1}: {str(restart_error)}")
+                        result.metadata["attempts"].append(AttemptRecord(
+                            attempt + 1, datetime.now(), "error", f"Driver restart failed: {restart_error}"
+                        ))
                 
                 if attempt < self.retry_attempts - 1:
                     await asyncio.sleep(self.retry_delay)
@@ -298,42 +752,43 @@ class JobApplicationService:
         try:
             # Navigate to job posting
             logger.info(f"Navigating to job URL: {job.job_url}")
-            self.driver.get(job.job_url)
+            await self._run(self.driver.get, job.job_url)
+            
+            # Wait for the apply button or a login form to appear
+            selectors = self._site_selectors(job.site)
+            await self._wait_until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selectors.page_ready_selector())),
+                self.page_ready_timeout
+            )
             
-            # Wait for page to load
-            await asyncio.sleep(2)
+            login_policy = LOGIN_CHECK_POLICY.get(job.site, "always")
             
             # Check if login is required
-            if await self._is_login_required():
-                if not credentials:
-                    result.status = ApplicationStatus.REQUIRES_MANUAL_REVIEW
-                    result.error_message = "Login required but no credentials provided"
-                    result.error_type = ApplicationError.LOGIN_REQUIRED
-                    return result
-                
-                # Perform login
-                login_success = await self._perform_login(credentials)
-                if not login_success:
-                    result.status = ApplicationStatus.FAILED
-                    result.error_message = "Login failed"
-                    result.error_type = ApplicationError.INVALID_CREDENTIALS
+            if login_policy == "always" and await self._is_login_required():
+                if not await self._login(credentials, result):
                     return result
             
             # Find and click apply button
-            apply_button = await self._find_apply_button(job.site)
-            if not apply_button:
+            form_opened = await self._open_application_form(job.site, selectors)
+            
+            # Guest-viewable sites redirect to login only once apply is clicked
+            if form_opened and login_policy == "after_apply_click" and await self._on_login_page():
+                if not await self._login(credentials, result):
+                    return result
+                
+                # Return to the posting signed in and apply again
+                await self._run(self.driver.get, job.job_url)
+                form_opened = await self._open_application_form(job.site, selectors)
+            
+            if not form_opened:
                 result.status = ApplicationStatus.REQUIRES_MANUAL_REVIEW
                 result.error_message = "Apply button not found"
                 result.error_type = ApplicationError.FORM_NOT_FOUND
                 return result
             
-            # Click apply button
-            self.driver.execute_script("arguments[0].click();", apply_button)
-            await asyncio.sleep(3)
-            
             # Fill application form
             form_filled = await self._fill_application_form(
-                job, resume, cover_letter, user_preferences
+                job, resume, cover_letter, user_preferences, selectors
             )
             
             if not form_filled:
@@ -347,7 +802,7 @@ class JobApplicationService:
             
             if submission_result["success"]:
                 result.status = ApplicationStatus.SUBMITTED
-                result.application_url = self.driver.current_url
+                result.application_url = submission_result.get("submitted_url")
                 result.confirmation_id = submission_result.get("confirmation_id")
                 result.submitted_at = datetime.now()
             else:
@@ -370,17 +825,78 @@ class JobApplicationService:
             result.error_type = ApplicationError.UNKNOWN_ERROR
             return result
     
+    async def _login(
+        self,
+        credentials: Optional[ApplicationCredentials],
+        result: ApplicationResult
+    ) -> bool:
+        """Log in to the job site, recording why on the result if that is not possible"""
+        if not credentials:
+            result.status = ApplicationStatus.REQUIRES_MANUAL_REVIEW
+            result.error_message = "Login required but no credentials provided"
+            result.error_type = ApplicationError.LOGIN_REQUIRED
+            return False
+        
+        # Perform login
+        if not await self._perform_login(credentials):
+            result.status = ApplicationStatus.FAILED
+            result.error_message = "Login failed"
+            result.error_type = ApplicationError.INVALID_CREDENTIALS
+            return False
+        
+        return True
+    
+    async def _open_application_form(self, site: JobSite, selectors: SiteSelectors) -> bool:
+        """Click the apply button and wait for the application form to show"""
+        apply_button = await self._find_apply_button(site, selectors)
+        if not apply_button:
+            return False
+        
+        await self._run(self.driver.execute_script, "arguments[0].click();", apply_button)
+        await self._wait_until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, selectors.form_ready_selector())),
+            self.form_ready_timeout
+        )
+        return True
+    
+    async def _on_login_page(self) -> bool:
+        """Check whether the browser has been sent to a login URL"""
+        url = (await self._run(getattr, self.driver, "current_url")).lower()
+        return any(token in url for token in LOGIN_URL_TOKENS)
+    
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking WebDriver call in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(fn, *args)
+    
+    async def _wait_until(self, condition: Any, timeout: float) -> bool:
+        """
+        Wait for a WebDriver condition without blocking the event loop
+        
+        Returns False if the condition did not hold within the timeout, in
+        which case the caller carries on as it would have after a fixed sleep.
+        """
+        try:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL)
+            await self._run(wait.until, condition)
+            return True
+        except TimeoutException:
+            logger.debug(f"Condition not met within {timeout}s, continuing")
+            return False
+    
     async def _is_login_required(self) -> bool:
         """Check if login is required on current page"""
         try:
-            # Common login indicators
-            login_indicators = [
-                "login", "sign in", "log in", "signin",
-                "authentication", "account", "password"
-            ]
+            # Most job pages are recognisable from the URL alone
+            url = (await self._run(getattr, self.driver, "current_url")).lower()
+            if any(token in url for token in LOGIN_URL_TOKENS):
+                return True
+            if any(token in url for token in JOB_URL_TOKENS):
+                return False
             
-            page_text = self.driver.page_source.lower()
-            return any(indicator in page_text for indicator in login_indicators)
+            # Evaluated in the browser so only a boolean crosses the driver bridge
+            return bool(await self._run(
+                self.driver.execute_script, _LOGIN_REQUIRED_JS, _LOGIN_INDICATOR_PATTERN
+            ))
             
         except Exception:
             return False
@@ -388,61 +904,52 @@ class JobApplicationService:
     async def _perform_login(self, credentials: ApplicationCredentials) -> bool:
         """Perform login to job site"""
         try:
-            site_config = self.site_configs.get(credentials.site)
-            if not site_config:
+            site_selectors = self._site_selectors(credentials.site)
+            if not site_selectors.login_url:
                 logger.error(f"No configuration found for site: {credentials.site}")
                 return False
             
             # Navigate to login page
-            self.driver.get(site_config["login_url"])
-            await asyncio.sleep(3)
+            await self._run(self.driver.get, site_selectors.login_url)
             
             # Find and fill username/email field
-            username_selectors = [
-                "input[name='username']", "input[name='email']", 
-                "input[type='email']", "input[id*='username']", "input[id*='email']"
-            ]
-            
-            username_field = None
-            for selector in username_selectors:
-                try:
-                    username_field = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not username_field:
+            try:
+                username_field = await self._run(
+                    self.wait.until,
+                    EC.presence_of_element_located((By.CSS_SELECTOR, USERNAME_FIELD_SELECTOR))
+                )
+            except TimeoutException:
                 logger.error("Username field not found")
                 return False
             
-            username_field.clear()
-            username_field.send_keys(credentials.username)
+            await self._run(username_field.clear)
+            await self._run(username_field.send_keys, credentials.username)
             
             # Find and fill password field
-            password_field = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']")))
-            password_field.clear()
-            password_field.send_keys(credentials.password)
+            password_field = await self._run(
+                self.wait.until,
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']"))
+            )
+            await self._run(password_field.clear)
+            await self._run(password_field.send_keys, credentials.password)
             
             # Find and click login button
-            login_button_selectors = [
-                "button[type='submit']", "input[type='submit']",
-                "button[id*='login']", "button[id*='signin']"
-            ]
-            
-            login_button = None
-            for selector in login_button_selectors:
-                try:
-                    login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if not login_button:
+            try:
+                login_button = await self._run(
+                    self.driver.find_element, By.CSS_SELECTOR, LOGIN_BUTTON_SELECTOR
+                )
+            except NoSuchElementException:
                 logger.error("Login button not found")
                 return False
             
-            login_button.click()
-            await asyncio.sleep(5)
+            login_url = await self._run(getattr, self.driver, "current_url")
+            await self._run(login_button.click)
+            
+            # Wait until the browser leaves the login form
+            await self._wait_until(
+                EC.any_of(EC.url_changes(login_url), EC.staleness_of(password_field)),
+                self.page_ready_timeout
+            )
             
             # Check if login was successful
             return not await self._is_login_required()
@@ -451,42 +958,33 @@ class JobApplicationService:
             logger.error(f"Login failed: {str(e)}")
             return False
     
-    async def _find_apply_button(self, site: JobSite) -> Optional[Any]:
+    def _site_selectors(self, site: JobSite) -> SiteSelectors:
+        """Resolve the selector bundle for a job site"""
+        return self._compiled_configs.get(site, GENERIC_SITE_SELECTORS)
+    
+    async def _find_apply_button(
+        self,
+        site: JobSite,
+        selectors: Optional[SiteSelectors] = None
+    ) -> Optional[Any]:
         """Find the apply button for the specific job site"""
         try:
-            site_config = self.site_configs.get(site)
-            if not site_config:
-                # Generic apply button selectors
-                selectors = [
-                    "button[data-apply]", "a[data-apply]",
-                    "button:contains('Apply')", "a:contains('Apply')",
-                    ".apply-button", ".apply-btn", "#apply-button"
-                ]
-            else:
-                selectors = [
-                    site_config.get("easy_apply_selector", ""),
-                    site_config.get("apply_button_selector", "")
-                ]
+            selectors = selectors or self._site_selectors(site)
             
-            for selector in selectors:
-                if not selector:
-                    continue
-                    
+            for selector in selectors.apply_selectors:
                 try:
-                    element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
+                    element = await self._run(
+                        self.wait.until, EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                    )
                     return element
                 except TimeoutException:
                     continue
             
             # Fallback: look for buttons/links with "apply" text
             try:
-                elements = self.driver.find_elements(By.XPATH, "//button[contains(translate(text(), 'APPLY', 'apply'), 'apply')] | //a[contains(translate(text(), 'APPLY', 'apply'), 'apply')]")
-                if elements:
-                    return elements[0]
+                return await self._run(self.driver.execute_script, _APPLY_TEXT_SEARCH_JS)
             except Exception:
-                pass
-            
-            return None
+                return None
             
         except Exception as e:
             logger.error(f"Error finding apply button: {str(e)}")
@@ -497,49 +995,40 @@ class JobApplicationService:
         job: JobPost,
         resume: ResumeData,
         cover_letter: CoverLetterResult,
-        user_preferences: UserPreferencesData
+        user_preferences: UserPreferencesData,
+        selectors: Optional[SiteSelectors] = None
     ) -> bool:
         """Fill out the application form with user data"""
         try:
-            site_config = self.site_configs.get(job.site, {})
-            form_selectors = site_config.get("form_selectors", {})
+            selectors = selectors or self._site_selectors(job.site)
             
             # Extract user info from preferences
             user_info = user_preferences.personal_info
             
-            # Fill basic information fields
-            form_fields = {
-                "first_name": user_info.get("first_name", ""),
-                "last_name": user_info.get("last_name", ""),
-                "email": user_info.get("email", ""),
-                "phone": user_info.get("phone", "")
-            }
+            # Basic information fields
+            form_fields = (
+                ("first_name", user_info.get("first_name", ""), selectors.first_name),
+                ("last_name", user_info.get("last_name", ""), selectors.last_name),
+                ("email", user_info.get("email", ""), selectors.email),
+                ("phone", user_info.get("phone", ""), selectors.phone)
+            )
+            fills = [
+                {"name": field_name, "value": value, "selectors": [selector]}
+                for field_name, value, selector in form_fields
+                if value and selector
+            ]
+            fills.extend(self._additional_field_fills(user_preferences))
             
-            for field_name, value in form_fields.items():
-                if not value:
-                    continue
-                    
-                selector = form_selectors.get(field_name)
-                if not selector:
-                    continue
-                
-                try:
-                    field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    field.clear()
-                    field.send_keys(value)
-                    logger.debug(f"Filled {field_name} field")
-                except NoSuchElementException:
-                    logger.debug(f"Field {field_name} not found")
-                    continue
+            # Fill all text fields in a single browser round-trip
+            if fills:
+                filled = await self._run(self.driver.execute_script, _FILL_FIELDS_JS, fills) or []
+                logger.debug(f"Filled {len(filled)}/{len(fills)} fields: {filled}")
             
-            # Upload resume
-            await self._upload_resume(resume, form_selectors.get("resume_upload"))
+            # Upload resume (file inputs still need send_keys)
+            await self._upload_resume(resume, selectors.resume_upload)
             
             # Fill cover letter
-            await self._fill_cover_letter(cover_letter, form_selectors.get("cover_letter"))
-            
-            # Fill additional fields if present
-            await self._fill_additional_fields(user_preferences)
+            await self._fill_cover_letter(cover_letter, selectors.cover_letter)
             
             return True
             
@@ -554,20 +1043,20 @@ class JobApplicationService:
             return False
         
         try:
-            # Create temporary file with resume content
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-                temp_file.write(resume.file_content)
-                temp_file_path = temp_file.name
+            # Reuse the resume file written for earlier applications
+            resume_path = self._resume_file_path(resume)
             
             # Find upload field
-            upload_field = self.driver.find_element(By.CSS_SELECTOR, upload_selector)
-            upload_field.send_keys(temp_file_path)
+            upload_field = await self._run(self.driver.find_element, By.CSS_SELECTOR, upload_selector)
+            await self._run(upload_field.send_keys, resume_path)
             
             # Wait for upload to complete
-            await asyncio.sleep(3)
-            
-            # Clean up temporary file
-            Path(temp_file_path).unlink(missing_ok=True)
+            await self._wait_until(
+                lambda driver: driver.execute_script(
+                    "return !document.querySelector(arguments[0]);", UPLOAD_PROGRESS_SELECTOR
+                ),
+                self.upload_timeout
+            )
             
             logger.debug("Resume uploaded successfully")
             return True
@@ -583,9 +1072,15 @@ class JobApplicationService:
             return False
         
         try:
-            textarea = self.driver.find_element(By.CSS_SELECTOR, textarea_selector)
-            textarea.clear()
-            textarea.send_keys(cover_letter.content.full_content)
+            # Set the value in one script call rather than sending it key by key
+            fill = {
+                "name": "cover_letter",
+                "value": cover_letter.content.full_content,
+                "selectors": [textarea_selector]
+            }
+            if not await self._run(self.driver.execute_script, _FILL_FIELDS_JS, [fill]):
+                logger.debug("Cover letter field not found")
+                return False
             
             logger.debug("Cover letter filled successfully")
             return True
@@ -594,70 +1089,54 @@ class JobApplicationService:
             logger.error(f"Error filling cover letter: {str(e)}")
             return False
     
-    async def _fill_additional_fields(self, user_preferences: UserPreferencesData) -> None:
-        """Fill additional form fields based on common patterns"""
-        try:
-            # Common additional fields
-            additional_fields = {
-                "linkedin": user_preferences.personal_info.get("linkedin_url", ""),
-                "portfolio": user_preferences.personal_info.get("portfolio_url", ""),
-                "website": user_preferences.personal_info.get("website_url", ""),
-                "github": user_preferences.personal_info.get("github_url", "")
-            }
-            
-            for field_name, value in additional_fields.items():
-                if not value:
-                    continue
-                
+    def _additional_field_fills(self, user_preferences: UserPreferencesData) -> List[Dict[str, Any]]:
+        """Build fills for additional form fields based on common patterns"""
+        # Common additional fields
+        additional_fields = {
+            "linkedin": user_preferences.personal_info.get("linkedin_url", ""),
+            "portfolio": user_preferences.personal_info.get("portfolio_url", ""),
+            "website": user_preferences.personal_info.get("website_url", ""),
+            "github": user_preferences.personal_info.get("github_url", "")
+        }
+        
+        return [
+            {
+                "name": field_name,
+                "value": value,
                 # Try to find field by various selectors
-                selectors = [
+                "selectors": [
                     f"input[name='{field_name}']",
                     f"input[id*='{field_name}']",
                     f"input[placeholder*='{field_name}']"
                 ]
-                
-                for selector in selectors:
-                    try:
-                        field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        field.clear()
-                        field.send_keys(value)
-                        logger.debug(f"Filled additional field: {field_name}")
-                        break
-                    except NoSuchElementException:
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error filling additional fields: {str(e)}")
+            }
+            for field_name, value in additional_fields.items()
+            if value
+        ]
     
     async def _submit_application_form(self) -> Dict[str, Any]:
         """Submit the filled application form"""
         try:
             # Find submit button
-            submit_selectors = [
-                "button[type='submit']",
-                "input[type='submit']",
-                "button[id*='submit']",
-                "button[class*='submit']",
-                "button:contains('Submit')",
-                "button:contains('Apply')"
-            ]
-            
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    submit_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if not submit_button:
+            try:
+                submit_button = await self._run(
+                    self.driver.find_element, By.CSS_SELECTOR, SUBMIT_BUTTON_SELECTOR
+                )
+            except NoSuchElementException:
                 return {"success": False, "error": "Submit button not found"}
             
             # Click submit button
-            self.driver.execute_script("arguments[0].click();", submit_button)
+            form_url = await self._run(getattr, self.driver, "current_url")
+            await self._run(self.driver.execute_script, "arguments[0].click();", submit_button)
             
             # Wait for submission to complete
-            await asyncio.sleep(5)
+            await self._wait_until(
+                lambda driver: (
+                    driver.current_url != form_url
+                    or driver.find_elements(By.CSS_SELECTOR, SUBMISSION_SUCCESS_SELECTOR)
+                ),
+                self.submission_timeout
+            )
             
             # Check for confirmation
             confirmation_id = await self._extract_confirmation_id()
@@ -665,7 +1144,7 @@ class JobApplicationService:
             return {
                 "success": True,
                 "confirmation_id": confirmation_id,
-                "submitted_url": self.driver.current_url
+                "submitted_url": await self._run(getattr, self.driver, "current_url")
             }
             
         except Exception as e:
@@ -675,23 +1154,7 @@ class JobApplicationService:
     async def _extract_confirmation_id(self) -> Optional[str]:
         """Extract confirmation ID from success page"""
         try:
-            # Common confirmation patterns
-            confirmation_patterns = [
-                r"confirmation[:\s]+([A-Z0-9-]+)",
-                r"application[:\s]+([A-Z0-9-]+)",
-                r"reference[:\s]+([A-Z0-9-]+)",
-                r"id[:\s]+([A-Z0-9-]+)"
-            ]
-            
-            page_text = self.driver.page_source
-            
-            import re
-            for pattern in confirmation_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-            
-            return None
+            return await self._run(self.driver.execute_script, _CONFIRMATION_JS, _CONFIRMATION_PATTERN)
             
         except Exception as e:
             logger.error(f"Error extracting confirmation ID: {str(e)}")
@@ -700,63 +1163,96 @@ class JobApplicationService:
     async def batch_submit_applications(
         self,
         applications: List[Dict[str, Any]],
-        credentials: Optional[Dict[JobSite, ApplicationCredentials]] = None
+        credentials: Optional[Dict[JobSite, ApplicationCredentials]] = None,
+        max_concurrency: int = DEFAULT_DRIVER_POOL_SIZE
     ) -> List[ApplicationResult]:
         """
         Submit multiple applications in batch with rate limiting
         
+        Applications run concurrently on a pool of browsers. Each job site is
+        throttled separately, so different sites proceed in parallel while
+        applications to the same site stay spaced out.
+        
         Args:
             applications: List of application data dictionaries
             credentials: Site credentials mapping
+            max_concurrency: Maximum number of browsers used at once
             
         Returns:
             List of ApplicationResult objects
         """
-        results = []
+        if not applications:
+            return []
         
-        try:
-            # Initialize driver once for batch
-            await self.initialize_driver()
-            
-            for i, app_data in enumerate(applications):
-                try:
-                    job = app_data["job"]
-                    resume = app_data["resume"]
-                    cover_letter = app_data["cover_letter"]
-                    user_preferences = app_data["user_preferences"]
-                    
-                    # Get credentials for this site
-                    site_credentials = None
-                    if credentials and job.site in credentials:
-                        site_credentials = credentials[job.site]
-                    
-                    logger.info(f"Submitting application {i+1}/{len(applications)} for job: {job.title}")
-                    
-                    # Submit application
-                    result = await self.submit_application(
-                        job, resume, cover_letter, user_preferences, site_credentials
-                    )
-                    
-                    results.append(result)
-                    
-                    # Rate limiting: wait between applications
-                    if i < len(applications) - 1:
-                        await asyncio.sleep(30)  # 30 seconds between applications
+        remaining_per_site: Dict[Any, int] = {}
+        for app_data in applications:
+            site = getattr(app_data.get("job"), "site", None)
+            remaining_per_site[site] = remaining_per_site.get(site, 0) + 1
+        site_slots: Dict[Any, asyncio.Semaphore] = {}
+        
+        async def run(i: int, app_data: Dict[str, Any]) -> ApplicationResult:
+            try:
+                job = app_data["job"]
+                resume = app_data["resume"]
+                cover_letter = app_data["cover_letter"]
+                user_preferences = app_data["user_preferences"]
+                
+                # Get credentials for this site
+                site_credentials = None
+                if credentials and job.site in credentials:
+                    site_credentials = credentials[job.site]
+                
+                slot = site_slots.setdefault(job.site, asyncio.Semaphore(SITE_CONCURRENCY))
+                async with slot:
+                    async with self._pooled_worker(pool, drivers) as worker:
+                        logger.info(f"Submitting application {i+1}/{len(applications)} for job: {job.title}")
+                        result = await worker.submit_application(
+                            job, resume, cover_letter, user_preferences, site_credentials
+                        )
                     
-                except Exception as e:
-                    logger.error(f"Error in batch application {i+1}: {str(e)}")
-                    results.append(ApplicationResult(
-                        job_id=app_data.get("job", {}).get("id", "unknown"),
-                        status=ApplicationStatus.FAILED,
-                        error_message=str(e),
-                        error_type=ApplicationError.UNKNOWN_ERROR
-                    ))
+                    # Rate limiting: space out applications to the same site
+                    remaining_per_site[job.site] -= 1
+                    if remaining_per_site[job.site] > 0:
+                        await asyncio.sleep(SITE_APPLICATION_INTERVAL)
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"Error in batch application {i+1}: {str(e)}")
+                return ApplicationResult(
+                    job_id=getattr(app_data.get("job"), "id", None) or "unknown",
+                    status=ApplicationStatus.FAILED,
+                    error_message=str(e),
+                    error_type=ApplicationError.UNKNOWN_ERROR
+                )
+        
+        # Reuse the pool warmed at startup, otherwise launch one owned by this
+        # batch alone so overlapping batches never quit each other's browsers
+        owns_pool = self._driver_pool is None
+        if owns_pool:
+            pool: asyncio.Queue = asyncio.Queue()
+            drivers: List[webdriver.Chrome] = []
+        else:
+            pool, drivers = self._driver_pool, self._pool_drivers
+        try:
+            if owns_pool:
+                self._ensure_resume_dir()
+                # Each site runs at most SITE_CONCURRENCY applications at once,
+                # so more browsers than that per site would only sit idle
+                await self._launch_pool(
+                    pool, drivers,
+                    min(max_concurrency, len(remaining_per_site) * SITE_CONCURRENCY)
+                )
+            results = await asyncio.gather(*(
+                run(i, app_data) for i, app_data in enumerate(applications)
+            ))
             
         finally:
-            # Clean up driver
-            await self.cleanup_driver()
+            # Clean up drivers
+            if owns_pool:
+                await self._quit_drivers(drivers)
         
-        return results
+        return list(results)
     
     async def get_application_status(self, application_url: str) -> Dict[str, Any]:
         """
@@ -769,36 +1265,20 @@ class JobApplicationService:
             Dictionary with status information
         """
         try:
-            if not self.driver:
-                await self.initialize_driver()
-            
-            self.driver.get(application_url)
-            await asyncio.sleep(3)
-            
-            # Look for status indicators
-            status_indicators = {
-                "submitted": ["submitted", "received", "under review"],
-                "viewed": ["viewed", "opened", "reviewed"],
-                "rejected": ["rejected", "declined", "not selected"],
-                "interview": ["interview", "phone screen", "next round"],
-                "offer": ["offer", "congratulations", "selected"]
-            }
-            
-            page_text = self.driver.page_source.lower()
+            if self.driver:
+                return await self._read_application_status(application_url)
             
-            for status, keywords in status_indicators.items():
-                if any(keyword in page_text for keyword in keywords):
-                    return {
-                        "status": status,
-                        "last_checked": datetime.now().isoformat(),
-                        "url": application_url
-                    }
+            # Never leave a browser on the shared service: borrow a pooled one,
+            # or launch one just for this check
+            if self._driver_pool is not None:
+                async with self._pooled_worker(self._driver_pool, self._pool_drivers) as worker:
+                    return await worker.get_application_status(application_url)
             
-            return {
-                "status": "unknown",
-                "last_checked": datetime.now().isoformat(),
-                "url": application_url
-            }
+            driver, _ = await self._run(self._create_driver)
+            try:
+                return await self._bind_driver(driver)._read_application_status(application_url)
+            finally:
+                await self._quit_drivers([driver])
             
         except Exception as e:
             logger.error(f"Error checking application status: {str(e)}")
@@ -807,4 +1287,34 @@ class JobApplicationService:
                 "error": str(e),
                 "last_checked": datetime.now().isoformat(),
                 "url": application_url
-            }
\ No newline at end of file
+            }
+    
+    async def _read_application_status(self, application_url: str) -> Dict[str, Any]:
+        """Load the application page in this service's browser and match its status"""
+        await self._run(self.driver.get, application_url)
+        await self._wait_until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "body")),
+            self.page_ready_timeout
+        )
+        
+        # Look for status indicators in a single pass over the page
+        page_text = (await self._run(getattr, self.driver, "page_source")).lower()
+        found = _find_statuses(page_text)
+        
+        for status, _ in APPLICATION_STATUS_INDICATORS:
+            if status in found:
+                return {
+                    "status": status,
+                    "last_checked": datetime.now().isoformat(),
+                    "url": application_url
+                }
+        
+        return {
+            "status": "unknown",
+            "last_checked": datetime.now().isoformat(),
+            "url": application_url
+        }
+
+
+# Global instance
+job_application_service = JobApplicationService()
@@ -2,8 +2,11 @@
 Job filtering service for applying user criteria and quality thresholds
 """
 import logging
-from typing import List, Dict, Any, Optional, Set, Tuple
-from datetime import datetime, timedelta
+from collections import Counter
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Iterable, NamedTuple, Optional, Set, Tuple
+from datetime import date, timedelta
 import re
 
 from app.models.job import JobPostData, JobMatchResult, JobSearchFilters
@@ -11,44 +14,259 @@ from app.models.preferences import UserPreferencesData
 
 logger = logging.getLogger(__name__)
 
+# Title phrases that mark a posting as likely spam
+SPAM_INDICATORS = (
+    "work from home", "make money fast", "no experience required",
+    "earn $", "guaranteed income", "pyramid", "mlm"
+)
+_SPAM_RE = re.compile("|".join(map(re.escape, SPAM_INDICATORS)), re.IGNORECASE)
+
+HOURS_PER_YEAR = 2080  # 40 hours * 52 weeks
+
+MAX_JOB_AGE_DAYS = 90
+_MAX_JOB_AGE = timedelta(days=MAX_JOB_AGE_DAYS)
+
+# Filter reasons that take no job-specific values
+REASON_ALREADY_APPLIED = "Already applied to this job"
+REASON_MISSING_TITLE = "Missing job title"
+REASON_MISSING_COMPANY = "Missing company name"
+REASON_SUSPICIOUS = "Job appears to be spam or low quality"
+REASON_NO_SALARY_INFO = "No salary information provided"
+REASON_NO_SALARY_RANGE = "No salary range specified"
+REASON_NO_LOCATION = "No location information provided"
+REASON_NO_DESCRIPTION = "No job description to check required keywords"
+REASON_SALARY_BELOW_MIN = "Salary below minimum threshold"
+REASON_SALARY_ABOVE_MAX = "Salary above maximum threshold"
+
+# Multipliers converting a compensation interval to an annual amount
+_ANNUAL_MULTIPLIERS = {
+    "hourly": HOURS_PER_YEAR,
+    "daily": 260,    # ~260 working days
+    "weekly": 52,
+    "monthly": 12,
+    "yearly": 1
+}
+
+
+class KeywordScanner:
+    """
+    Find which of a fixed set of keywords occur in a text in a single pass
+    
+    Keywords are tried longest first and the search resumes one character
+    after each match start, so overlapping keywords are still found; a
+    match also implies every shorter keyword that is a prefix of it ("java"
+    inside "javascript"). This reports the same hits as checking each
+    keyword with `in`, but scans the text once.
+    """
+    
+    __slots__ = ("_pattern", "_implied", "_total")
+    
+    def __init__(self, keywords: Iterable[str]):
+        ordered = sorted({keyword for keyword in keywords if keyword}, key=len, reverse=True)
+        self._pattern = (
+            re.compile("|".join(map(re.escape, ordered)))
+            if ordered else None
+        )
+        self._implied = {
+            keyword: frozenset(other for other in ordered if keyword.startswith(other))
+            for keyword in ordered
+        }
+        self._total = len(ordered)
+    
+    def contains_any(self, text: Optional[str]) -> bool:
+        """Whether any keyword occurs in the (already lowercased) text"""
+        return self._pattern is not None and bool(text) and self._pattern.search(text) is not None
+    
+    def scan(self, text: Optional[str]) -> Set[str]:
+        """Return the keywords that occur in the (already lowercased) text"""
+        hits: Set[str] = set()
+        if self._pattern is None or not text:
+            return hits
+        search = self._pattern.search
+        match = search(text)
+        while match is not None:
+            hits |= self._implied[match.group()]
+            if len(hits) == self._total:
+                break
+            match = search(text, match.start() + 1)
+        return hits
+
+
+@lru_cache(maxsize=64)
+def _keyword_scanner(*keyword_sets: FrozenSet[str]) -> KeywordScanner:
+    """Scanner for the union of one preference set's keyword lists"""
+    return KeywordScanner(frozenset().union(*keyword_sets))
+
+
+class Lowered(NamedTuple):
+    """A job's short text fields lowercased once for every filter that compares them"""
+    title: str
+    company: str
+    industry: str
+    location: str
+    
+    @classmethod
+    def from_job(cls, job: JobPostData) -> "Lowered":
+        return cls(
+            title=(job.title or "").lower(),
+            company=(job.company_name or "").lower(),
+            industry=(job.company_industry or "").lower(),
+            location=(job.location.display_location or "").lower() if job.location else ""
+        )
+
+
+class KeywordHits(NamedTuple):
+    """Preference keywords found in a job's title and description"""
+    title: Set[str]
+    description: Set[str]
+
+
+class _PreferencesKey(NamedTuple):
+    """Hashable snapshot of the preference fields the filters read"""
+    excluded_companies: Tuple[str, ...]
+    excluded_industries: Tuple[str, ...]
+    excluded_keywords: Tuple[str, ...]
+    required_keywords: Tuple[str, ...]
+    locations: Tuple[str, ...]
+    employment_types: Tuple[str, ...]
+    remote_work_preference: bool
+    salary_range: Optional[Tuple[Optional[int], Optional[int]]]
+    additional_excluded_keywords: Tuple[str, ...]
+    additional_required_keywords: Tuple[str, ...]
+    
+    @classmethod
+    def from_preferences(
+        cls,
+        user_preferences: UserPreferencesData,
+        additional_filters: Optional[JobSearchFilters] = None
+    ) -> "_PreferencesKey":
+        salary_range = user_preferences.salary_range
+        return cls(
+            excluded_companies=tuple(user_preferences.excluded_companies),
+            excluded_industries=tuple(user_preferences.excluded_industries),
+            excluded_keywords=tuple(user_preferences.excluded_keywords),
+            required_keywords=tuple(user_preferences.required_keywords),
+            locations=tuple(user_preferences.locations),
+            employment_types=tuple(pt.value for pt in user_preferences.employment_types),
+            remote_work_preference=user_preferences.remote_work_preference,
+            salary_range=(salary_range.min_salary, salary_range.max_salary) if salary_range else None,
+            additional_excluded_keywords=tuple(additional_filters.excluded_keywords) if additional_filters else (),
+            additional_required_keywords=tuple(additional_filters.required_keywords) if additional_filters else ()
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedPrefs:
+    """User preferences normalized for the per-job filters"""
+    excluded_companies: FrozenSet[str]
+    excluded_industries: FrozenSet[str]
+    company_scanner: KeywordScanner
+    industry_scanner: KeywordScanner
+    excluded_keywords: Tuple[str, ...]
+    required_keywords: Tuple[str, ...]
+    # Each preferred location lowercased, with its comma-separated parts
+    locations: Tuple[Tuple[str, FrozenSet[str]], ...]
+    employment_types: Tuple[str, ...]
+    remote_work_preference: bool
+    salary_range: Optional[Tuple[Optional[int], Optional[int]]]
+    scanner: KeywordScanner
+    
+    @classmethod
+    def from_preferences(
+        cls,
+        user_preferences: UserPreferencesData,
+        additional_filters: Optional[JobSearchFilters] = None,
+        location_hits: Optional[Counter] = None
+    ) -> "_PreparedPrefs":
+        prefs = _compile_preferences(_PreferencesKey.from_preferences(user_preferences, additional_filters))
+        if location_hits and len(prefs.locations) > 1:
+            # Most frequently matched locations first; ties keep the user's order
+            prefs = replace(
+                prefs,
+                locations=tuple(sorted(prefs.locations, key=lambda location: -location_hits[location[0]]))
+            )
+        return prefs
+
+
+def _location_parts(location: str) -> FrozenSet[str]:
+    """City/state/country parts of a comma-separated location"""
+    return frozenset(part.strip() for part in location.split(','))
+
+
+@lru_cache(maxsize=64)
+def _compile_preferences(key: _PreferencesKey) -> _PreparedPrefs:
+    """
+    Normalize one preference set; cached so repeated batches for the same
+    preferences (scheduled scrapes) reuse it, and edited preferences get a
+    new key
+    """
+    excluded_keywords = tuple(keyword.lower() for keyword in key.excluded_keywords)
+    required_keywords = tuple(keyword.lower() for keyword in key.required_keywords)
+    excluded_companies = frozenset(company.lower() for company in key.excluded_companies)
+    excluded_industries = frozenset(industry.lower() for industry in key.excluded_industries)
+    # One scanner covers the additional filters' keywords as well, so a
+    # job's description is scanned once for every keyword list
+    scanned_excluded = frozenset(excluded_keywords).union(key.additional_excluded_keywords)
+    scanned_required = frozenset(required_keywords).union(key.additional_required_keywords)
+    return _PreparedPrefs(
+        excluded_companies=excluded_companies,
+        excluded_industries=excluded_industries,
+        company_scanner=_keyword_scanner(excluded_companies),
+        industry_scanner=_keyword_scanner(excluded_industries),
+        excluded_keywords=excluded_keywords,
+        required_keywords=required_keywords,
+        locations=tuple(
+            (location.lower(), _location_parts(location.lower()))
+            for location in key.locations
+        ),
+        employment_types=key.employment_types,
+        remote_work_preference=key.remote_work_preference,
+        salary_range=key.salary_range,
+        scanner=_keyword_scanner(scanned_excluded, scanned_required)
+    )
+
+
+@lru_cache(maxsize=16)
+def _annual_mult(interval_value: str) -> float:
+    """Multiplier converting a salary paid per interval to an annual amount"""
+    return _ANNUAL_MULTIPLIERS.get(interval_value, 1.0)
+
 
 class JobFilteringService:
     """Service for filtering jobs based on user criteria and quality thresholds"""
     
     def __init__(self):
-        pass
+        # How often each preferred location matched, across batches
+        self._location_hits: Counter = Counter()
     
     def apply_filters(
         self, 
         jobs: List[JobPostData],
         user_preferences: UserPreferencesData,
-        applied_job_urls: Set[str] = None,
+        applied_job_urls: Optional[Iterable[str]] = None,
         additional_filters: Optional[JobSearchFilters] = None
     ) -> List[JobMatchResult]:
         """Apply comprehensive filtering to job list"""
         try:
-            applied_urls = applied_job_urls or set()
-            results = []
+            applied_urls = frozenset(applied_job_urls or ())
+            today = date.today()
+            prefs = _PreparedPrefs.from_preferences(
+                user_preferences, additional_filters, self._location_hits
+            )
             
+            results = []
             for job in jobs:
-                # Create base match result
-                match_result = JobMatchResult(
+                # Apply filters
+                reason = self._apply_all_filters(
+                    job, prefs, applied_urls, additional_filters, today
+                )
+                results.append(JobMatchResult(
                     job=job,
                     match_score=0.0,  # Will be calculated later
                     match_reasons=[],
-                    filtered_out=False,
-                    filter_reasons=[]
-                )
-                
-                # Apply filters
-                filter_results = self._apply_all_filters(
-                    job, user_preferences, applied_urls, additional_filters
-                )
-                
-                match_result.filtered_out = filter_results["filtered_out"]
-                match_result.filter_reasons = filter_results["reasons"]
-                
-                results.append(match_result)
+                    filtered_out=reason is not None,
+                    filter_reasons=[reason] if reason is not None else []
+                ))
             
             filtered_count = sum(1 for r in results if r.filtered_out)
             logger.info(f"Filtered {filtered_count} out of {len(jobs)} jobs")
@@ -66,142 +284,124 @@ class JobFilteringService:
     def _apply_all_filters(
         self, 
         job: JobPostData,
-        user_preferences: UserPreferencesData,
-        applied_urls: Set[str],
-        additional_filters: Optional[JobSearchFilters]
-    ) -> Dict[str, Any]:
-        """Apply all filters to a single job"""
-        reasons = []
-        
+        prefs: _PreparedPrefs,
+        applied_urls: FrozenSet[str],
+        additional_filters: Optional[JobSearchFilters],
+        today: date
+    ) -> Optional[str]:
+        """
+        Apply all filters to a single job, returning the reason it was
+        filtered out or None if it passed
+        
+        Filters run cheapest first so that most rejected jobs never reach
+        the keyword scans over the (often multi-kilobyte) description.
+        """
         # Check if already applied
         if job.job_url in applied_urls:
-            reasons.append("Already applied to this job")
-            return {"filtered_out": True, "reasons": reasons}
-        
-        # Apply exclusion filters
-        exclusion_result = self._apply_exclusion_filters(job, user_preferences)
-        if exclusion_result["filtered_out"]:
-            reasons.extend(exclusion_result["reasons"])
-            return {"filtered_out": True, "reasons": reasons}
+            return REASON_ALREADY_APPLIED
         
         # Apply quality filters
-        quality_result = self._apply_quality_filters(job)
-        if quality_result["filtered_out"]:
-            reasons.extend(quality_result["reasons"])
-            return {"filtered_out": True, "reasons": reasons}
-        
-        # Apply salary filters
-        salary_result = self._apply_salary_filters(job, user_preferences)
-        if salary_result["filtered_out"]:
-            reasons.extend(salary_result["reasons"])
-            return {"filtered_out": True, "reasons": reasons}
-        
-        # Apply location filters
-        location_result = self._apply_location_filters(job, user_preferences)
-        if location_result["filtered_out"]:
-            reasons.extend(location_result["reasons"])
-            return {"filtered_out": True, "reasons": reasons}
-        
-        # Apply employment type filters
-        employment_result = self._apply_employment_type_filters(job, user_preferences)
-        if employment_result["filtered_out"]:
-            reasons.extend(employment_result["reasons"])
-            return {"filtered_out": True, "reasons": reasons}
+        reason = self._apply_quality_filters(job, today)
+        if reason is not None:
+            return reason
+        
+        # Apply employment type, location, salary and exclusion filters
+        lowered = Lowered.from_job(job)
+        for apply_filter in self._FILTER_CHAIN:
+            reason = apply_filter(self, job, lowered, prefs)
+            if reason is not None:
+                return reason
+        
+        # Check excluded keywords in the title before scanning the description
+        title_hits = prefs.scanner.scan(lowered.title)
+        reason = self._apply_excluded_keyword_filters(prefs, title_hits, in_title=True)
+        if reason is not None:
+            return reason
+        
+        # The description is only lowercased here, once every cheaper filter has passed
+        keyword_hits = KeywordHits(
+            title=title_hits,
+            description=prefs.scanner.scan(job.description.lower() if job.description else None)
+        )
         
         # Apply keyword filters
-        keyword_result = self._apply_keyword_filters(job, user_preferences)
-        if keyword_result["filtered_out"]:
-            reasons.extend(keyword_result["reasons"])
-            return {"filtered_out": True, "reasons": reasons}
+        reason = self._apply_keyword_filters(job, prefs, keyword_hits)
+        if reason is not None:
+            return reason
+        
+        # Check excluded keywords in the description
+        reason = self._apply_excluded_keyword_filters(
+            prefs, keyword_hits.description, in_title=False
+        )
+        if reason is not None:
+            return reason
         
         # Apply additional filters if provided
         if additional_filters:
-            additional_result = self._apply_additional_filters(job, additional_filters)
-            if additional_result["filtered_out"]:
-                reasons.extend(additional_result["reasons"])
-                return {"filtered_out": True, "reasons": reasons}
+            return self._apply_additional_filters(job, additional_filters, keyword_hits.description)
         
-        return {"filtered_out": False, "reasons": []}
+        return None
     
     def _apply_exclusion_filters(
         self, 
         job: JobPostData, 
-        user_preferences: UserPreferencesData
-    ) -> Dict[str, Any]:
-        """Apply exclusion filters (companies, industries, keywords)"""
-        reasons = []
-        
-        # Check excluded companies
-        if user_preferences.excluded_companies and job.company_name:
-            company_lower = job.company_name.lower()
-            for excluded in user_preferences.excluded_companies:
-                if excluded.lower() in company_lower:
-                    reasons.append(f"Company '{job.company_name}' is in excluded list")
-                    return {"filtered_out": True, "reasons": reasons}
+        lowered: Lowered,
+        prefs: _PreparedPrefs
+    ) -> Optional[str]:
+        """Apply exclusion filters (companies, industries)"""
+        # Check excluded companies (exact name first, then as part of the name)
+        if prefs.excluded_companies and lowered.company:
+            if (lowered.company in prefs.excluded_companies
+                    or prefs.company_scanner.contains_any(lowered.company)):
+                return f"Company '{job.company_name}' is in excluded list"
         
         # Check excluded industries
-        if user_preferences.excluded_industries and job.company_industry:
-            industry_lower = job.company_industry.lower()
-            for excluded in user_preferences.excluded_industries:
-                if excluded.lower() in industry_lower:
-                    reasons.append(f"Industry '{job.company_industry}' is in excluded list")
-                    return {"filtered_out": True, "reasons": reasons}
-        
-        # Check excluded keywords in description
-        if user_preferences.excluded_keywords and job.description:
-            description_lower = job.description.lower()
-            for keyword in user_preferences.excluded_keywords:
-                if keyword in description_lower:
-                    reasons.append(f"Contains excluded keyword '{keyword}'")
-                    return {"filtered_out": True, "reasons": reasons}
-        
-        # Check excluded keywords in title
-        if user_preferences.excluded_keywords and job.title:
-            title_lower = job.title.lower()
-            for keyword in user_preferences.excluded_keywords:
-                if keyword in title_lower:
-                    reasons.append(f"Job title contains excluded keyword '{keyword}'")
-                    return {"filtered_out": True, "reasons": reasons}
-        
-        return {"filtered_out": False, "reasons": []}
+        if prefs.excluded_industries and lowered.industry:
+            if (lowered.industry in prefs.excluded_industries
+                    or prefs.industry_scanner.contains_any(lowered.industry)):
+                return f"Industry '{job.company_industry}' is in excluded list"
+        
+        return None
     
-    def _apply_quality_filters(self, job: JobPostData) -> Dict[str, Any]:
+    def _apply_excluded_keyword_filters(
+        self,
+        prefs: _PreparedPrefs,
+        hits: Set[str],
+        in_title: bool
+    ) -> Optional[str]:
+        """Apply excluded keyword filters to the keywords found in the title or description"""
+        if hits:
+            for keyword in prefs.excluded_keywords:
+                if keyword in hits:
+                    if in_title:
+                        return f"Job title contains excluded keyword '{keyword}'"
+                    return f"Contains excluded keyword '{keyword}'"
+        
+        return None
+    
+    def _apply_quality_filters(self, job: JobPostData, today: date) -> Optional[str]:
         """Apply quality-based filters"""
-        reasons = []
-        
         # Filter out jobs with missing critical information
         if not job.title or job.title.strip() == "":
-            reasons.append("Missing job title")
-            return {"filtered_out": True, "reasons": reasons}
+            return REASON_MISSING_TITLE
         
         if not job.company_name or job.company_name.strip() == "":
-            reasons.append("Missing company name")
-            return {"filtered_out": True, "reasons": reasons}
+            return REASON_MISSING_COMPANY
         
         # Filter out very old job postings (older than 90 days)
-        if job.date_posted:
-            days_old = (datetime.now().date() - job.date_posted).days
-            if days_old > 90:
-                reasons.append(f"Job posting is too old ({days_old} days)")
-                return {"filtered_out": True, "reasons": reasons}
+        if job.date_posted and job.date_posted < today - _MAX_JOB_AGE:
+            return f"Job posting is too old ({(today - job.date_posted).days} days)"
         
         # Filter out jobs with suspicious characteristics
         if self._is_suspicious_job(job):
-            reasons.append("Job appears to be spam or low quality")
-            return {"filtered_out": True, "reasons": reasons}
+            return REASON_SUSPICIOUS
         
-        return {"filtered_out": False, "reasons": []}
+        return None
     
     def _is_suspicious_job(self, job: JobPostData) -> bool:
         """Check if job has suspicious characteristics"""
         # Check for spam indicators in title
-        spam_indicators = [
-            "work from home", "make money fast", "no experience required",
-            "earn $", "guaranteed income", "pyramid", "mlm"
-        ]
-        
-        title_lower = job.title.lower()
-        if any(indicator in title_lower for indicator in spam_indicators):
+        if _SPAM_RE.search(job.title):
             return True
         
         # Check for unrealistic salary ranges
@@ -211,8 +411,8 @@ class JobFilteringService:
             
             # Convert to annual if needed
             if job.compensation.interval and job.compensation.interval.value == "hourly":
-                min_amount *= 2080
-                max_amount *= 2080
+                min_amount *= HOURS_PER_YEAR
+                max_amount *= HOURS_PER_YEAR
             
             # Flag unrealistic salaries
             if min_amount > 500000 or max_amount > 1000000:  # Very high salaries
@@ -221,40 +421,41 @@ class JobFilteringService:
             if max_amount > 0 and min_amount > 0 and (max_amount / min_amount) > 5:  # Huge range
                 return True
         
-        # Check for missing description
-        if not job.description or len(job.description.strip()) < 50:
+        # Check for missing description. A description that does not start or
+        # end with whitespace strips to itself, so only short or padded ones
+        # need the copy made by strip()
+        description = job.description
+        if not description:
             return True
+        if len(description) < 50 or description[0].isspace() or description[-1].isspace():
+            return len(description.strip()) < 50
         
         return False
     
     def _apply_salary_filters(
         self, 
         job: JobPostData, 
-        user_preferences: UserPreferencesData
-    ) -> Dict[str, Any]:
+        lowered: Lowered,
+        prefs: _PreparedPrefs
+    ) -> Optional[str]:
         """Apply salary-based filters"""
-        reasons = []
-        
-        if not user_preferences.salary_range:
-            return {"filtered_out": False, "reasons": []}
+        if not prefs.salary_range:
+            return None
+        user_min, user_max = prefs.salary_range
         
         if not job.compensation:
             # If user has salary requirements but job has no salary info, filter out
-            if user_preferences.salary_range.min_salary:
-                reasons.append("No salary information provided")
-                return {"filtered_out": True, "reasons": reasons}
-            return {"filtered_out": False, "reasons": []}
+            if user_min:
+                return REASON_NO_SALARY_INFO
+            return None
         
         job_min = job.compensation.min_amount
         job_max = job.compensation.max_amount
-        user_min = user_preferences.salary_range.min_salary
-        user_max = user_preferences.salary_range.max_salary
         
         if not job_min and not job_max:
             if user_min:
-                reasons.append("No salary range specified")
-                return {"filtered_out": True, "reasons": reasons}
-            return {"filtered_out": False, "reasons": []}
+                return REASON_NO_SALARY_RANGE
+            return None
         
         # Convert to annual
         annual_multiplier = self._get_annual_multiplier(job.compensation.interval)
@@ -267,129 +468,117 @@ class JobFilteringService:
         if user_min:
             job_salary = job_max or job_min  # Use max if available, otherwise min
             if job_salary and job_salary < user_min * 0.8:  # Allow 20% flexibility
-                reasons.append(f"Salary too low (${job_salary:,.0f} < ${user_min:,.0f})")
-                return {"filtered_out": True, "reasons": reasons}
+                return f"Salary too low (${job_salary:,.0f} < ${user_min:,.0f})"
         
         # Check maximum salary (if user has a strict upper limit)
         if user_max and job_min and job_min > user_max * 1.5:  # Allow 50% flexibility upward
-            reasons.append(f"Salary too high (${job_min:,.0f} > ${user_max * 1.5:,.0f})")
-            return {"filtered_out": True, "reasons": reasons}
+            return f"Salary too high (${job_min:,.0f} > ${user_max * 1.5:,.0f})"
         
-        return {"filtered_out": False, "reasons": []}
+        return None
     
     def _apply_location_filters(
         self, 
         job: JobPostData, 
-        user_preferences: UserPreferencesData
-    ) -> Dict[str, Any]:
+        lowered: Lowered,
+        prefs: _PreparedPrefs
+    ) -> Optional[str]:
         """Apply location-based filters"""
-        reasons = []
-        
         # If user prefers remote and job is remote, always pass
-        if user_preferences.remote_work_preference and job.is_remote:
-            return {"filtered_out": False, "reasons": []}
+        if prefs.remote_work_preference and job.is_remote:
+            return None
         
         # If user has no location preferences, pass
-        if not user_preferences.locations:
-            return {"filtered_out": False, "reasons": []}
+        if not prefs.locations:
+            return None
         
         # If job has no location info, filter out if user has location preferences
         if not job.location or not job.location.display_location:
             if not job.is_remote:  # Remote jobs without location are OK
-                reasons.append("No location information provided")
-                return {"filtered_out": True, "reasons": reasons}
-            return {"filtered_out": False, "reasons": []}
+                return REASON_NO_LOCATION
+            return None
         
         # Check if job location matches user preferences
-        job_location_lower = job.location.display_location.lower()
+        job_location_lower = lowered.location
+        job_parts = _location_parts(job_location_lower)
         
-        for preferred_location in user_preferences.locations:
-            preferred_lower = preferred_location.lower()
-            
+        for preferred_lower, pref_parts in prefs.locations:
             # Exact match or substring match
             if (preferred_lower in job_location_lower or 
                 job_location_lower in preferred_lower):
-                return {"filtered_out": False, "reasons": []}
+                self._location_hits[preferred_lower] += 1
+                return None
             
             # Check city/state matching
-            job_parts = [part.strip() for part in job_location_lower.split(',')]
-            pref_parts = [part.strip() for part in preferred_lower.split(',')]
-            
-            if any(jp in pref_parts for jp in job_parts):
-                return {"filtered_out": False, "reasons": []}
+            if not job_parts.isdisjoint(pref_parts):
+                self._location_hits[preferred_lower] += 1
+                return None
         
         # If no location match found
-        if not user_preferences.remote_work_preference or not job.is_remote:
-            reasons.append(f"Location '{job.location.display_location}' not in preferred locations")
-            return {"filtered_out": True, "reasons": reasons}
+        if not prefs.remote_work_preference or not job.is_remote:
+            return f"Location '{job.location.display_location}' not in preferred locations"
         
-        return {"filtered_out": False, "reasons": []}
+        return None
     
     def _apply_employment_type_filters(
         self, 
         job: JobPostData, 
-        user_preferences: UserPreferencesData
-    ) -> Dict[str, Any]:
+        lowered: Lowered,
+        prefs: _PreparedPrefs
+    ) -> Optional[str]:
         """Apply employment type filters"""
-        reasons = []
-        
-        if not user_preferences.employment_types:
-            return {"filtered_out": False, "reasons": []}
+        if not prefs.employment_types:
+            return None
         
         if not job.job_type:
-            return {"filtered_out": False, "reasons": []}  # Neutral if no job type info
+            return None  # Neutral if no job type info
         
         # Convert job types to comparable format
         job_types_str = [jt.value for jt in job.job_type]
-        pref_types_str = [pt.value for pt in user_preferences.employment_types]
         
         # Check for matches
         for job_type in job_types_str:
-            if job_type in pref_types_str:
-                return {"filtered_out": False, "reasons": []}
+            if job_type in prefs.employment_types:
+                return None
         
         # No employment type match
-        reasons.append(f"Employment type {job_types_str} not in preferences {pref_types_str}")
-        return {"filtered_out": True, "reasons": reasons}
+        return f"Employment type {job_types_str} not in preferences {list(prefs.employment_types)}"
     
     def _apply_keyword_filters(
         self, 
         job: JobPostData, 
-        user_preferences: UserPreferencesData
-    ) -> Dict[str, Any]:
+        prefs: _PreparedPrefs,
+        keyword_hits: KeywordHits
+    ) -> Optional[str]:
         """Apply required keyword filters"""
-        reasons = []
-        
-        if not user_preferences.required_keywords:
-            return {"filtered_out": False, "reasons": []}
+        if not prefs.required_keywords:
+            return None
         
         if not job.description:
-            reasons.append("No job description to check required keywords")
-            return {"filtered_out": True, "reasons": reasons}
-        
-        description_lower = job.description.lower()
-        title_lower = job.title.lower()
+            return REASON_NO_DESCRIPTION
         
         # Check if all required keywords are present
-        missing_keywords = []
-        for keyword in user_preferences.required_keywords:
-            if keyword not in description_lower and keyword not in title_lower:
-                missing_keywords.append(keyword)
+        missing_keywords = [
+            keyword for keyword in prefs.required_keywords
+            if keyword not in keyword_hits.description and keyword not in keyword_hits.title
+        ]
         
         if missing_keywords:
-            reasons.append(f"Missing required keywords: {', '.join(missing_keywords)}")
-            return {"filtered_out": True, "reasons": reasons}
+            return f"Missing required keywords: {', '.join(missing_keywords)}"
         
-        return {"filtered_out": False, "reasons": []}
+        return None
     
     def _apply_additional_filters(
         self, 
         job: JobPostData, 
-        filters: JobSearchFilters
-    ) -> Dict[str, Any]:
-        """Apply additional custom filters"""
-        reasons = []
-        
+        filters: JobSearchFilters,
+        description_hits: Set[str]
+    ) -> Optional[str]:
+        """
+        Apply additional custom filters
+        
+        description_hits are the filter keywords found in the job description
+        by the batch's keyword scanner.
+        """
         # Apply minimum match score filter (if match score is available)
         # This would typically be applied after match score calculation
         
@@ -401,8 +590,7 @@ class JobFilteringService:
                 job_salary_annual = job_salary * annual_multiplier
                 
                 if job_salary_annual < filters.min_salary:
-                    reasons.append(f"Salary below minimum threshold")
-                    return {"filtered_out": True, "reasons": reasons}
+                    return REASON_SALARY_BELOW_MIN
         
         if filters.max_salary and job.compensation:
             job_salary = job.compensation.min_amount or job.compensation.max_amount
@@ -411,40 +599,36 @@ class JobFilteringService:
                 job_salary_annual = job_salary * annual_multiplier
                 
                 if job_salary_annual > filters.max_salary:
-                    reasons.append(f"Salary above maximum threshold")
-                    return {"filtered_out": True, "reasons": reasons}
+                    return REASON_SALARY_ABOVE_MAX
         
         # Apply custom keyword filters
         if filters.required_keywords and job.description:
-            description_lower = job.description.lower()
             for keyword in filters.required_keywords:
-                if keyword not in description_lower:
-                    reasons.append(f"Missing required keyword: {keyword}")
-                    return {"filtered_out": True, "reasons": reasons}
+                if keyword not in description_hits:
+                    return f"Missing required keyword: {keyword}"
         
         if filters.excluded_keywords and job.description:
-            description_lower = job.description.lower()
             for keyword in filters.excluded_keywords:
-                if keyword in description_lower:
-                    reasons.append(f"Contains excluded keyword: {keyword}")
-                    return {"filtered_out": True, "reasons": reasons}
+                if keyword in description_hits:
+                    return f"Contains excluded keyword: {keyword}"
         
-        return {"filtered_out": False, "reasons": []}
+        return None
+    
+    # Filters run in this order after the quality filters; each takes
+    # (job, lowered, prefs) and returns a reason or None
+    _FILTER_CHAIN = (
+        _apply_employment_type_filters,
+        _apply_location_filters,
+        _apply_salary_filters,
+        _apply_exclusion_filters
+    )
     
     def _get_annual_multiplier(self, interval) -> float:
         """Get multiplier to convert salary to annual"""
         if not interval:
             return 1.0
         
-        multipliers = {
-            "hourly": 2080,  # 40 hours * 52 weeks
-            "daily": 260,    # ~260 working days
-            "weekly": 52,
-            "monthly": 12,
-            "yearly": 1
-        }
-        
-        return multipliers.get(interval.value if hasattr(interval, 'value') else str(interval), 1.0)
+        return _annual_mult(interval.value if hasattr(interval, 'value') else str(interval))
     
     def get_filter_statistics(
         self, 
@@ -452,21 +636,21 @@ class JobFilteringService:
     ) -> Dict[str, Any]:
         """Get statistics about filtering results"""
         total_jobs = len(filter_results)
-        filtered_jobs = [r for r in filter_results if r.filtered_out]
-        valid_jobs = [r for r in filter_results if not r.filtered_out]
+        filtered_jobs = 0
         
-        # Count filter reasons
-        reason_counts = {}
-        for result in filtered_jobs:
-            for reason in result.filter_reasons:
-                reason_counts[reason] = reason_counts.get(reason, 0) + 1
+        # Count filtered jobs and their reasons in one pass
+        reason_counts = Counter()
+        for result in filter_results:
+            if result.filtered_out:
+                filtered_jobs += 1
+                reason_counts.update(result.filter_reasons)
         
         return {
             "total_jobs": total_jobs,
-            "filtered_jobs": len(filtered_jobs),
-            "valid_jobs": len(valid_jobs),
-            "filter_rate": len(filtered_jobs) / total_jobs if total_jobs > 0 else 0,
-            "top_filter_reasons": dict(sorted(reason_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+            "filtered_jobs": filtered_jobs,
+            "valid_jobs": total_jobs - filtered_jobs,
+            "filter_rate": filtered_jobs / total_jobs if total_jobs > 0 else 0,
+            "top_filter_reasons": dict(reason_counts.most_common(10))
         }
     
     def create_filters_from_preferences(
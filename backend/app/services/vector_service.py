@@ -1,11 +1,17 @@
 """
 Vector database service for managing embeddings and similarity search
 """
+import hashlib
 import logging
+import re
+import time
+from collections import Counter, OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
+import numpy as np
 import pinecone
 from pinecone import Pinecone, ServerlessSpec
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
@@ -14,6 +20,120 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_PROVIDER = "google"
+EMBEDDING_MODEL = "models/embedding-001"
+EMBEDDING_CACHE_SIZE = 4096
+# Maximum number of texts sent to the embedding model in a single request
+EMBEDDING_BATCH_SIZE = 100
+VECTOR_CACHE_SIZE = 10_000
+VECTOR_CACHE_TTL_SECONDS = 3600
+# Texts whose 64-bit SimHashes differ in fewer bits than this share an embedding
+SIMHASH_MAX_DISTANCE = 6
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _simhash(text: str) -> int:
+    """64-bit SimHash of the text's word tokens, weighted by frequency"""
+    weights = [0] * 64
+    for token, count in Counter(_TOKEN_RE.findall(text.lower())).items():
+        token_hash = int.from_bytes(
+            hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(64):
+            weights[bit] += count if token_hash >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class _VectorCache:
+    """Small LRU cache with per-entry expiry for vectors fetched from the index
+    
+    With quantize enabled, vectors are held as int8 plus a float scale, which
+    cuts their memory (and the bandwidth of scoring them) by 4x.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, quantize: bool = False):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.quantize = quantize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _lookup(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def get(self, key: str) -> Optional[List[float]]:
+        value = self._lookup(key)
+        if value is None or not self.quantize:
+            return value
+        return _dequantize(*value).tolist()
+
+    def get_array(self, key: str) -> Optional[np.ndarray]:
+        """Like get, but returns a float32 array without a list round trip"""
+        value = self._lookup(key)
+        if value is None:
+            return None
+        if self.quantize:
+            return _dequantize(*value)
+        return np.asarray(value, dtype=np.float32)
+
+    def set(self, key: str, vector: List[float]):
+        value = _quantize(vector) if self.quantize else vector
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str):
+        self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _quantize(vector: List[float]) -> Tuple[np.ndarray, float]:
+    """Symmetric int8 quantization using the vector's max absolute value"""
+    values = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.abs(values).max()) if values.size else 0.0
+    scale = max_abs / 127 if max_abs else 1.0
+    return np.round(values / scale).astype(np.int8), scale
+
+
+def _dequantize(quantized: np.ndarray, scale: float) -> np.ndarray:
+    return quantized.astype(np.float32) * scale
+
+
+def _metadata_value(value: Any) -> Any:
+    """Coerce a metadata value to a type the index can store without conversion"""
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (list, tuple, set)):
+        return [item if isinstance(item, str) else str(getattr(item, "value", item)) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(getattr(value, "value", value))
+
+
+def _clean_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop null values and coerce the rest to strings, numbers, booleans or string lists"""
+    return {key: _metadata_value(value) for key, value in metadata.items() if value is not None}
+
+
+def _cosine_scores(matrix: np.ndarray, vector: List[float]) -> np.ndarray:
+    """Cosine similarity of each row of matrix against vector"""
+    query = np.asarray(vector, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    return np.divide(matrix @ query, norms, out=np.zeros(len(matrix), dtype=np.float32), where=norms > 0)
+
 
 class VectorService:
     """Service for managing vector embeddings and similarity search using Pinecone"""
@@ -23,6 +143,15 @@ class VectorService:
         self.index = None
         self.embeddings_model = None
         self.executor = ThreadPoolExecutor(max_workers=4)
+        # Content-hash keyed embeddings, so unchanged documents skip the model call
+        self._embedding_cache: "OrderedDict[Tuple[str, str, str], List[float]]" = OrderedDict()
+        # SimHash of each cached near-duplicate-eligible text, keyed like the cache
+        self._simhashes: "OrderedDict[Tuple[str, str, str], int]" = OrderedDict()
+        # Stored vectors by resume/job id, so repeat match queries skip the index fetch
+        self._resume_vector_cache = _VectorCache(VECTOR_CACHE_SIZE, VECTOR_CACHE_TTL_SECONDS)
+        self._job_vector_cache = _VectorCache(
+            VECTOR_CACHE_SIZE, VECTOR_CACHE_TTL_SECONDS, quantize=settings.VECTOR_CACHE_INT8
+        )
         
     async def initialize(self):
         """Initialize Pinecone connection and embedding model"""
@@ -32,7 +161,7 @@ class VectorService:
             
             # Initialize embedding model with gemini-embedding-001
             self.embeddings_model = GoogleGenerativeAIEmbeddings(
-                model="models/embedding-001",  # Gemini embedding model as requested
+                model=EMBEDDING_MODEL,  # Gemini embedding model as requested
                 google_api_key=settings.GEMINI_API_KEY
             )
             
@@ -79,9 +208,55 @@ class VectorService:
             logger.error(f"Error ensuring index exists: {e}")
             raise
     
-    async def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for given text using Gemini"""
+    def _embedding_cache_key(self, text: str) -> Tuple[str, str, str]:
+        """Build the (content hash, provider, model) key for an embedding"""
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return content_hash, EMBEDDING_PROVIDER, EMBEDDING_MODEL
+
+    def _get_cached_embedding(self, key: Tuple[str, str, str]) -> Optional[List[float]]:
+        """Return a cached embedding and mark it as recently used"""
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+        return embedding
+
+    def _store_cached_embedding(self, key: Tuple[str, str, str], embedding: List[float]):
+        """Cache an embedding, evicting the least recently used entry when full"""
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            evicted_key, _ = self._embedding_cache.popitem(last=False)
+            self._simhashes.pop(evicted_key, None)
+
+    def _find_near_duplicate(self, simhash: int) -> Optional[List[float]]:
+        """Return the cached embedding of a text whose SimHash is close to simhash"""
+        for key, cached_simhash in self._simhashes.items():
+            if (simhash ^ cached_simhash).bit_count() < SIMHASH_MAX_DISTANCE:
+                return self._get_cached_embedding(key)
+        return None
+
+    async def generate_embedding(self, text: str, near_duplicates: bool = False) -> List[float]:
+        """Generate embedding for given text using Gemini
+        
+        With near_duplicates, a text that only differs slightly from a cached
+        one (a fixed typo, changed whitespace) reuses that text's embedding.
+        Intended for long documents such as resumes, where a few changed
+        tokens barely move the embedding.
+        """
         try:
+            cache_key = self._embedding_cache_key(text)
+            cached = self._get_cached_embedding(cache_key)
+            if cached is not None:
+                return cached
+
+            if near_duplicates:
+                simhash = _simhash(text)
+                cached = self._find_near_duplicate(simhash)
+                if cached is not None:
+                    self._store_cached_embedding(cache_key, cached)
+                    self._simhashes[cache_key] = simhash
+                    return cached
+
             # Run embedding generation in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             embedding = await loop.run_in_executor(
@@ -89,6 +264,9 @@ class VectorService:
                 self.embeddings_model.embed_query,
                 text
             )
+            self._store_cached_embedding(cache_key, embedding)
+            if near_duplicates:
+                self._simhashes[cache_key] = simhash
             return embedding
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
@@ -97,12 +275,29 @@ class VectorService:
     async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts"""
         try:
-            loop = asyncio.get_event_loop()
-            embeddings = await loop.run_in_executor(
-                self.executor,
-                self.embeddings_model.embed_documents,
-                texts
+            cache_keys = [self._embedding_cache_key(text) for text in texts]
+            embeddings: List[Optional[List[float]]] = [
+                self._get_cached_embedding(key) for key in cache_keys
+            ]
+            # Embed misses shortest-first so each request holds texts of similar
+            # length; results are written back by original index
+            missing = sorted(
+                (i for i, embedding in enumerate(embeddings) if embedding is None),
+                key=lambda i: len(texts[i])
             )
+
+            loop = asyncio.get_event_loop()
+            for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+                chunk = missing[start:start + EMBEDDING_BATCH_SIZE]
+                generated = await loop.run_in_executor(
+                    self.executor,
+                    self.embeddings_model.embed_documents,
+                    [texts[i] for i in chunk]
+                )
+                for i, embedding in zip(chunk, generated):
+                    embeddings[i] = embedding
+                    self._store_cached_embedding(cache_keys[i], embedding)
+
             return embeddings
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
@@ -118,16 +313,32 @@ class VectorService:
         """Store resume embedding in Pinecone with metadata"""
         try:
             # Generate embedding for resume content
-            embedding = await self.generate_embedding(resume_content)
-            
+            embedding = await self.generate_embedding(resume_content, near_duplicates=True)
+        except Exception as e:
+            logger.error(f"Error storing resume embedding: {e}")
+            raise
+        
+        return await self.store_resume_embedding_with_vector(
+            resume_id, user_id, embedding, metadata
+        )
+    
+    async def store_resume_embedding_with_vector(
+        self,
+        resume_id: str,
+        user_id: str,
+        embedding: List[float],
+        metadata: Dict[str, Any]
+    ) -> str:
+        """Store a precomputed resume embedding in Pinecone with metadata"""
+        try:
             # Prepare metadata
-            vector_metadata = {
+            vector_metadata = _clean_metadata({
                 "type": "resume",
                 "resume_id": resume_id,
                 "user_id": user_id,
                 "created_at": metadata.get("created_at"),
                 **metadata
-            }
+            })
             
             # Store in Pinecone
             vector_id = f"resume_{resume_id}"
@@ -138,6 +349,7 @@ class VectorService:
                     namespace="resumes"
                 )
             )
+            self._resume_vector_cache.set(resume_id, embedding)
             
             logger.info(f"Stored resume embedding: {vector_id}")
             return vector_id
@@ -156,9 +368,22 @@ class VectorService:
         try:
             # Generate embedding for job content
             embedding = await self.generate_embedding(job_content)
-            
+        except Exception as e:
+            logger.error(f"Error storing job embedding: {e}")
+            raise
+        
+        return await self.store_job_embedding_with_vector(job_id, embedding, metadata)
+    
+    async def store_job_embedding_with_vector(
+        self,
+        job_id: str,
+        embedding: List[float],
+        metadata: Dict[str, Any]
+    ) -> str:
+        """Store a precomputed job posting embedding in Pinecone with metadata"""
+        try:
             # Prepare metadata
-            vector_metadata = {
+            vector_metadata = _clean_metadata({
                 "type": "job",
                 "job_id": job_id,
                 "company": metadata.get("company"),
@@ -166,7 +391,7 @@ class VectorService:
                 "location": metadata.get("location"),
                 "scraped_at": metadata.get("scraped_at"),
                 **metadata
-            }
+            })
             
             # Store in Pinecone
             vector_id = f"job_{job_id}"
@@ -177,6 +402,7 @@ class VectorService:
                     namespace="jobs"
                 )
             )
+            self._job_vector_cache.set(job_id, embedding)
             
             logger.info(f"Stored job embedding: {vector_id}")
             return vector_id
@@ -185,6 +411,114 @@ class VectorService:
             logger.error(f"Error storing job embedding: {e}")
             raise
     
+    async def _fetch_vector(self, vector_id: str, namespace: str) -> Optional[List[float]]:
+        """Fetch a stored vector from the index, returning None when missing"""
+        response = await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.index.fetch(
+                ids=[vector_id],
+                namespace=namespace
+            )
+        )
+        if not response.vectors or vector_id not in response.vectors:
+            return None
+        return response.vectors[vector_id].values
+    
+    async def get_resume_vector(self, resume_id: str) -> Optional[List[float]]:
+        """Get a stored resume vector, served from the cache when possible"""
+        vector = self._resume_vector_cache.get(resume_id)
+        if vector is None:
+            vector = await self._fetch_vector(f"resume_{resume_id}", "resumes")
+            if vector is not None:
+                self._resume_vector_cache.set(resume_id, vector)
+        return vector
+    
+    async def get_job_vector(self, job_id: str) -> Optional[List[float]]:
+        """Get a stored job vector, served from the cache when possible"""
+        vector = self._job_vector_cache.get(job_id)
+        if vector is None:
+            vector = await self._fetch_vector(f"job_{job_id}", "jobs")
+            if vector is not None:
+                self._job_vector_cache.set(job_id, vector)
+        return vector
+    
+    async def get_job_matrix(self, job_ids: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Get stored job vectors as an (N, D) float32 matrix with their ids
+        
+        Uncached vectors are fetched from the index in a single request; ids
+        without a stored embedding are left out of the result.
+        """
+        vectors = {job_id: self._job_vector_cache.get_array(job_id) for job_id in job_ids}
+        missing = [job_id for job_id, vector in vectors.items() if vector is None]
+        
+        if missing:
+            response = await asyncio.get_event_loop().run_in_executor(
+                self.executor,
+                lambda: self.index.fetch(
+                    ids=[f"job_{job_id}" for job_id in missing],
+                    namespace="jobs"
+                )
+            )
+            fetched = response.vectors or {}
+            for job_id in missing:
+                record = fetched.get(f"job_{job_id}")
+                if record is not None:
+                    vectors[job_id] = np.asarray(record.values, dtype=np.float32)
+                    self._job_vector_cache.set(job_id, record.values)
+        
+        ids = [job_id for job_id, vector in vectors.items() if vector is not None]
+        if not ids:
+            return ids, np.empty((0, 0), dtype=np.float32)
+        return ids, np.vstack([vectors[job_id] for job_id in ids])
+    
+    async def rank_jobs_for_resume(
+        self,
+        resume_id: str,
+        job_ids: List[str],
+        top_k: int = 10,
+        score_threshold: float = 0.7
+    ) -> List[Dict[str, Any]]:
+        """Rank a known set of jobs against a resume locally
+        
+        Scores every candidate with one matrix-vector product instead of an
+        index query, which suits callers that already hold the candidate ids.
+        """
+        try:
+            resume_embedding, (ids, job_matrix) = await asyncio.gather(
+                self.get_resume_vector(resume_id),
+                self.get_job_matrix(job_ids)
+            )
+            if resume_embedding is None:
+                raise ValueError(f"Resume embedding not found: {resume_id}")
+            if not ids or top_k <= 0:
+                return []
+            
+            scores = _cosine_scores(job_matrix, resume_embedding)
+            k = min(top_k, len(ids))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            
+            return [
+                {
+                    "job_id": ids[i],
+                    "score": float(scores[i]),
+                    "metadata": {"job_id": ids[i]}
+                }
+                for i in top
+                if scores[i] >= score_threshold
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error ranking jobs for resume: {e}")
+            raise
+    
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get hit/miss statistics for the stored vector caches"""
+        return {
+            "resume_vectors": self._resume_vector_cache.stats(),
+            "job_vectors": self._job_vector_cache.stats()
+        }
+    
     async def find_similar_jobs(
         self, 
         resume_id: str, 
@@ -194,20 +528,10 @@ class VectorService:
         """Find jobs similar to a resume using vector similarity search"""
         try:
             # Get resume vector
-            resume_vector_id = f"resume_{resume_id}"
-            resume_response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.index.fetch(
-                    ids=[resume_vector_id],
-                    namespace="resumes"
-                )
-            )
-            
-            if not resume_response.vectors or resume_vector_id not in resume_response.vectors:
+            resume_embedding = await self.get_resume_vector(resume_id)
+            if resume_embedding is None:
                 raise ValueError(f"Resume embedding not found: {resume_id}")
             
-            resume_embedding = resume_response.vectors[resume_vector_id].values
-            
             # Search for similar jobs
             search_response = await asyncio.get_event_loop().run_in_executor(
                 self.executor,
@@ -245,20 +569,10 @@ class VectorService:
         """Find resumes similar to a job posting using vector similarity search"""
         try:
             # Get job vector
-            job_vector_id = f"job_{job_id}"
-            job_response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.index.fetch(
-                    ids=[job_vector_id],
-                    namespace="jobs"
-                )
-            )
-            
-            if not job_response.vectors or job_vector_id not in job_response.vectors:
+            job_embedding = await self.get_job_vector(job_id)
+            if job_embedding is None:
                 raise ValueError(f"Job embedding not found: {job_id}")
             
-            job_embedding = job_response.vectors[job_vector_id].values
-            
             # Search for similar resumes
             search_response = await asyncio.get_event_loop().run_in_executor(
                 self.executor,
@@ -296,33 +610,14 @@ class VectorService:
         """Calculate similarity score between a specific resume and job"""
         try:
             # Get both vectors
-            resume_vector_id = f"resume_{resume_id}"
-            job_vector_id = f"job_{job_id}"
-            
-            # Fetch both vectors
-            resume_response, job_response = await asyncio.gather(
-                asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    lambda: self.index.fetch(
-                        ids=[resume_vector_id],
-                        namespace="resumes"
-                    )
-                ),
-                asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    lambda: self.index.fetch(
-                        ids=[job_vector_id],
-                        namespace="jobs"
-                    )
-                )
+            resume_embedding, job_embedding = await asyncio.gather(
+                self.get_resume_vector(resume_id),
+                self.get_job_vector(job_id)
             )
             
-            if (not resume_response.vectors or resume_vector_id not in resume_response.vectors or
-                not job_response.vectors or job_vector_id not in job_response.vectors):
+            if resume_embedding is None or job_embedding is None:
                 raise ValueError("One or both embeddings not found")
             
-            resume_embedding = resume_response.vectors[resume_vector_id].values
-            
             # Query job embedding against resume
             search_response = await asyncio.get_event_loop().run_in_executor(
                 self.executor,
@@ -344,10 +639,38 @@ class VectorService:
             logger.error(f"Error calculating similarity score: {e}")
             raise
     
+    async def calculate_similarity_scores(
+        self,
+        resume_id: str,
+        job_ids: List[str]
+    ) -> Dict[str, float]:
+        """Calculate similarity scores between a resume and several jobs
+        
+        Vectors are fetched concurrently and scored in one matrix product.
+        Jobs without a stored embedding are left out of the result.
+        """
+        try:
+            resume_embedding, (ids, job_matrix) = await asyncio.gather(
+                self.get_resume_vector(resume_id),
+                self.get_job_matrix(job_ids)
+            )
+            if resume_embedding is None:
+                raise ValueError(f"Resume embedding not found: {resume_id}")
+            if not ids:
+                return {}
+            
+            scores = _cosine_scores(job_matrix, resume_embedding)
+            return dict(zip(ids, scores.tolist()))
+            
+        except Exception as e:
+            logger.error(f"Error calculating similarity scores: {e}")
+            raise
+    
     async def delete_resume_embedding(self, resume_id: str) -> bool:
         """Delete resume embedding from Pinecone"""
         try:
             vector_id = f"resume_{resume_id}"
+            self._resume_vector_cache.invalidate(resume_id)
             await asyncio.get_event_loop().run_in_executor(
                 self.executor,
                 lambda: self.index.delete(
@@ -367,6 +690,7 @@ class VectorService:
         """Delete job embedding from Pinecone"""
         try:
             vector_id = f"job_{job_id}"
+            self._job_vector_cache.invalidate(job_id)
             await asyncio.get_event_loop().run_in_executor(
                 self.executor,
                 lambda: self.index.delete(
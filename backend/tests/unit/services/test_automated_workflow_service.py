@@ -0,0 +1,82 @@
+"""
+Unit tests for the automated workflow service.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.services.automated_workflow_service import (
+    AutomatedWorkflowService,
+    AutomationTrigger,
+    WorkflowExecution
+)
+
+
+@pytest.fixture
+def workflow_service():
+    """Create an automated workflow service with mocked dependencies."""
+    service = AutomatedWorkflowService(
+        job_service=AsyncMock(),
+        job_matching_service=AsyncMock(),
+        application_orchestrator=AsyncMock(),
+        automation_service=AsyncMock(),
+        monitoring_service=AsyncMock(),
+        preferences_service=AsyncMock(),
+        resume_service=AsyncMock()
+    )
+    service.worker_count = 2
+    return service
+
+
+class TestAutomatedWorkflowService:
+    """Test AutomatedWorkflowService."""
+
+    @pytest.mark.asyncio
+    async def test_start_workflow_runs_without_start_service(self, workflow_service):
+        """Test a queued workflow runs even if start_service was never called."""
+        with patch.object(workflow_service, '_execute_workflow', new_callable=AsyncMock) as mock_execute:
+            result = await workflow_service.start_workflow(
+                "user123", AutomationTrigger.MANUAL, force=True
+            )
+
+            await asyncio.wait_for(workflow_service._work_queue.join(), timeout=1)
+
+            mock_execute.assert_awaited_once()
+            execution = mock_execute.call_args[0][0]
+            assert isinstance(execution, WorkflowExecution)
+            assert execution.id == result["execution_id"]
+            assert len(workflow_service._background_tasks) == workflow_service.worker_count + 1
+
+        await workflow_service.stop_service()
+        assert workflow_service._background_tasks == []
+
+    @pytest.mark.asyncio
+    async def test_start_service_does_not_duplicate_workers(self, workflow_service):
+        """Test workers started lazily are not started a second time."""
+        with patch.object(workflow_service, '_execute_workflow', new_callable=AsyncMock):
+            await workflow_service.start_workflow("user123", force=True)
+            await workflow_service.start_service()
+
+            assert len(workflow_service._background_tasks) == workflow_service.worker_count + 1
+
+        await workflow_service.stop_service()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_task_backs_off_after_sweep_error(self, workflow_service):
+        """Test a failing sweep reaches the cleanup task's backoff."""
+        workflow_service.cleanup_interval = 0
+        workflow_service.max_cleanup_backoff = 0.01
+        backoff_seen = []
+
+        async def sweep():
+            backoff_seen.append(workflow_service._cleanup_backoff)
+            if len(backoff_seen) == 1:
+                raise RuntimeError("sweep failed")
+            workflow_service._shutdown_event.set()
+
+        with patch.object(workflow_service, '_sweep_user_states', side_effect=sweep):
+            await asyncio.wait_for(workflow_service._cleanup_task(), timeout=1)
+
+        assert backoff_seen == [1.0, 2.0]
+        assert workflow_service._cleanup_backoff == 1.0
@@ -2,6 +2,7 @@
 Unit tests for cover letter service
 """
 import pytest
+import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
@@ -53,6 +54,27 @@ class TestCoverLetterTemplateManager:
         assert len(enthusiastic_templates) >= 1
         assert all(t.tone == CoverLetterTone.ENTHUSIASTIC for t in enthusiastic_templates)
 
+    
+    def test_default_templates_shared_between_managers(self):
+        """Test built-in templates are built once and shared read-only"""
+        first = CoverLetterTemplateManager()
+        second = CoverLetterTemplateManager()
+        
+        assert first.templates is second.templates
+        assert first.get_templates_by_tone(CoverLetterTone.FORMAL) == ()
+        with pytest.raises(TypeError):
+            first.templates["custom"] = first.get_template("professional_standard")
+    
+    def test_get_template_segments_compiles_paragraphs_once(self):
+        """Test template paragraphs are compiled once and substitute {field} values"""
+        manager = CoverLetterTemplateManager()
+        template = manager.get_template("enthusiastic_startup")
+        
+        segments = manager.get_template_segments(template)
+        
+        assert len(segments) == len(template.template_content.split("\n\n"))
+        assert segments[-1].substitute(candidate_name="Jane").endswith("Jane")
+        assert manager.get_template_segments(template) is segments
 
 class TestCoverLetterService:
     """Test cover letter generation service"""
@@ -192,10 +214,11 @@ class TestCoverLetterService:
             job_title="Full Stack Developer"
         )
         
-        result = await cover_letter_service._generate_ai_content(
+        result, from_model = await cover_letter_service._generate_ai_content(
             sample_generation_request, sample_resume_data, personalization
         )
         
+        assert from_model is True
         assert isinstance(result, CoverLetterContent)
         assert result.opening_paragraph.startswith("Dear Hiring Manager")
         assert len(result.body_paragraphs) == 2
@@ -215,10 +238,11 @@ class TestCoverLetterService:
             job_title="Full Stack Developer"
         )
         
-        result = await cover_letter_service._generate_ai_content(
+        result, from_model = await cover_letter_service._generate_ai_content(
             sample_generation_request, sample_resume_data, personalization
         )
         
+        assert from_model is False
         assert isinstance(result, CoverLetterContent)
         assert result.full_content is not None
         assert len(result.full_content) > 0
@@ -242,6 +266,21 @@ class TestCoverLetterService:
         assert "Jane Smith" in result.full_content
         assert result.word_count > 0
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tone", list(CoverLetterTone))
+    async def test_generate_template_content_fills_every_field(self, cover_letter_service, sample_generation_request, sample_resume_data, tone):
+        """Test template fallback leaves no unfilled placeholders for any tone"""
+        request = sample_generation_request.model_copy(update={"tone": tone})
+        personalization = CoverLetterPersonalization(company_name="Test Company", job_title="Test Role")
+        
+        result = await cover_letter_service._generate_template_content(
+            request, sample_resume_data, personalization
+        )
+        
+        assert "$" not in result.full_content
+        assert "{" not in result.full_content
+        assert "Test Company" in result.full_content
+    
     @pytest.mark.asyncio
     async def test_validate_cover_letter_with_ai(self, cover_letter_service, mock_llm, sample_generation_request):
         """Test cover letter validation with AI"""
@@ -282,6 +321,70 @@ class TestCoverLetterService:
         assert result.overall_score == 0.87
         assert mock_llm.ainvoke.called
     
+    @pytest.mark.asyncio
+    async def test_validate_stream_yields_partial_results(self, cover_letter_service, mock_llm, sample_generation_request):
+        """Test streamed validation surfaces scores before the full reply arrives"""
+        content = CoverLetterContent(
+            header="",
+            opening_paragraph="Dear Hiring Manager,",
+            body_paragraphs=["Body paragraph 1"],
+            closing_paragraph="Thank you.",
+            signature="Sincerely, John Doe",
+            full_content="Complete cover letter content",
+            word_count=250,
+            tone_used=CoverLetterTone.PROFESSIONAL
+        )
+        chunks = ['{"is_valid": false, "overall_', 'score": 0.6, "issues": ["Too ', 'generic"]}']
+        
+        async def fake_stream(messages):
+            for text in chunks:
+                yield Mock(content=text)
+        
+        mock_llm.astream = fake_stream
+        
+        results = [v async for v in cover_letter_service.validate_stream(content, sample_generation_request)]
+        
+        assert results[0].partial is True
+        assert results[0].is_valid is False
+        assert results[0].overall_score is None
+        assert results[1].overall_score == 0.6
+        assert results[-1].partial is False
+        assert results[-1].overall_score == 0.6
+        assert results[-1].issues == ["Too generic"]
+    
+    @pytest.mark.asyncio
+    async def test_validate_stream_early_break_releases_slot(self, cover_letter_service, mock_llm, sample_generation_request):
+        """Test a caller that stops after the first partial result does not keep the Gemini slot"""
+        content = CoverLetterContent(
+            header="",
+            opening_paragraph="Dear Hiring Manager,",
+            body_paragraphs=["Body paragraph 1"],
+            closing_paragraph="Thank you.",
+            signature="Sincerely, John Doe",
+            full_content="Complete cover letter content",
+            word_count=250,
+            tone_used=CoverLetterTone.PROFESSIONAL
+        )
+        chunks = ['{"is_valid": true, "overall_', 'score": 0.9, "issues": []}']
+        
+        async def fake_stream(messages):
+            for text in chunks:
+                yield Mock(content=text)
+        
+        mock_llm.astream = fake_stream
+        free_slots = cover_letter_service._llm_semaphore._value
+        
+        stream = cover_letter_service.validate_stream(content, sample_generation_request)
+        async for validation in stream:
+            assert validation.is_valid is True
+            break
+        
+        # The generator is left suspended; the slot must come back regardless
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert cover_letter_service._llm_semaphore._value == free_slots
+        await stream.aclose()
+    
     def test_basic_validation(self, cover_letter_service, sample_generation_request):
         """Test basic validation without AI"""
         content = CoverLetterContent(
@@ -368,6 +471,83 @@ class TestCoverLetterService:
         assert result.personalization.job_title == "Full Stack Developer"
         assert "generation_timestamp" in result.generation_metadata
     
+    @pytest.mark.asyncio
+    async def test_generate_cover_letter_skip_ai_validation(self, cover_letter_service, mock_llm, sample_generation_request, sample_resume_data):
+        """Test rule-based validation replaces the second LLM call when requested"""
+        content_response = Mock()
+        content_response.content = '{"opening_paragraph": "Dear Hiring Manager,", "body_paragraphs": ["Body"], "closing_paragraph": "Thanks.", "full_content": "Full Stack Developer at Innovative Tech Solutions"}'
+        mock_llm.ainvoke.return_value = content_response
+        sample_generation_request.skip_ai_validation = True
+        
+        result = await cover_letter_service.generate_cover_letter(
+            sample_generation_request, sample_resume_data, "user123"
+        )
+        
+        assert mock_llm.ainvoke.call_count == 1
+        assert result.validation.is_valid is True
+        assert result.validation.personalization_score == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_generate_cover_letter_reuses_cached_generation(self, cover_letter_service, mock_llm, sample_generation_request, sample_resume_data):
+        """Test identical requests are served from the generation cache"""
+        content_response = Mock()
+        content_response.content = '{"opening_paragraph": "Dear Hiring Manager,", "body_paragraphs": ["Body"], "full_content": "Full Stack Developer at Innovative Tech Solutions"}'
+        validation_response = Mock()
+        validation_response.content = '{"is_valid": true, "overall_score": 0.9}'
+        mock_llm.ainvoke.side_effect = [content_response, validation_response]
+        
+        first = await cover_letter_service.generate_cover_letter(
+            sample_generation_request, sample_resume_data, "user123"
+        )
+        second = await cover_letter_service.generate_cover_letter(
+            sample_generation_request, sample_resume_data, "user123"
+        )
+        
+        assert mock_llm.ainvoke.call_count == 2
+        assert second.content.full_content == first.content.full_content
+        assert second.id != first.id
+        assert second.generation_metadata["cache_hit"] is True
+        assert cover_letter_service.get_cache_stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_generate_cover_letter_does_not_cache_template_fallback(self, cover_letter_service, mock_llm, sample_generation_request, sample_resume_data):
+        """Test a malformed reply's template letter is not served from the cache"""
+        malformed_response = Mock()
+        malformed_response.content = "Invalid JSON response"
+        validation_response = Mock()
+        validation_response.content = '{"is_valid": true, "overall_score": 0.9}'
+        mock_llm.ainvoke.side_effect = [malformed_response, validation_response] * 2
+        
+        first = await cover_letter_service.generate_cover_letter(
+            sample_generation_request, sample_resume_data, "user123"
+        )
+        second = await cover_letter_service.generate_cover_letter(
+            sample_generation_request, sample_resume_data, "user123"
+        )
+        
+        assert mock_llm.ainvoke.call_count == 4
+        assert first.generation_metadata["cache_hit"] is False
+        assert second.generation_metadata["cache_hit"] is False
+    
+    @pytest.mark.asyncio
+    async def test_generate_cover_letters_batch(self, cover_letter_service, sample_generation_request, sample_resume_data):
+        """Test batch generation keeps request order and isolates failures"""
+        failing_request = sample_generation_request.model_copy(update={"company_name": "Broken Co"})
+        
+        async def fake_generate(request, resume_data, user_id):
+            if request.company_name == "Broken Co":
+                raise Exception("generation failed")
+            return Mock(company=request.company_name)
+        
+        with patch.object(cover_letter_service, "generate_cover_letter", side_effect=fake_generate):
+            results = await cover_letter_service.generate_cover_letters_batch(
+                [sample_generation_request, failing_request], sample_resume_data, "user123", max_concurrency=1
+            )
+        
+        assert len(results) == 2
+        assert results[0].company == "Innovative Tech Solutions"
+        assert results[1] is None
+    
     @pytest.mark.asyncio
     async def test_generate_cover_letter_no_llm(self):
         """Test cover letter generation when LLM is not configured"""
@@ -140,6 +140,7 @@ class TestEmbeddingService:
         
         text = embedding_service_instance._prepare_resume_text(minimal_resume)
         
+        assert text.startswith("Document type: resume.\n")
         assert "Summary: Software developer" in text
         assert "Skills: Python" in text
         assert len(text.strip()) > 0
@@ -174,6 +175,49 @@ class TestEmbeddingService:
         assert metadata["currency"] == "USD"
         assert metadata["site"] == "indeed"
     
+    def test_job_id_falls_back_to_stable_url_digest(self, embedding_service_instance):
+        """Test jobs without an id get a deterministic id from their URL"""
+        job = Mock(spec=JobPost)
+        job.job_url = "https://example.com/job/123"
+        
+        job_id = embedding_service_instance._job_id(job)
+        
+        assert job_id == embedding_service_instance._job_id(job)
+        assert len(job_id) == 32
+        assert all(c in "0123456789abcdef" for c in job_id)
+    
+    @pytest.mark.asyncio
+    async def test_process_job_embeddings_batch(
+        self, 
+        embedding_service_instance, 
+        sample_job_post,
+        mock_vector_service
+    ):
+        """Test batch job embedding uses a single model call"""
+        mock_vector_service.generate_embeddings_batch = AsyncMock(
+            return_value=[[0.1] * 768, [0.2] * 768]
+        )
+        mock_vector_service.store_job_embedding_with_vector = AsyncMock(
+            side_effect=["vector_1", "vector_2"]
+        )
+        
+        vector_ids = await embedding_service_instance.process_job_embeddings_batch(
+            [sample_job_post, sample_job_post]
+        )
+        
+        assert vector_ids == ["vector_1", "vector_2"]
+        mock_vector_service.generate_embeddings_batch.assert_called_once()
+        texts = mock_vector_service.generate_embeddings_batch.call_args[0][0]
+        assert len(texts) == 2
+        assert mock_vector_service.store_job_embedding_with_vector.call_count == 2
+        call_args = mock_vector_service.store_job_embedding_with_vector.call_args_list[0]
+        assert call_args[1]["job_id"] == "job_789"
+        assert call_args[1]["embedding"] == [0.1] * 768
+        assert call_args[1]["metadata"]["company"] == "StartupCorp"
+        scraped_at = {c[1]["metadata"]["scraped_at"] for c in mock_vector_service.store_job_embedding_with_vector.call_args_list}
+        assert len(scraped_at) == 1
+        mock_vector_service.store_job_embedding.assert_not_called()
+    
     def test_prepare_job_text(self, embedding_service_instance, sample_job_post):
         """Test job text preparation"""
         text = embedding_service_instance._prepare_job_text(sample_job_post)
@@ -196,6 +240,7 @@ class TestEmbeddingService:
         
         text = embedding_service_instance._prepare_job_text(minimal_job)
         
+        assert text.startswith("Document type: job posting.\n")
         assert "Job Title: Developer" in text
         assert "Company: Company" in text
         assert "Description: Job description" in text
@@ -315,6 +360,27 @@ class TestEmbeddingService:
             assert result["match_quality"] == expected_quality
             assert result["recommendation"] == expected_recommendation
     
+    @pytest.mark.asyncio
+    async def test_calculate_job_resume_matches(
+        self,
+        embedding_service_instance,
+        mock_vector_service
+    ):
+        """Test batch match calculation keeps input order and skips missing jobs"""
+        mock_vector_service.calculate_similarity_scores = AsyncMock(
+            return_value={"job_b": 0.65, "job_a": 0.95}
+        )
+        
+        matches = await embedding_service_instance.calculate_job_resume_matches(
+            "resume_123", ["job_a", "job_missing", "job_b"]
+        )
+        
+        assert [m["job_id"] for m in matches] == ["job_a", "job_b"]
+        assert matches[0]["match_quality"] == "excellent"
+        assert matches[0]["recommendation"] is True
+        assert matches[1]["match_quality"] == "fair"
+        assert matches[1]["recommendation"] is False
+    
     @pytest.mark.asyncio
     async def test_process_resume_embedding_error_handling(
         self, 
@@ -3,16 +3,23 @@ Unit tests for JobApplicationService
 """
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+import re
+import threading
+from unittest.mock import Mock, AsyncMock, patch, MagicMock, PropertyMock
 from datetime import datetime
 from typing import Dict, Any
 
+from selenium.common.exceptions import WebDriverException
+
 from app.services.job_application_service import (
     JobApplicationService,
     ApplicationStatus,
     ApplicationError,
     ApplicationResult,
-    ApplicationCredentials
+    ApplicationCredentials,
+    AttemptRecord,
+    _CONFIRMATION_JS,
+    _CONFIRMATION_PATTERN
 )
 from app.models.job import JobPost, JobSite
 from app.models.resume import ResumeData
@@ -202,6 +209,141 @@ class TestJobApplicationService:
             assert len(result.metadata["attempts"]) == 3
             assert mock_sleep.call_count == 2  # Sleep between retries
     
+    @pytest.mark.asyncio
+    async def test_submit_application_no_retry_on_permanent_failure(self, job_application_service):
+        """Test permanent failures are returned without further attempts"""
+        job = Mock(id="job123")
+        job_application_service.driver = Mock()
+        
+        with patch.object(job_application_service, '_submit_single_application') as mock_submit, \
+             patch('asyncio.sleep') as mock_sleep:
+            
+            mock_submit.return_value = ApplicationResult(
+                job_id=job.id,
+                status=ApplicationStatus.FAILED,
+                error_message="Login failed",
+                error_type=ApplicationError.INVALID_CREDENTIALS
+            )
+            
+            result = await job_application_service.submit_application(job, Mock(), Mock(), Mock())
+            
+            assert result.status == ApplicationStatus.FAILED
+            assert result.error_type == ApplicationError.INVALID_CREDENTIALS
+            assert result.retry_count == 1
+            assert mock_submit.call_count == 1
+            mock_sleep.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_submit_single_application_login_after_apply(self, job_application_service, sample_credentials):
+        """Test guest-viewable sites only log in when apply leads to a login page"""
+        job = Mock(id="job123", site=JobSite.INDEED, job_url="https://www.indeed.com/viewjob?jk=123")
+        mock_driver = Mock()
+        mock_driver.current_url = "https://secure.indeed.com/account/login"
+        job_application_service.driver = mock_driver
+        
+        with patch.object(job_application_service, '_wait_until', return_value=True), \
+             patch.object(job_application_service, '_is_login_required') as mock_login_check, \
+             patch.object(job_application_service, '_open_application_form', return_value=True) as mock_open, \
+             patch.object(job_application_service, '_perform_login', return_value=True) as mock_login, \
+             patch.object(job_application_service, '_fill_application_form', return_value=True), \
+             patch.object(job_application_service, '_submit_application_form', return_value={"success": True}):
+            
+            result = await job_application_service._submit_single_application(
+                job, Mock(), Mock(), Mock(), sample_credentials
+            )
+            
+            assert result.status == ApplicationStatus.SUBMITTED
+            mock_login_check.assert_not_called()
+            mock_login.assert_called_once_with(sample_credentials)
+            assert mock_open.call_count == 2
+            mock_driver.get.assert_called_with(job.job_url)
+    
+    @pytest.mark.asyncio
+    async def test_submit_application_records_attempts(self, job_application_service):
+        """Test each attempt is recorded and serializes to the documented fields"""
+        job = Mock(id="job123")
+        job_application_service.driver = Mock()
+        
+        with patch.object(job_application_service, '_submit_single_application') as mock_submit:
+            mock_submit.return_value = ApplicationResult(job_id=job.id, status=ApplicationStatus.SUBMITTED)
+            
+            result = await job_application_service.submit_application(job, Mock(), Mock(), Mock())
+            
+            record = result.metadata["attempts"][0]
+            assert isinstance(record, AttemptRecord)
+            assert record.as_dict() == {
+                "attempt": 1,
+                "timestamp": record.timestamp.isoformat(),
+                "status": ApplicationStatus.SUBMITTED,
+                "error": None
+            }
+    
+    @pytest.mark.asyncio
+    async def test_recover_driver_keeps_live_session(self, job_application_service):
+        """Test recovery leaves a responsive browser alone"""
+        mock_driver = Mock()
+        job_application_service.driver = mock_driver
+        
+        with patch.object(job_application_service, 'initialize_driver') as mock_init:
+            await job_application_service._recover_driver()
+            
+            mock_init.assert_not_called()
+            mock_driver.quit.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_recover_driver_restarts_dead_session(self, job_application_service):
+        """Test recovery restarts the browser when the session is gone"""
+        mock_driver = Mock()
+        type(mock_driver).title = PropertyMock(side_effect=WebDriverException("session deleted"))
+        job_application_service.driver = mock_driver
+        
+        with patch.object(job_application_service, 'initialize_driver') as mock_init:
+            await job_application_service._recover_driver()
+            
+            mock_driver.quit.assert_called_once()
+            mock_init.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_submit_application_driver_launch_failure(self, job_application_service):
+        """Test a browser that fails to start is recorded per attempt and ends in FAILED"""
+        job = Mock(id="job123")
+        job_application_service.retry_delay = 0
+        
+        with patch.object(job_application_service, 'initialize_driver',
+                          side_effect=WebDriverException("chrome not reachable")) as mock_init:
+            result = await job_application_service.submit_application(job, Mock(), Mock(), Mock())
+        
+        assert result.status == ApplicationStatus.FAILED
+        assert mock_init.call_count == job_application_service.retry_attempts
+        assert [record.status for record in result.metadata["attempts"]] == ["error"] * job_application_service.retry_attempts
+    
+    @pytest.mark.asyncio
+    async def test_submit_application_driver_restart_failure(self, job_application_service):
+        """Test a failed browser restart is recorded and the next attempt starts a new one"""
+        job = Mock(id="job123")
+        dead_driver = Mock()
+        type(dead_driver).title = PropertyMock(side_effect=WebDriverException("session deleted"))
+        job_application_service.driver = dead_driver
+        job_application_service.retry_delay = 0
+        
+        async def start_browser():
+            if mock_init.call_count == 1:
+                raise WebDriverException("chrome not reachable")
+            job_application_service.driver = Mock()
+        
+        with patch.object(job_application_service, '_submit_single_application') as mock_submit, \
+             patch.object(job_application_service, 'initialize_driver', side_effect=start_browser) as mock_init:
+            mock_submit.side_effect = [
+                WebDriverException("session deleted"),
+                ApplicationResult(job_id=job.id, status=ApplicationStatus.SUBMITTED)
+            ]
+            
+            result = await job_application_service.submit_application(job, Mock(), Mock(), Mock())
+        
+        assert result.status == ApplicationStatus.SUBMITTED
+        assert mock_init.call_count == 2
+        assert result.metadata["attempts"][1].error.startswith("Driver restart failed")
+    
     @pytest.mark.asyncio
     async def test_submit_application_rate_limited(
         self, 
@@ -266,16 +408,44 @@ class TestJobApplicationService:
     async def test_is_login_required(self, job_application_service):
         """Test login requirement detection"""
         mock_driver = Mock()
-        mock_driver.page_source = "Please log in to continue"
+        mock_driver.current_url = "https://example.com/careers"
+        mock_driver.execute_script.return_value = True
         job_application_service.driver = mock_driver
         
         result = await job_application_service._is_login_required()
         assert result is True
         
-        mock_driver.page_source = "Welcome to our job board"
+        # The check runs in the browser with the indicator pattern as its argument
+        script, pattern = mock_driver.execute_script.call_args[0]
+        assert "input[type='password']" in script
+        assert "log in" in pattern.split("|")
+        
+        mock_driver.execute_script.return_value = False
         result = await job_application_service._is_login_required()
         assert result is False
     
+    @pytest.mark.asyncio
+    async def test_wait_until(self, job_application_service):
+        """Test explicit waits report whether the condition held"""
+        job_application_service.driver = Mock()
+        
+        assert await job_application_service._wait_until(lambda driver: True, 1) is True
+        assert await job_application_service._wait_until(lambda driver: False, 0) is False
+    
+    @pytest.mark.asyncio
+    async def test_is_login_required_from_url(self, job_application_service):
+        """Test login and job URLs skip the in-browser check"""
+        mock_driver = Mock()
+        job_application_service.driver = mock_driver
+        
+        mock_driver.current_url = "https://www.linkedin.com/login?session_redirect=x"
+        assert await job_application_service._is_login_required() is True
+        
+        mock_driver.current_url = "https://www.linkedin.com/jobs/view/123"
+        assert await job_application_service._is_login_required() is False
+        
+        mock_driver.execute_script.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_perform_login_success(self, job_application_service, sample_credentials):
         """Test successful login"""
@@ -294,7 +464,7 @@ class TestJobApplicationService:
         job_application_service.wait = mock_wait
         
         with patch.object(job_application_service, '_is_login_required', side_effect=[True, False]), \
-             patch('asyncio.sleep'):
+             patch.object(job_application_service, '_wait_until', return_value=True):
             
             result = await job_application_service._perform_login(sample_credentials)
             
@@ -348,7 +518,7 @@ class TestJobApplicationService:
         # Mock timeout on primary selector, success on fallback
         from selenium.common.exceptions import TimeoutException
         mock_wait.until.side_effect = TimeoutException()
-        mock_driver.find_elements.return_value = [mock_button]
+        mock_driver.execute_script.return_value = mock_button
         
         job_application_service.driver = mock_driver
         job_application_service.wait = mock_wait
@@ -368,47 +538,78 @@ class TestJobApplicationService:
     ):
         """Test successful form filling"""
         mock_driver = Mock()
-        mock_field = Mock()
-        
-        mock_driver.find_element.return_value = mock_field
+        mock_driver.execute_script.return_value = ["first_name", "last_name", "email", "phone", "linkedin"]
         job_application_service.driver = mock_driver
         
         with patch.object(job_application_service, '_upload_resume', return_value=True), \
-             patch.object(job_application_service, '_fill_cover_letter', return_value=True), \
-             patch.object(job_application_service, '_fill_additional_fields'):
+             patch.object(job_application_service, '_fill_cover_letter', return_value=True):
             
             result = await job_application_service._fill_application_form(
                 sample_job, sample_resume, sample_cover_letter, sample_user_preferences
             )
             
             assert result is True
-            # Should have attempted to fill basic fields
-            assert mock_field.clear.call_count >= 1
-            assert mock_field.send_keys.call_count >= 1
+            # All text fields should be filled in a single script call
+            mock_driver.execute_script.assert_called_once()
+            fills = mock_driver.execute_script.call_args[0][1]
+            assert [fill["name"] for fill in fills] == ["first_name", "last_name", "email", "phone", "linkedin"]
+            assert fills[0]["value"] == "John"
+            mock_driver.find_element.assert_not_called()
+    
+    def test_additional_field_fills(self, job_application_service):
+        """Test additional field fills skip empty values"""
+        user_preferences = Mock(personal_info={
+            "first_name": "John",
+            "linkedin_url": "https://linkedin.com/in/johndoe",
+            "github_url": ""
+        })
+        
+        fills = job_application_service._additional_field_fills(user_preferences)
+        
+        assert len(fills) == 1
+        assert fills[0]["name"] == "linkedin"
+        assert fills[0]["value"] == "https://linkedin.com/in/johndoe"
+        assert fills[0]["selectors"][0] == "input[name='linkedin']"
     
     @pytest.mark.asyncio
-    async def test_upload_resume_success(self, job_application_service, sample_resume):
+    async def test_upload_resume_success(self, job_application_service, tmp_path):
         """Test successful resume upload"""
         mock_driver = Mock()
         mock_upload_field = Mock()
+        resume = Mock(id="resume123", file_content=b"fake pdf content")
         
         mock_driver.find_element.return_value = mock_upload_field
         job_application_service.driver = mock_driver
+        job_application_service._resume_dir = str(tmp_path)
         
-        with patch('tempfile.NamedTemporaryFile') as mock_temp, \
-             patch('pathlib.Path.unlink'), \
-             patch('asyncio.sleep'):
-            
-            # Mock temporary file
-            mock_file = Mock()
-            mock_file.name = "/tmp/test_resume.pdf"
-            mock_temp.return_value.__enter__.return_value = mock_file
-            
-            result = await job_application_service._upload_resume(sample_resume, "input[type='file']")
+        with patch.object(job_application_service, '_wait_until', return_value=True):
+            result = await job_application_service._upload_resume(resume, "input[type='file']")
             
             assert result is True
-            mock_upload_field.send_keys.assert_called_once_with("/tmp/test_resume.pdf")
-            mock_file.write.assert_called_once_with(sample_resume.file_content)
+            resume_path = tmp_path / "resume123.pdf"
+            mock_upload_field.send_keys.assert_called_once_with(str(resume_path))
+            assert resume_path.read_bytes() == b"fake pdf content"
+    
+    @pytest.mark.asyncio
+    async def test_upload_resume_reuses_file(self, job_application_service, tmp_path):
+        """Test the resume is written to disk once and cleaned up with the driver"""
+        mock_driver = Mock()
+        resume = Mock(id="resume123", file_content=b"fake pdf content")
+        job_application_service.driver = mock_driver
+        (tmp_path / "resumes").mkdir()
+        job_application_service._resume_dir = str(tmp_path / "resumes")
+        
+        with patch.object(job_application_service, '_wait_until', return_value=True), \
+             patch('pathlib.Path.write_bytes', autospec=True) as mock_write:
+            await job_application_service._upload_resume(resume, "input[type='file']")
+            await job_application_service._upload_resume(resume, "input[type='file']")
+            
+            assert mock_write.call_count == 1
+        
+        await job_application_service.cleanup_driver()
+        
+        assert not (tmp_path / "resumes").exists()
+        assert job_application_service._resume_path_cache == {}
     
     @pytest.mark.asyncio
     async def test_upload_resume_no_selector(self, job_application_service, sample_resume):
@@ -420,16 +621,16 @@ class TestJobApplicationService:
     async def test_fill_cover_letter_success(self, job_application_service, sample_cover_letter):
         """Test successful cover letter filling"""
         mock_driver = Mock()
-        mock_textarea = Mock()
-        
-        mock_driver.find_element.return_value = mock_textarea
+        mock_driver.execute_script.return_value = ["cover_letter"]
         job_application_service.driver = mock_driver
         
         result = await job_application_service._fill_cover_letter(sample_cover_letter, "textarea[name='coverLetter']")
         
         assert result is True
-        mock_textarea.clear.assert_called_once()
-        mock_textarea.send_keys.assert_called_once_with(sample_cover_letter.content.full_content)
+        mock_driver.execute_script.assert_called_once()
+        fills = mock_driver.execute_script.call_args[0][1]
+        assert fills[0]["value"] == sample_cover_letter.content.full_content
+        assert fills[0]["selectors"] == ["textarea[name='coverLetter']"]
     
     @pytest.mark.asyncio
     async def test_fill_cover_letter_no_selector(self, job_application_service, sample_cover_letter):
@@ -475,18 +676,27 @@ class TestJobApplicationService:
     async def test_extract_confirmation_id(self, job_application_service):
         """Test confirmation ID extraction"""
         mock_driver = Mock()
-        mock_driver.page_source = "Your application confirmation ID: CONF-12345"
+        mock_driver.execute_script.return_value = "CONF-12345"
         job_application_service.driver = mock_driver
         
         result = await job_application_service._extract_confirmation_id()
         
         assert result == "CONF-12345"
+        mock_driver.execute_script.assert_called_once_with(_CONFIRMATION_JS, _CONFIRMATION_PATTERN)
+    
+    def test_confirmation_pattern(self):
+        """Test the in-browser confirmation pattern on typical success pages"""
+        pattern = re.compile(_CONFIRMATION_PATTERN, re.IGNORECASE)
+        
+        assert pattern.search("Your application confirmation ID: CONF-12345").group(1) == "CONF-12345"
+        assert pattern.search("Reference #AB1234").group(1) == "AB1234"
+        assert pattern.search("Thank you for your application") is None
     
     @pytest.mark.asyncio
     async def test_extract_confirmation_id_not_found(self, job_application_service):
         """Test confirmation ID extraction when not found"""
         mock_driver = Mock()
-        mock_driver.page_source = "Thank you for your application"
+        mock_driver.execute_script.return_value = None
         job_application_service.driver = mock_driver
         
         result = await job_application_service._extract_confirmation_id()
@@ -512,8 +722,7 @@ class TestJobApplicationService:
             }
         ]
         
-        with patch.object(job_application_service, 'initialize_driver'), \
-             patch.object(job_application_service, 'cleanup_driver'), \
+        with patch.object(job_application_service, '_create_driver', return_value=(Mock(), Mock())), \
              patch.object(job_application_service, 'submit_application') as mock_submit, \
              patch('asyncio.sleep'):
             
@@ -528,6 +737,172 @@ class TestJobApplicationService:
             assert results[0].status == ApplicationStatus.SUBMITTED
             mock_submit.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_warm_pool_acquire_release(self, job_application_service):
+        """Test warmed drivers can be borrowed and returned"""
+        drivers = [Mock(), Mock()]
+        
+        with patch.object(job_application_service, '_create_driver', side_effect=[(d, Mock()) for d in drivers]):
+            await job_application_service.warm_pool(2)
+        
+        driver = await job_application_service.acquire_driver()
+        assert driver in drivers
+        assert job_application_service._driver_pool.qsize() == 1
+        
+        job_application_service.release_driver(driver)
+        assert job_application_service._driver_pool.qsize() == 2
+        
+        await job_application_service.cleanup_driver_pool()
+        for d in drivers:
+            d.quit.assert_called_once()
+        assert job_application_service._driver_pool is None
+    
+    @pytest.mark.asyncio
+    async def test_warm_pool_cancelled_quits_launching_drivers(self, job_application_service):
+        """Test cancelling warm-up still quits browsers whose launch was in flight"""
+        driver = Mock()
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_create_driver():
+            started.set()
+            release.wait(5)
+            return driver, Mock()
+        
+        with patch.object(job_application_service, '_create_driver', side_effect=slow_create_driver):
+            warmup = asyncio.create_task(job_application_service.warm_pool(1))
+            await asyncio.to_thread(started.wait, 5)
+            warmup.cancel()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await warmup
+        
+        driver.quit.assert_called_once()
+        assert job_application_service._pool_drivers == []
+    
+    @pytest.mark.asyncio
+    async def test_pooled_submission_failed_relaunch_keeps_slot(self, job_application_service):
+        """Test a pooled browser that dies and cannot be relaunched still returns its slot"""
+        dead_driver = Mock()
+        type(dead_driver).title = PropertyMock(side_effect=WebDriverException("session deleted"))
+        job = Mock(id="job123")
+        job_application_service.retry_delay = 0
+        
+        with patch.object(job_application_service, '_create_driver', return_value=(dead_driver, Mock())):
+            await job_application_service.warm_pool(1)
+        
+        with patch.object(job_application_service, '_submit_single_application',
+                          side_effect=WebDriverException("session deleted")), \
+             patch.object(job_application_service, 'initialize_driver',
+                          side_effect=WebDriverException("chrome not reachable")):
+            result = await job_application_service.submit_application(job, Mock(), Mock(), Mock())
+        
+        assert result.status == ApplicationStatus.FAILED
+        dead_driver.quit.assert_called_once()
+        assert job_application_service._pool_drivers == []
+        assert job_application_service._driver_pool.qsize() == 1
+        
+        # The next borrower launches a browser into the empty slot
+        new_driver = Mock()
+        
+        async def start_browser(worker):
+            worker.driver = new_driver
+        
+        with patch.object(JobApplicationService, 'initialize_driver', autospec=True, side_effect=start_browser), \
+             patch.object(JobApplicationService, '_submit_single_application', autospec=True) as mock_submit:
+            mock_submit.return_value = ApplicationResult(job_id=job.id, status=ApplicationStatus.SUBMITTED)
+            
+            result = await job_application_service.submit_application(job, Mock(), Mock(), Mock())
+        
+        assert result.status == ApplicationStatus.SUBMITTED
+        assert job_application_service._pool_drivers == [new_driver]
+        assert await job_application_service.acquire_driver() is new_driver
+        
+        await job_application_service.cleanup_driver_pool()
+    
+    @pytest.mark.asyncio
+    async def test_overlapping_batches_keep_their_own_browsers(self, job_application_service):
+        """Test a batch finishing first does not quit browsers another batch is using"""
+        drivers = [Mock(), Mock()]
+        
+        async def submit(worker, job, *args):
+            await asyncio.sleep(job.delay)
+            assert not worker.driver.quit.called
+            return ApplicationResult(job_id=job.id, status=ApplicationStatus.SUBMITTED)
+        
+        def batch(job_id, delay):
+            job = Mock(id=job_id, site=JobSite.LINKEDIN, delay=delay)
+            return [{"job": job, "resume": Mock(), "cover_letter": Mock(), "user_preferences": Mock()}]
+        
+        with patch.object(job_application_service, '_create_driver', side_effect=[(d, Mock()) for d in drivers]), \
+             patch.object(JobApplicationService, 'submit_application', autospec=True, side_effect=submit):
+            first, second = await asyncio.gather(
+                job_application_service.batch_submit_applications(batch("job1", 0)),
+                job_application_service.batch_submit_applications(batch("job2", 0.05))
+            )
+        
+        assert first[0].status == ApplicationStatus.SUBMITTED
+        assert second[0].status == ApplicationStatus.SUBMITTED
+        for d in drivers:
+            d.quit.assert_called_once()
+        assert job_application_service._driver_pool is None
+    
+    @pytest.mark.asyncio
+    async def test_submit_application_uses_warm_pool(self, job_application_service):
+        """Test standalone submissions borrow a warmed driver instead of launching one"""
+        pooled_driver = Mock()
+        job = Mock(id="job123")
+        
+        with patch.object(job_application_service, '_create_driver', return_value=(pooled_driver, Mock())):
+            await job_application_service.warm_pool(1)
+        
+        with patch.object(job_application_service, 'initialize_driver') as mock_init, \
+             patch.object(JobApplicationService, '_submit_single_application', autospec=True) as mock_submit:
+            
+            mock_submit.return_value = ApplicationResult(job_id=job.id, status=ApplicationStatus.SUBMITTED)
+            
+            result = await job_application_service.submit_application(job, Mock(), Mock(), Mock())
+            
+            assert result.status == ApplicationStatus.SUBMITTED
+            mock_init.assert_not_called()
+            worker = mock_submit.call_args[0][0]
+            assert worker.driver is pooled_driver
+            assert job_application_service.driver is None
+            pooled_driver.delete_all_cookies.assert_called_once()
+            assert job_application_service._driver_pool.qsize() == 1
+        
+        await job_application_service.cleanup_driver_pool()
+    
+    @pytest.mark.asyncio
+    async def test_batch_submit_applications_runs_sites_concurrently(self, job_application_service):
+        """Test different sites share the batch pool concurrently and each site gets one browser"""
+        running = 0
+        peak = 0
+        
+        async def submit(worker, job, *args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return ApplicationResult(job_id=job.id, status=ApplicationStatus.SUBMITTED)
+        
+        sites = [JobSite.LINKEDIN, JobSite.LINKEDIN, JobSite.INDEED]
+        applications = [
+            {"job": Mock(id=f"job{i}", site=site), "resume": Mock(), "cover_letter": Mock(), "user_preferences": Mock()}
+            for i, site in enumerate(sites)
+        ]
+        
+        with patch.object(job_application_service, '_create_driver', side_effect=lambda: (Mock(), Mock())) as mock_create, \
+             patch.object(JobApplicationService, 'submit_application', autospec=True, side_effect=submit), \
+             patch('app.services.job_application_service.SITE_APPLICATION_INTERVAL', 0):
+            results = await job_application_service.batch_submit_applications(applications)
+        
+        assert [r.job_id for r in results] == ["job0", "job1", "job2"]
+        assert all(r.status == ApplicationStatus.SUBMITTED for r in results)
+        assert mock_create.call_count == 2
+        assert peak == 2
+    
     @pytest.mark.asyncio
     async def test_get_application_status(self, job_application_service):
         """Test application status checking"""
@@ -544,15 +919,40 @@ class TestJobApplicationService:
             assert "last_checked" in result
             assert result["url"] == "https://example.com/application/123"
     
+    @pytest.mark.asyncio
+    async def test_get_application_status_priority(self, job_application_service):
+        """Test overlapping keywords resolve to the highest priority status"""
+        mock_driver = Mock()
+        mock_driver.page_source = "You were interviewed and not selected"
+        job_application_service.driver = mock_driver
+        
+        result = await job_application_service.get_application_status("https://example.com/application/123")
+        
+        # "interviewed" contains "viewed", which outranks "rejected" and "interview"
+        assert result["status"] == "viewed"
+    
     @pytest.mark.asyncio
     async def test_get_application_status_error(self, job_application_service):
         """Test application status checking with error"""
-        with patch.object(job_application_service, 'initialize_driver', side_effect=Exception("Driver error")):
+        with patch.object(job_application_service, '_create_driver', side_effect=Exception("Driver error")):
             
             result = await job_application_service.get_application_status("https://example.com/application/123")
             
             assert result["status"] == "error"
             assert "Driver error" in result["error"]
+    
+    @pytest.mark.asyncio
+    async def test_get_application_status_uses_own_browser(self, job_application_service):
+        """Test status checks quit their browser instead of leaving it on the service"""
+        status_driver = Mock()
+        status_driver.page_source = "Your application has been submitted"
+        
+        with patch.object(job_application_service, '_create_driver', return_value=(status_driver, Mock())):
+            result = await job_application_service.get_application_status("https://example.com/application/123")
+        
+        assert result["status"] == "submitted"
+        assert job_application_service.driver is None
+        status_driver.quit.assert_called_once()
 
 
 class TestApplicationResult:
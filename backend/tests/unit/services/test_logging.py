@@ -3,13 +3,14 @@ Tests for the logging and monitoring system.
 """
 import asyncio
 import json
+import logging
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, AsyncMock
 
 from app.core.logging import (
     StructuredLogger, LogEntry, LogLevel, ActivityType, 
-    get_logger, JsonFormatter
+    get_logger, JsonFormatter, stop_queue_logging
 )
 from app.services.log_storage_service import (
     LogStorageService, LogSearchCriteria, log_storage_service
@@ -100,6 +101,20 @@ class TestStructuredLogger:
             )
             
             assert log_id is not None
+    
+    def test_logging_after_stop_queue_logging(self):
+        """Test records logged after the listener stops are written directly."""
+        logger = StructuredLogger("test_after_stop")
+        queue_handler = logger.logger.handlers[0]
+        stop_queue_logging()
+        
+        handler = Mock(level=logging.INFO)
+        with patch.object(queue_handler, "direct_handlers", [handler]):
+            logger.logger.info("after shutdown")
+            logger.logger.debug("below handler level")
+        
+        handler.handle.assert_called_once()
+        assert handler.handle.call_args[0][0].getMessage() == "after shutdown"
 
 
 class TestJsonFormatter:
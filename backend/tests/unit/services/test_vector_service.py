@@ -85,6 +85,49 @@ class TestVectorService:
         assert len(embeddings) == 2
         assert all(len(emb) == 768 for emb in embeddings)
     
+    @pytest.mark.asyncio
+    async def test_generate_embedding_uses_content_hash_cache(self, vector_service_instance, mock_embeddings):
+        """Test unchanged text is embedded only once"""
+        text = "Unchanged resume content"
+        first = await vector_service_instance.generate_embedding(text)
+        second = await vector_service_instance.generate_embedding(text)
+        
+        assert first == second
+        mock_embeddings.embed_query.assert_called_once_with(text)
+    
+    @pytest.mark.asyncio
+    async def test_generate_embedding_reuses_near_duplicate(self, vector_service_instance, mock_embeddings):
+        """Test a lightly edited resume reuses the cached embedding"""
+        text = "Software engineer with Python, FastAPI and PostgreSQL experience"
+        edited = "Software  engineer with python, FastAPI and PostgreSQL experience\n"
+        
+        first = await vector_service_instance.generate_embedding(text, near_duplicates=True)
+        second = await vector_service_instance.generate_embedding(edited, near_duplicates=True)
+        
+        assert first == second
+        mock_embeddings.embed_query.assert_called_once_with(text)
+    
+    @pytest.mark.asyncio
+    async def test_generate_embedding_near_duplicates_opt_in(self, vector_service_instance, mock_embeddings):
+        """Test near-duplicate reuse only applies when requested"""
+        await vector_service_instance.generate_embedding("Senior Python Developer", near_duplicates=True)
+        await vector_service_instance.generate_embedding("senior python developer")
+        
+        assert mock_embeddings.embed_query.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_preserves_order(self, vector_service_instance, mock_embeddings):
+        """Test length-sorted batching returns embeddings in input order"""
+        mock_embeddings.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        texts = ["a much longer resume text", "short", "medium text"]
+        
+        embeddings = await vector_service_instance.generate_embeddings_batch(texts)
+        
+        assert embeddings == [[float(len(t))] for t in texts]
+        mock_embeddings.embed_documents.assert_called_once_with(
+            ["short", "medium text", "a much longer resume text"]
+        )
+    
     @pytest.mark.asyncio
     async def test_store_resume_embedding(self, vector_service_instance, mock_pinecone):
         """Test storing resume embedding"""
@@ -130,6 +173,23 @@ class TestVectorService:
         assert "vectors" in call_args
         assert call_args["namespace"] == "jobs"
     
+    @pytest.mark.asyncio
+    async def test_store_job_embedding_cleans_metadata(self, vector_service_instance, mock_pinecone):
+        """Test metadata is reduced to types the index accepts"""
+        mock_pc, mock_index = mock_pinecone
+        mock_index.upsert = Mock()
+        site = Mock(value="indeed")
+        
+        await vector_service_instance.store_job_embedding_with_vector(
+            "789", [0.1] * 768, {"title": "Dev", "currency": None, "site": site, "salary_min": 80000}
+        )
+        
+        _, _, metadata = mock_index.upsert.call_args[1]["vectors"][0]
+        assert "currency" not in metadata
+        assert metadata["site"] == "indeed"
+        assert metadata["salary_min"] == 80000
+        assert metadata["job_id"] == "789"
+    
     @pytest.mark.asyncio
     async def test_find_similar_jobs(self, vector_service_instance, mock_pinecone):
         """Test finding similar jobs"""
@@ -185,6 +245,67 @@ class TestVectorService:
         
         assert len(similar_jobs) == 0  # Filtered out by threshold
     
+    @pytest.mark.asyncio
+    async def test_find_similar_jobs_caches_resume_vector(self, vector_service_instance, mock_pinecone):
+        """Test repeat searches for the same resume fetch its vector once"""
+        mock_pc, mock_index = mock_pinecone
+        
+        mock_fetch_response = Mock()
+        mock_fetch_response.vectors = {
+            "resume_123": Mock(values=[0.1] * 768)
+        }
+        mock_index.fetch.return_value = mock_fetch_response
+        mock_index.query.return_value = Mock(matches=[])
+        
+        await vector_service_instance.find_similar_jobs("123")
+        await vector_service_instance.find_similar_jobs("123")
+        
+        mock_index.fetch.assert_called_once()
+        assert mock_index.query.call_count == 2
+        stats = vector_service_instance.cache_stats()
+        assert stats["resume_vectors"]["hits"] == 1
+        assert stats["resume_vectors"]["misses"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_rank_jobs_for_resume(self, vector_service_instance, mock_pinecone):
+        """Test local ranking of a candidate job set"""
+        mock_pc, mock_index = mock_pinecone
+        
+        mock_resume_response = Mock()
+        mock_resume_response.vectors = {"resume_123": Mock(values=[1.0, 0.0])}
+        mock_job_response = Mock()
+        mock_job_response.vectors = {
+            "job_a": Mock(values=[0.0, 1.0]),
+            "job_b": Mock(values=[1.0, 0.0]),
+            "job_c": Mock(values=[1.0, 1.0])
+        }
+        mock_index.fetch.side_effect = lambda ids, namespace: (
+            mock_resume_response if namespace == "resumes" else mock_job_response
+        )
+        
+        ranked = await vector_service_instance.rank_jobs_for_resume(
+            "123", ["a", "b", "c", "missing"], top_k=2, score_threshold=0.5
+        )
+        
+        assert [job["job_id"] for job in ranked] == ["b", "c"]
+        assert ranked[0]["score"] == pytest.approx(1.0)
+        assert ranked[1]["score"] == pytest.approx(0.7071, abs=1e-4)
+        mock_index.query.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_job_vector_cache_quantizes_to_int8(self, vector_service_instance, mock_pinecone):
+        """Test cached job vectors round-trip through int8 quantization"""
+        mock_pc, mock_index = mock_pinecone
+        mock_index.upsert = Mock()
+        vector_service_instance._job_vector_cache.quantize = True
+        embedding = [0.5, -0.25, 0.125, 0.0]
+        
+        await vector_service_instance.store_job_embedding_with_vector("456", embedding, {})
+        cached = await vector_service_instance.get_job_vector("456")
+        
+        assert cached == pytest.approx(embedding, abs=0.5 / 127)
+        mock_index.fetch.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_find_similar_resumes(self, vector_service_instance, mock_pinecone):
         """Test finding similar resumes"""